@@ -0,0 +1,84 @@
+"""Bulk `get_assistant` fan-out versus a sequential loop.
+
+Serves the stand-in Hub (tests/hub.py) on a loopback port with a fixed
+server-side latency and fetches N assistants one by one, then with
+`get_assistants_bulk` (threads, urllib3 pool) and
+`get_assistants_bulk_async` (asyncio, aiohttp) at several concurrency
+limits::
+
+    python benchmarks/bench_bulk.py --items 200 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import openapi_client  # noqa: E402
+from openapi_client.bulk import get_assistants_bulk, get_assistants_bulk_async  # noqa: E402
+from tests.hub import HubApp, serve_hub  # noqa: E402
+
+
+def _configuration(host, pool_size):
+    configuration = openapi_client.Configuration(host=host, access_token="token")
+    configuration.connection_pool_maxsize = pool_size
+    return configuration
+
+
+def sequential(host, items):
+    with openapi_client.ApiClient(_configuration(host, 1)) as api_client:
+        api = openapi_client.DefaultApi(api_client)
+        started = time.perf_counter()
+        for owner_slug, package_slug in items:
+            api.get_assistant(owner_slug, package_slug)
+        return time.perf_counter() - started
+
+
+def threaded(host, items, concurrency):
+    with openapi_client.ApiClient(_configuration(host, concurrency)) as api_client:
+        api = openapi_client.DefaultApi(api_client)
+        started = time.perf_counter()
+        results = get_assistants_bulk(api, items, max_concurrency=concurrency)
+        elapsed = time.perf_counter() - started
+    return elapsed, sum(not r.ok for r in results)
+
+
+def asynchronous(host, items, concurrency):
+    async def main():
+        configuration = _configuration(host, concurrency)
+        async with openapi_client.AsyncApiClient(configuration) as api_client:
+            api = openapi_client.AsyncDefaultApi(api_client)
+            started = time.perf_counter()
+            results = await get_assistants_bulk_async(api, items, max_concurrency=concurrency)
+            return time.perf_counter() - started, sum(not r.ok for r in results)
+
+    return asyncio.run(main())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--concurrency", default="4,16,64")
+    parser.add_argument("--latency", type=float, default=0.02,
+                        help="server-side delay per request, in seconds")
+    args = parser.parse_args()
+
+    app = HubApp(assistants=args.items, latency=args.latency)
+    items = [(a["ownerSlug"], a["packageSlug"]) for a in app.assistants]
+    levels = [int(c) for c in args.concurrency.split(",")]
+    print("%-10s %11s %9s %10s %7s" % ("mode", "concurrency", "seconds", "items/s", "errors"))
+    with serve_hub(app) as host:
+        elapsed = sequential(host, items)
+        print("%-10s %11d %9.2f %10.0f %7d" % ("sequential", 1, elapsed, len(items) / elapsed, 0))
+        for name, run in (("threads", threaded), ("asyncio", asynchronous)):
+            for concurrency in levels:
+                elapsed, errors = run(host, items, concurrency)
+                print("%-10s %11d %9.2f %10.0f %7d" % (
+                    name, concurrency, elapsed, len(items) / elapsed, errors))
+
+
+if __name__ == "__main__":
+    main()
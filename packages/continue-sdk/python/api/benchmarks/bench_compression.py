@@ -0,0 +1,76 @@
+"""Compression: `list_assistants` with and without compressed responses.
+
+Serves `--sizes` assistants from the stand-in Hub (tests/hub.py) over
+loopback HTTP, compressed with each content coding the client accepts or
+sent as is, and reports the bytes received and decoded (from
+`TransferMetrics`), the time of the call, the time the bytes received
+would take at `--mbps`, and the peak memory (tracemalloc, separate run)::
+
+    python benchmarks/bench_compression.py --sizes 1000,5000 --mbps 50
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from openapi_client import ApiClient, Configuration, DefaultApi  # noqa: E402
+from openapi_client.compression import ACCEPT_ENCODING, TransferMetrics  # noqa: E402
+from tests.hub import HubApp, serve_hub  # noqa: E402
+
+
+def timed(api, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        api.list_assistants()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def peak(api):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        api.list_assistants()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,5000")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--mbps", type=float, default=50.0,
+                        help="link speed for the wire estimate")
+    args = parser.parse_args()
+
+    codings = ["identity"] + [c.strip() for c in ACCEPT_ENCODING.split(",")]
+    print("%7s %9s %12s %12s %7s %9s %9s %9s" % (
+        "size", "coding", "received", "decoded", "ratio", "call ms", "wire ms", "peak MiB"))
+    for size in [int(s) for s in args.sizes.split(",")]:
+        for coding in codings:
+            app = HubApp(assistants=size, compress=() if coding == "identity" else (coding,))
+            with serve_hub(app) as host:
+                configuration = Configuration(host=host, access_token="token")
+                configuration.compression = coding != "identity"
+                api = DefaultApi(ApiClient(configuration))
+                seconds = timed(api, args.repeat)
+                used = peak(api)
+                metrics = configuration.transfer_metrics = TransferMetrics()
+                api.list_assistants()
+            counters = metrics.snapshot()["list_assistants"]
+            received = counters["received_bytes"]
+            print("%7d %9s %12d %12d %7.1f %9.1f %9.1f %9.1f" % (
+                size, coding, received, counters["decoded_bytes"], counters["ratio"],
+                seconds * 1000, received * 8 / (args.mbps * 1e6) * 1000, used / 2 ** 20))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Response deserialization: compiled plans versus element-by-element `from_dict`.
+
+Builds `list_assistants` payloads of the stand-in Hub (tests/hub.py) and
+times `ApiClient.deserialize`, which validates the JSON in one call through
+the memoized plan of its type string, against the previous path:
+`json.loads` followed by `from_dict` on every element. The last column is
+`Configuration.trusted_responses`, which builds the models without
+validating them; `--config-size` grows each assistant's `config`::
+
+    python benchmarks/bench_deserialize.py --sizes 1000,5000,10000 --config-size 64
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import openapi_client  # noqa: E402
+import openapi_client.models  # noqa: E402
+from tests.hub import make_assistant  # noqa: E402
+
+RESPONSE_TYPE = "List[ListAssistants200ResponseInner]"
+
+
+def previous(text):
+    data = json.loads(text)
+    klass = getattr(openapi_client.models, "ListAssistants200ResponseInner")
+    return [klass.from_dict(item) for item in data]
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,5000,10000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--config-size", type=int, default=4,
+                        help="models in each assistant's config")
+    args = parser.parse_args()
+
+    api_client = openapi_client.ApiClient()
+    configuration = openapi_client.Configuration()
+    configuration.trusted_responses = True
+    configuration.trusted_responses_validate_one_in = 0
+    trusted_client = openapi_client.ApiClient(configuration)
+    print("%9s %9s %12s %9s %8s %10s %8s" % (
+        "assistants", "MiB", "from_dict ms", "plan ms", "speedup", "trusted ms", "speedup"))
+    for size in [int(s) for s in args.sizes.split(",")]:
+        text = json.dumps([make_assistant(i, args.config_size) for i in range(size)])
+        compiled = api_client.deserialize(text, RESPONSE_TYPE, "application/json")
+        assert compiled == previous(text)
+        assert trusted_client.deserialize(text, RESPONSE_TYPE, "application/json") == compiled
+        before = best_of(lambda: previous(text), args.repeat)
+        after = best_of(
+            lambda: api_client.deserialize(text, RESPONSE_TYPE, "application/json"),
+            args.repeat,
+        )
+        trusted = best_of(
+            lambda: trusted_client.deserialize(text, RESPONSE_TYPE, "application/json"),
+            args.repeat,
+        )
+        print("%9d %9.1f %12.1f %9.1f %7.1fx %10.1f %7.1fx" % (
+            size, len(text) / 2 ** 20, before * 1000, after * 1000, before / after,
+            trusted * 1000, before / trusted))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Downloads: `download` versus reading the whole body, on large files.
+
+Serves a file generated as it is read, through an in-process transport, and
+reports the time and peak memory (tracemalloc, separate run) of
+`download.download` and of reading the response before writing it, as
+`ApiClient.__deserialize_file` did::
+
+    python benchmarks/bench_download.py --sizes 16,64,256 --buffer-size 1048576
+"""
+
+import argparse
+import gc
+import hashlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from openapi_client import ApiClient, Configuration  # noqa: E402
+from openapi_client.download import download  # noqa: E402
+from openapi_client.rest import build_response  # noqa: E402
+from openapi_client.transport import Transport  # noqa: E402
+
+
+class Pattern(io.RawIOBase):
+    """`size` bytes generated as they are read."""
+
+    def __init__(self, size) -> None:
+        self.left = size
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        n = min(len(b), self.left)
+        b[:n] = b"\xab" * n
+        self.left -= n
+        return n
+
+
+class PatternTransport(Transport):
+
+    def __init__(self, size) -> None:
+        self.size = size
+
+    def request(self, method, url, headers=None, body=None, post_params=None,
+                _request_timeout=None):
+        return build_response(
+            200, [("Content-Length", str(self.size))], io.BufferedReader(Pattern(self.size))
+        )
+
+
+def buffered(api_client, path):
+    """Reads the body, then writes and hashes it."""
+    method, url, headers, _, _ = api_client.param_serialize("GET", "/file")
+    data = api_client.call_api(method, url, headers).read()
+    with open(path, "wb") as f:
+        f.write(data)
+    hashlib.sha256(data).hexdigest()
+
+
+def streamed(api_client, path):
+    download(api_client, "/file", path=path)
+
+
+def timed(fn, api_client, path, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        fn(api_client, path)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def peak(fn, api_client, path):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn(api_client, path)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="16,64,256", help="file sizes in MiB")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--buffer-size", type=int, default=1 << 20)
+    args = parser.parse_args()
+
+    print("%6s %10s %9s %9s" % ("MiB", "call", "ms", "peak MiB"))
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "file")
+        for size in [int(s) for s in args.sizes.split(",")]:
+            configuration = Configuration(host="http://hub.test", access_token="token")
+            configuration.transport = PatternTransport(size * 2 ** 20)
+            configuration.download_buffer_size = args.buffer_size
+            api_client = ApiClient(configuration)
+            for label, fn in (("read", buffered), ("download", streamed)):
+                elapsed = timed(fn, api_client, path, args.repeat)
+                used = peak(fn, api_client, path)
+                print("%6d %10s %9.1f %9.1f" % (size, label, elapsed * 1000, used / 2 ** 20))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Latency of the HTTP/2 transport versus the urllib3 pool under load.
+
+Serves the stand-in Hub (tests/hub.py) over cleartext HTTP/1.1 + h2c with
+hypercorn and drives `DefaultApi.get_policy` from 1..512 concurrent threads,
+reporting p50/p99 latency, throughput and failed calls for each
+transport::
+
+    pip install hypercorn
+    python benchmarks/bench_http2.py --concurrency 1,8,64,512 --requests 2048
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import openapi_client  # noqa: E402
+from tests.hub import HubApp, as_asgi  # noqa: E402
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class _HypercornServer:
+
+    def __init__(self, app):
+        from hypercorn.asyncio import serve
+        from hypercorn.config import Config
+
+        self.port = _free_port()
+        config = Config()
+        config.bind = ["127.0.0.1:%d" % self.port]
+        config.accesslog = None
+        config.errorlog = None
+        config.h2_max_concurrent_streams = 1000
+        config.keep_alive_max_requests = 10 ** 9
+        config.backlog = 1024
+        self._loop = asyncio.new_event_loop()
+        self._stop = asyncio.Event()
+        self._serve = serve(as_asgi(app), config, shutdown_trigger=self._wait_for_stop)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    async def _wait_for_stop(self):
+        await self._stop.wait()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._serve)
+
+    def __enter__(self):
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            try:
+                socket.create_connection(("127.0.0.1", self.port), timeout=0.1).close()
+                break
+            except OSError:
+                time.sleep(0.05)
+        return "http://127.0.0.1:%d" % self.port
+
+    def __exit__(self, *exc_info):
+        self._loop.call_soon_threadsafe(self._stop.set)
+        self._thread.join(5)
+
+
+def _percentile(samples, q):
+    return statistics.quantiles(samples, n=100, method="inclusive")[q - 1]
+
+
+def run(api, concurrency, requests):
+    per_thread = max(requests // concurrency, 1)
+
+    def worker(_):
+        latencies = []
+        errors = 0
+        for _ in range(per_thread):
+            start = time.perf_counter()
+            try:
+                api.get_policy()
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+        return latencies, errors
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        results = list(pool.map(worker, range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies = [x for chunk, _ in results for x in chunk]
+    return (
+        _percentile(latencies, 50) * 1000,
+        _percentile(latencies, 99) * 1000,
+        len(latencies) / elapsed,
+        sum(errors for _, errors in results),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", default="1,2,8,32,128,512")
+    parser.add_argument("--requests", type=int, default=2048)
+    parser.add_argument("--latency", type=float, default=0.002,
+                        help="server-side delay per request, in seconds")
+    args = parser.parse_args()
+
+    try:
+        import hypercorn  # noqa: F401
+    except ImportError:
+        sys.exit("This benchmark needs hypercorn: pip install hypercorn")
+
+    levels = [int(c) for c in args.concurrency.split(",")]
+    print("%-8s %11s %9s %9s %10s %7s" % (
+        "transport", "concurrency", "p50 ms", "p99 ms", "req/s", "errors"))
+    with _HypercornServer(HubApp(latency=args.latency)) as host:
+        for name in ("urllib3", "http2"):
+            configuration = openapi_client.Configuration(host=host, access_token="token")
+            configuration.transport = name
+            configuration.http2_prior_knowledge = True
+            api_client = openapi_client.ApiClient(configuration)
+            api = openapi_client.DefaultApi(api_client)
+            api.get_policy()  # warm up the connection
+            for concurrency in levels:
+                p50, p99, rate, errors = run(api, concurrency, args.requests)
+                print("%-8s %11d %9.2f %9.2f %10.0f %7d" % (
+                    name, concurrency, p50, p99, rate, errors))
+            metrics = getattr(api_client.rest_client, "metrics", None)
+            if metrics is not None:
+                print("http2 metrics: %s" % metrics.snapshot())
+            api_client.close()
+
+
+if __name__ == "__main__":
+    main()
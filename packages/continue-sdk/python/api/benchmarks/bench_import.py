@@ -0,0 +1,65 @@
+"""Import time: what starting a process that uses the SDK costs.
+
+Runs each statement in `--repeat` fresh interpreters and reports the median
+time it took and the modules it imported. Exits with status 1 when a
+median exceeds its budget times `--scale`, so that CI can catch an eager
+import creeping back in::
+
+    python benchmarks/bench_import.py --repeat 15 --scale 2
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+# (statement, budget in ms on a developer laptop)
+STATEMENTS = [
+    ("import openapi_client", 20),
+    ("from openapi_client import ApiClient, Configuration", 400),
+    ("from openapi_client import ApiClient, Configuration, DefaultApi", 450),
+    ("from openapi_client import AsyncApiClient, AsyncDefaultApi", 700),
+]
+
+PROBE = """
+import sys, time
+started = time.perf_counter()
+%s
+print(time.perf_counter() - started, len(sys.modules))
+"""
+
+
+def measure(statement, repeat):
+    """``(median seconds, modules imported)`` of `statement`."""
+    times = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", PROBE % statement], cwd=ROOT)
+        seconds, modules = output.split()
+        times.append(float(seconds))
+    return statistics.median(times), int(modules)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=9)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplies every budget")
+    args = parser.parse_args()
+
+    baseline = measure("pass", args.repeat)[1]
+    failed = False
+    print("%9s %9s %8s  %s" % ("median ms", "budget ms", "modules", "statement"))
+    for statement, budget in STATEMENTS:
+        seconds, modules = measure(statement, args.repeat)
+        over = seconds * 1000 > budget * args.scale
+        failed = failed or over
+        print("%9.1f %9.0f %8d  %s%s" % (
+            seconds * 1000, budget * args.scale, modules - baseline, statement,
+            "  OVER BUDGET" if over else ""))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
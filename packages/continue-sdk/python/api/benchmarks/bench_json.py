@@ -0,0 +1,83 @@
+"""JSON codecs on Hub payload shapes.
+
+Times `loads` and `dumpb` of every installed `json_codec` codec on the
+payloads of the stand-in Hub (tests/hub.py): a single assistant, assistant
+lists, an organization list and a `sync_secrets` request body::
+
+    pip install orjson msgspec
+    python benchmarks/bench_json.py
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from openapi_client import json_codec  # noqa: E402
+from tests.hub import make_assistant  # noqa: E402
+
+
+def payloads(sizes):
+    shapes = [("get_assistant", make_assistant(0, config_size=16))]
+    for size in sizes:
+        shapes.append(("list_assistants x%d" % size, [make_assistant(i) for i in range(size)]))
+    shapes.append(("list_organizations", {"organizations": [
+        {"id": "org-%d" % i, "name": "Org %d" % i, "iconUrl": None, "slug": "org-%d" % i}
+        for i in range(50)
+    ]}))
+    shapes.append(("sync_secrets body", {"fqsns": [
+        {"ownerSlug": "acme", "packageSlug": "assistant", "secretName": "KEY_%d" % i}
+        for i in range(200)
+    ], "orgScopeId": None, "orgScopeSlug": "acme"}))
+    return shapes
+
+
+def per_call(fn, budget=0.2, repeat=5):
+    """Best time per call, in microseconds."""
+    fn()
+    calls = 1
+    started = time.perf_counter()
+    while time.perf_counter() - started < budget / repeat:
+        fn()
+        calls += 1
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, (time.perf_counter() - started) / calls)
+    return best * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,5000",
+                        help="assistant list lengths")
+    args = parser.parse_args()
+
+    codecs = []
+    for name in json_codec.CODECS:
+        try:
+            codecs.append(json_codec.get_codec(name))
+        except ImportError:
+            print("%s is not installed" % name)
+    print("default codec: %s\n" % json_codec.default_codec().name)
+
+    print("%-24s %-8s %9s %12s %12s" % ("payload", "codec", "KiB", "loads us", "dumpb us"))
+    for label, value in payloads([int(s) for s in args.sizes.split(",")]):
+        encoded = json.dumps(value).encode("utf-8")
+        for codec in codecs:
+            assert codec.loads(encoded) == value
+            loads = per_call(lambda: codec.loads(encoded))
+            dumpb = per_call(lambda: codec.dumpb(value))
+            print("%-24s %-8s %9.1f %12.1f %12.1f" % (
+                label, codec.name, len(encoded) / 1024, loads, dumpb))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Lazy models: time and peak memory of eager versus lazy deserialization.
+
+Builds `list_assistants` bodies of the stand-in Hub (tests/hub.py) and times
+`ApiClient.deserialize` with and without `Configuration.lazy_models`, until
+the first `package_slug` can be read and after reading every `config` and
+`raw_yaml`. Peak memory is measured with tracemalloc on a separate run::
+
+    pip install msgspec
+    python benchmarks/bench_lazy.py --sizes 1000,5000 --config-size 64
+"""
+
+import argparse
+import functools
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import openapi_client  # noqa: E402
+from tests.hub import make_assistant  # noqa: E402
+
+RESPONSE_TYPE = "List[ListAssistants200ResponseInner]"
+
+
+def read_all(assistants):
+    for assistant in assistants:
+        assistant.config_result.config
+        assistant.raw_yaml
+
+
+def timed(fn, repeat):
+    """Best ``(seconds to first item, seconds after reading every field)``."""
+    first = total = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        assistants = fn()
+        assistants[0].package_slug
+        first = min(first, time.perf_counter() - started)
+        read_all(assistants)
+        total = min(total, time.perf_counter() - started)
+    return first, total
+
+
+def peak(fn):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = fn()
+        return tracemalloc.get_traced_memory()[1], result
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,5000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--config-size", type=int, default=64,
+                        help="models in each assistant's config")
+    args = parser.parse_args()
+
+    configuration = openapi_client.Configuration()
+    configuration.lazy_models = True
+    clients = [
+        ("eager", openapi_client.ApiClient()),
+        ("lazy", openapi_client.ApiClient(configuration)),
+    ]
+
+    print("%10s %6s %6s %14s %12s %9s" % (
+        "assistants", "MiB", "mode", "first item ms", "read all ms", "peak MiB"))
+    for size in [int(s) for s in args.sizes.split(",")]:
+        body = json.dumps([make_assistant(i, args.config_size) for i in range(size)]).encode()
+        for mode, api_client in clients:
+            deserialize = functools.partial(
+                api_client.deserialize, body, RESPONSE_TYPE, "application/json"
+            )
+            first, total = timed(deserialize, args.repeat)
+            used, result = peak(deserialize)
+            del result
+            print("%10d %6.1f %6s %14.1f %12.1f %9.1f" % (
+                size, len(body) / 2 ** 20, mode, first * 1000, total * 1000, used / 2 ** 20))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Multipart uploads: `MultipartEncoder` versus encoding the body in memory.
+
+Writes a file of each size, then encodes a `multipart/form-data` body for
+it and feeds the body to a sink the way a socket would. The in-memory
+variant reads the file and calls `urllib3.encode_multipart_formdata`, as
+the client did before. Reports time and peak memory (tracemalloc, separate
+run)::
+
+    python benchmarks/bench_multipart.py --sizes 16,64,256 --chunk-size 65536
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import urllib3
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from openapi_client.multipart import FileData, MultipartEncoder  # noqa: E402
+
+
+def in_memory(path, chunk_size):
+    with open(path, "rb") as f:
+        data = f.read()
+    body, _ = urllib3.encode_multipart_formdata([("file", (os.path.basename(path), data))])
+    view = memoryview(body)
+    for offset in range(0, len(body), chunk_size):
+        view[offset:offset + chunk_size]
+
+
+def streamed(path, chunk_size):
+    encoder = MultipartEncoder(
+        [("file", (os.path.basename(path), FileData(path)))], chunk_size=chunk_size
+    )
+    for _ in encoder:
+        pass
+
+
+def timed(fn, path, chunk_size, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        fn(path, chunk_size)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def peak(fn, path, chunk_size):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn(path, chunk_size)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="16,64,256", help="file sizes in MiB")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--chunk-size", type=int, default=1 << 16)
+    args = parser.parse_args()
+
+    print("%6s %10s %9s %9s" % ("MiB", "encoder", "ms", "peak MiB"))
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "upload.bin")
+        for size in [int(s) for s in args.sizes.split(",")]:
+            with open(path, "wb") as f:
+                for _ in range(size):
+                    f.write(os.urandom(2 ** 20))
+            for label, fn in (("in memory", in_memory), ("streamed", streamed)):
+                elapsed = timed(fn, path, args.chunk_size, args.repeat)
+                used = peak(fn, path, args.chunk_size)
+                print("%6d %10s %9.1f %9.1f" % (size, label, elapsed * 1000, used / 2 ** 20))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Request bodies: `stream_request_bodies` versus encoding the body up front.
+
+Sends `sync_secrets` with growing `fqsns` lists to a transport that consumes
+the body chunk by chunk, as a socket would. Reports the time from the call
+to the first body byte, the total time and the peak memory (tracemalloc,
+separate run) of both modes, with the configured JSON codec::
+
+    python benchmarks/bench_request_body.py --sizes 10000,100000 --codec json
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from openapi_client import ApiClient, Configuration, DefaultApi  # noqa: E402
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest  # noqa: E402
+from openapi_client.rest import build_response, serialize_body  # noqa: E402
+from openapi_client.transport import Transport  # noqa: E402
+
+
+class DrainTransport(Transport):
+    """Consumes request bodies and records when their first byte was ready."""
+
+    first_byte_at = None
+
+    def request(self, method, url, headers=None, body=None, post_params=None,
+                _request_timeout=None):
+        data = serialize_body(method, headers, body, post_params)
+        if isinstance(data, bytes):
+            data = [data]
+        for chunk in data:
+            if self.first_byte_at is None:
+                self.first_byte_at = time.perf_counter()
+        return build_response(200, [("Content-Type", "application/json")], b"[]")
+
+
+def timed(api, request, repeat):
+    """Best ``(seconds to first byte, total seconds)``."""
+    transport = api.api_client.configuration.transport
+    first = total = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        transport.first_byte_at = None
+        started = time.perf_counter()
+        api.sync_secrets_without_preload_content(request)
+        total = min(total, time.perf_counter() - started)
+        first = min(first, transport.first_byte_at - started)
+    return first, total
+
+
+def peak(api, request):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        api.sync_secrets_without_preload_content(request)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--codec", default=None, help="json, orjson or msgspec")
+    args = parser.parse_args()
+
+    print("%8s %9s %14s %9s %9s" % ("fqsns", "mode", "first byte ms", "total ms", "peak MiB"))
+    for size in [int(s) for s in args.sizes.split(",")]:
+        request = SyncSecretsRequest(fqsns=[
+            {"userSlug": "user-%d" % i, "secretName": "SECRET_%d" % i} for i in range(size)
+        ])
+        for mode in ("buffered", "streamed"):
+            configuration = Configuration(host="http://hub.test", access_token="token")
+            configuration.transport = DrainTransport()
+            configuration.json_codec = args.codec
+            configuration.stream_request_bodies = mode == "streamed"
+            api = DefaultApi(ApiClient(configuration))
+            first, total = timed(api, request, args.repeat)
+            used = peak(api, request)
+            print("%8d %9s %14.2f %9.1f %9.1f" % (
+                size, mode, first * 1000, total * 1000, used / 2 ** 20))
+
+
+if __name__ == "__main__":
+    main()
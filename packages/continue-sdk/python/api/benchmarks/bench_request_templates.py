@@ -0,0 +1,58 @@
+"""Request serialization: compiled request templates against `param_serialize`.
+
+Times, per operation, building a request from validated arguments with the
+operation's `RequestTemplate` and with the generic
+`ApiClient.param_serialize` path the generated `_serialize` methods took
+(tests/test_request_templates.py), in microseconds per request::
+
+    python benchmarks/bench_request_templates.py
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from openapi_client import ApiClient, Configuration  # noqa: E402
+from openapi_client.operations import OPERATIONS  # noqa: E402
+from tests.test_request_templates import ARGUMENTS, param_serialize  # noqa: E402
+
+
+def per_call(fn, budget=0.2, repeat=5):
+    """Best time per call, in microseconds."""
+    fn()
+    calls = 1
+    started = time.perf_counter()
+    while time.perf_counter() - started < budget / repeat:
+        fn()
+        calls += 1
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, (time.perf_counter() - started) / calls)
+    return best * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=0.2,
+                        help="seconds per measurement")
+    args = parser.parse_args()
+
+    api_client = ApiClient(Configuration(host="http://hub.test", access_token="token"))
+    print("%-32s %12s %12s %8s" % ("operation", "template us", "generic us", "speedup"))
+    for operation_id, operation in OPERATIONS.items():
+        values = operation.arguments(**ARGUMENTS.get(operation_id, {}))
+        template = per_call(lambda: operation.template.serialize(api_client, values), args.budget)
+        generic = per_call(lambda: param_serialize(api_client, operation, values), args.budget)
+        print("%-32s %12.2f %12.2f %7.1fx" % (operation_id, template, generic, generic / template))
+
+
+if __name__ == "__main__":
+    main()
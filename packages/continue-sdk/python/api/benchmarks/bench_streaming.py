@@ -0,0 +1,103 @@
+"""Streaming: `iter_assistants` versus `list_assistants`.
+
+Serves a prebuilt `list_assistants` body of the stand-in Hub (tests/hub.py)
+from memory in `--chunk-size` reads, as a socket would deliver it, and
+reports the time to the first assistant, the total time and the peak
+memory (tracemalloc, separate run) of both calls::
+
+    python benchmarks/bench_streaming.py --sizes 1000,5000,20000
+"""
+
+import argparse
+import gc
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from openapi_client import ApiClient, Configuration, DefaultApi  # noqa: E402
+from openapi_client.rest import build_response  # noqa: E402
+from openapi_client.streaming import iter_assistants  # noqa: E402
+from openapi_client.transport import Transport  # noqa: E402
+from tests.hub import make_assistant  # noqa: E402
+
+
+class MemoryTransport(Transport):
+    """Answers every request with `body`, read `chunk_size` bytes at a time."""
+
+    def __init__(self, body, chunk_size) -> None:
+        self.body = body
+        self.chunk_size = chunk_size
+
+    def request(self, method, url, headers=None, body=None, post_params=None,
+                _request_timeout=None):
+        return build_response(
+            200, [("Content-Type", "application/json; charset=utf-8")],
+            io.BufferedReader(io.BytesIO(self.body), self.chunk_size),
+        )
+
+
+def listed(api):
+    """Returns when the first assistant could be used."""
+    api.list_assistants()
+    return time.perf_counter()
+
+
+def streamed(api):
+    assistants = iter_assistants(api)
+    next(assistants)
+    first_at = time.perf_counter()
+    for _ in assistants:
+        pass
+    return first_at
+
+
+def timed(fn, api, repeat):
+    """Best ``(seconds to first item, total seconds)``."""
+    first = total = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        first_at = fn(api)
+        first = min(first, first_at - started)
+        total = min(total, time.perf_counter() - started)
+    return first, total
+
+
+def peak(fn, api):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn(api)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,5000,20000")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--chunk-size", type=int, default=65536)
+    args = parser.parse_args()
+
+    print("%10s %6s %16s %14s %9s %9s" % (
+        "assistants", "MiB", "call", "first item ms", "total ms", "peak MiB"))
+    for size in [int(s) for s in args.sizes.split(",")]:
+        body = json.dumps([make_assistant(i) for i in range(size)]).encode("utf-8")
+        configuration = Configuration(host="http://hub.test", access_token="token")
+        configuration.transport = MemoryTransport(body, args.chunk_size)
+        api = DefaultApi(ApiClient(configuration))
+        for label, fn in (("list_assistants", listed), ("iter_assistants", streamed)):
+            first, total = timed(fn, api, args.repeat)
+            used = peak(fn, api)
+            print("%10d %6.1f %16s %14.1f %9.1f %9.1f" % (
+                size, len(body) / 2 ** 20, label, first * 1000, total * 1000, used / 2 ** 20))
+
+
+if __name__ == "__main__":
+    main()
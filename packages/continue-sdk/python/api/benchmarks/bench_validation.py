@@ -0,0 +1,122 @@
+"""Argument validation: calls per second with and without it.
+
+Calls `get_policy` and `get_assistant` against the stand-in Hub (tests/hub.py)
+over the in-process transports, once with `client_side_validation` on and
+once with it off, with `DefaultApi` and `AsyncDefaultApi`. Also times
+`Operation.validate` and `Operation.bind` alone::
+
+    python benchmarks/bench_validation.py --seconds 1
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from openapi_client import (  # noqa: E402
+    ApiClient, AsyncApiClient, AsyncDefaultApi, Configuration, DefaultApi,
+)
+from openapi_client.inprocess import AsyncASGITransport, WSGITransport  # noqa: E402
+from openapi_client.operations import OPERATIONS  # noqa: E402
+from tests.hub import HubApp, as_asgi  # noqa: E402
+
+CALLS = [
+    ("get_policy", (), {}),
+    ("get_assistant", ("owner-1", "package-1"), {"organization_id": "org"}),
+]
+
+
+def configuration(validation):
+    app = HubApp(assistants=2)
+    configuration = Configuration(host="http://hub.test", access_token="token")
+    configuration.transport = WSGITransport(app)
+    configuration.async_transport = AsyncASGITransport(as_asgi(app))
+    configuration.client_side_validation = validation
+    return configuration
+
+
+def rate(call, seconds):
+    """Calls per second of `call`, which returns how many calls it made."""
+    call()
+    calls = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        calls += call()
+    return calls / (time.perf_counter() - started)
+
+
+def sync_rate(validation, operation_id, args, kwargs, seconds):
+    method = getattr(DefaultApi(ApiClient(configuration(validation))), operation_id)
+
+    def call():
+        for _ in range(100):
+            method(*args, **kwargs)
+        return 100
+
+    return rate(call, seconds)
+
+
+def async_rate(validation, operation_id, args, kwargs, seconds):
+    async def main():
+        async with AsyncApiClient(configuration(validation)) as api_client:
+            method = getattr(AsyncDefaultApi(api_client), operation_id)
+
+            async def batch():
+                for _ in range(100):
+                    await method(*args, **kwargs)
+
+            loop = asyncio.get_running_loop()
+            await batch()
+            calls = 0
+            started = loop.time()
+            while loop.time() - started < seconds:
+                await batch()
+                calls += 100
+            return calls / (loop.time() - started)
+
+    return asyncio.run(main())
+
+
+def per_call(fn, number=20000):
+    """Best time per call of three runs, in microseconds."""
+    fn()
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0,
+                        help="seconds per measurement")
+    args = parser.parse_args()
+
+    print("%-14s %-6s %14s %14s %8s" % (
+        "operation", "client", "validated/s", "unchecked/s", "gain"))
+    for operation_id, call_args, call_kwargs in CALLS:
+        for client, measure in (("sync", sync_rate), ("async", async_rate)):
+            validated = measure(True, operation_id, call_args, call_kwargs, args.seconds)
+            unchecked = measure(False, operation_id, call_args, call_kwargs, args.seconds)
+            print("%-14s %-6s %14.0f %14.0f %7.0f%%" % (
+                operation_id, client, validated, unchecked, (unchecked / validated - 1) * 100))
+
+    print()
+    print("%-14s %12s %12s" % ("operation", "validate us", "bind us"))
+    for operation_id, call_args, call_kwargs in CALLS:
+        operation = OPERATIONS[operation_id]
+        print("%-14s %12.2f %12.2f" % (
+            operation_id,
+            per_call(lambda: operation.validate(call_args, call_kwargs)),
+            per_call(lambda: operation.bind(call_args, call_kwargs)),
+        ))
+
+
+if __name__ == "__main__":
+    main()
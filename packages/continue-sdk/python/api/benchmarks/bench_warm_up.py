@@ -0,0 +1,66 @@
+"""Model building: what deferring it moves off the import path.
+
+In fresh interpreters, imports the sync client, `DefaultApi` and every
+model and counts the models built so far, then times the first
+`list_assistants` and `get_policy` calls against the stand-in Hub
+(tests/hub.py, in process). Runs once as is and once calling
+`warmup.warm_up()` after the imports::
+
+    python benchmarks/bench_warm_up.py --repeat 9
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+PROBE = """
+import time
+started = time.perf_counter()
+from openapi_client import ApiClient, Configuration, DefaultApi
+import openapi_client.models as models
+for name in models.__all__:
+    getattr(models, name)
+imported = time.perf_counter()
+built = sum(getattr(models, name).__pydantic_complete__ for name in models.__all__)
+if %(warm)r:
+    from openapi_client.warmup import warm_up
+    warm_up(response_types=["List[ListAssistants200ResponseInner]", "GetPolicy200Response"])
+warmed = time.perf_counter()
+from openapi_client.inprocess import WSGITransport
+from tests.hub import HubApp
+configuration = Configuration(host="http://hub.test", access_token="token")
+configuration.transport = WSGITransport(HubApp(assistants=10))
+api = DefaultApi(ApiClient(configuration))
+ready = time.perf_counter()
+api.list_assistants()
+api.get_policy().to_dict()
+done = time.perf_counter()
+print(built, imported - started, warmed - imported, done - ready)
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=9)
+    args = parser.parse_args()
+
+    print("%8s %13s %10s %11s %14s" % (
+        "mode", "built models", "import ms", "warm-up ms", "first calls ms"))
+    for warm in (False, True):
+        runs = [
+            [float(v) for v in subprocess.check_output(
+                [sys.executable, "-c", PROBE % {"warm": warm}], cwd=ROOT).split()]
+            for _ in range(args.repeat)
+        ]
+        built = int(runs[0][0])
+        medians = [statistics.median(column) * 1000 for column in list(zip(*runs))[1:]]
+        print("%8s %13d %10.1f %11.1f %14.1f" % (
+            ("warm" if warm else "deferred", built) + tuple(medians)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,33 @@
 # flake8: noqa
 
-# import apis into api package
-from api.default_api import DefaultApi
+import importlib
+from typing import TYPE_CHECKING
 
+# public names and the modules defining them, imported on first access
+# (PEP 562) so that importing the package stays cheap
+_LAZY_IMPORTS = {
+    # apis
+    "DefaultApi": "openapi_client.api.default_api",
+    "AsyncDefaultApi": "openapi_client.api.async_default_api",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if TYPE_CHECKING:
+    # import apis into api package
+    from openapi_client.api.default_api import DefaultApi
+    from openapi_client.api.async_default_api import AsyncDefaultApi
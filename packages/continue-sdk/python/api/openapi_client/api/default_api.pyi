@@ -0,0 +1,283 @@
+# Signatures of the methods `operations.api_methods` generates from
+# `operations.OPERATIONS`, for type checkers.
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+from typing_extensions import Annotated
+
+from pydantic import Field, StrictFloat, StrictInt, StrictStr
+
+from openapi_client.models.get_assistant200_response import GetAssistant200Response
+from openapi_client.models.get_free_trial_status200_response import GetFreeTrialStatus200Response
+from openapi_client.models.get_models_add_on_checkout_url200_response import GetModelsAddOnCheckoutUrl200Response
+from openapi_client.models.get_policy200_response import GetPolicy200Response
+from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+from openapi_client.models.list_organizations200_response import ListOrganizations200Response
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+from openapi_client.api_client import ApiClient, RequestSerialized
+from openapi_client.api_response import ApiResponse
+from openapi_client.rest import RESTResponseType
+
+
+class DefaultApi:
+    api_client: ApiClient
+
+    def __init__(self, api_client: Optional[ApiClient] = ...) -> None: ...
+
+    def get_assistant(
+        self,
+        owner_slug: Annotated[StrictStr, Field(description='Slug of the user or organization that owns the assistant')],
+        package_slug: Annotated[StrictStr, Field(description='Slug of the assistant package')],
+        always_use_proxy: Annotated[Optional[StrictStr], Field(description='Whether to always use the Continue-managed proxy for model requests')] = ...,
+        organization_id: Annotated[Optional[StrictStr], Field(description='ID of the organization to scope assistants to. If not provided, personal assistants are returned.')] = ...,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> GetAssistant200Response: ...
+
+    def get_assistant_with_http_info(
+        self,
+        owner_slug: Annotated[StrictStr, Field(description='Slug of the user or organization that owns the assistant')],
+        package_slug: Annotated[StrictStr, Field(description='Slug of the assistant package')],
+        always_use_proxy: Annotated[Optional[StrictStr], Field(description='Whether to always use the Continue-managed proxy for model requests')] = ...,
+        organization_id: Annotated[Optional[StrictStr], Field(description='ID of the organization to scope assistants to. If not provided, personal assistants are returned.')] = ...,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> ApiResponse[GetAssistant200Response]: ...
+
+    def get_assistant_without_preload_content(
+        self,
+        owner_slug: Annotated[StrictStr, Field(description='Slug of the user or organization that owns the assistant')],
+        package_slug: Annotated[StrictStr, Field(description='Slug of the assistant package')],
+        always_use_proxy: Annotated[Optional[StrictStr], Field(description='Whether to always use the Continue-managed proxy for model requests')] = ...,
+        organization_id: Annotated[Optional[StrictStr], Field(description='ID of the organization to scope assistants to. If not provided, personal assistants are returned.')] = ...,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> RESTResponseType: ...
+
+    def _get_assistant_serialize(self, **kwargs: Any) -> RequestSerialized: ...
+
+    def get_free_trial_status(
+        self,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> GetFreeTrialStatus200Response: ...
+
+    def get_free_trial_status_with_http_info(
+        self,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> ApiResponse[GetFreeTrialStatus200Response]: ...
+
+    def get_free_trial_status_without_preload_content(
+        self,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> RESTResponseType: ...
+
+    def _get_free_trial_status_serialize(self, **kwargs: Any) -> RequestSerialized: ...
+
+    def get_models_add_on_checkout_url(
+        self,
+        profile_id: Annotated[Optional[StrictStr], Field(description='Profile ID to include in the callback URL')] = ...,
+        vscode_uri_scheme: Annotated[Optional[StrictStr], Field(description='VS Code URI scheme to include in the callback URL')] = ...,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> GetModelsAddOnCheckoutUrl200Response: ...
+
+    def get_models_add_on_checkout_url_with_http_info(
+        self,
+        profile_id: Annotated[Optional[StrictStr], Field(description='Profile ID to include in the callback URL')] = ...,
+        vscode_uri_scheme: Annotated[Optional[StrictStr], Field(description='VS Code URI scheme to include in the callback URL')] = ...,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> ApiResponse[GetModelsAddOnCheckoutUrl200Response]: ...
+
+    def get_models_add_on_checkout_url_without_preload_content(
+        self,
+        profile_id: Annotated[Optional[StrictStr], Field(description='Profile ID to include in the callback URL')] = ...,
+        vscode_uri_scheme: Annotated[Optional[StrictStr], Field(description='VS Code URI scheme to include in the callback URL')] = ...,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> RESTResponseType: ...
+
+    def _get_models_add_on_checkout_url_serialize(self, **kwargs: Any) -> RequestSerialized: ...
+
+    def get_policy(
+        self,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> GetPolicy200Response: ...
+
+    def get_policy_with_http_info(
+        self,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> ApiResponse[GetPolicy200Response]: ...
+
+    def get_policy_without_preload_content(
+        self,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> RESTResponseType: ...
+
+    def _get_policy_serialize(self, **kwargs: Any) -> RequestSerialized: ...
+
+    def list_assistant_full_slugs(
+        self,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> None: ...
+
+    def list_assistant_full_slugs_with_http_info(
+        self,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> ApiResponse[None]: ...
+
+    def list_assistant_full_slugs_without_preload_content(
+        self,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> RESTResponseType: ...
+
+    def _list_assistant_full_slugs_serialize(self, **kwargs: Any) -> RequestSerialized: ...
+
+    def list_assistants(
+        self,
+        always_use_proxy: Annotated[Optional[StrictStr], Field(description='Whether to always use the Continue-managed proxy for model requests')] = ...,
+        organization_id: Annotated[Optional[StrictStr], Field(description='ID of the organization to scope assistants to. If not provided, personal assistants are returned.')] = ...,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> List[ListAssistants200ResponseInner]: ...
+
+    def list_assistants_with_http_info(
+        self,
+        always_use_proxy: Annotated[Optional[StrictStr], Field(description='Whether to always use the Continue-managed proxy for model requests')] = ...,
+        organization_id: Annotated[Optional[StrictStr], Field(description='ID of the organization to scope assistants to. If not provided, personal assistants are returned.')] = ...,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> ApiResponse[List[ListAssistants200ResponseInner]]: ...
+
+    def list_assistants_without_preload_content(
+        self,
+        always_use_proxy: Annotated[Optional[StrictStr], Field(description='Whether to always use the Continue-managed proxy for model requests')] = ...,
+        organization_id: Annotated[Optional[StrictStr], Field(description='ID of the organization to scope assistants to. If not provided, personal assistants are returned.')] = ...,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> RESTResponseType: ...
+
+    def _list_assistants_serialize(self, **kwargs: Any) -> RequestSerialized: ...
+
+    def list_organizations(
+        self,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> ListOrganizations200Response: ...
+
+    def list_organizations_with_http_info(
+        self,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> ApiResponse[ListOrganizations200Response]: ...
+
+    def list_organizations_without_preload_content(
+        self,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> RESTResponseType: ...
+
+    def _list_organizations_serialize(self, **kwargs: Any) -> RequestSerialized: ...
+
+    def sync_secrets(
+        self,
+        sync_secrets_request: SyncSecretsRequest,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> List[Optional[object]]: ...
+
+    def sync_secrets_with_http_info(
+        self,
+        sync_secrets_request: SyncSecretsRequest,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> ApiResponse[List[Optional[object]]]: ...
+
+    def sync_secrets_without_preload_content(
+        self,
+        sync_secrets_request: SyncSecretsRequest,
+        _request_timeout: Union[None, Annotated[StrictFloat, Field(gt=0)], Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]]] = ...,
+        _request_auth: Optional[Dict[StrictStr, Any]] = ...,
+        _content_type: Optional[StrictStr] = ...,
+        _headers: Optional[Dict[StrictStr, Any]] = ...,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = ...,
+    ) -> RESTResponseType: ...
+
+    def _sync_secrets_serialize(self, **kwargs: Any) -> RequestSerialized: ...
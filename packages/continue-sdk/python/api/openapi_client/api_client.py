@@ -13,9 +13,9 @@
 
 
 import datetime
-from dateutil.parser import parse
 from enum import Enum
 import decimal
+import functools
 import json
 import mimetypes
 import os
@@ -27,9 +27,13 @@ from typing import Tuple, Optional, List, Dict, Union
 from pydantic import SecretStr
 
 from openapi_client.configuration import Configuration
+from openapi_client.deserializer import get_plan
+from openapi_client.download import FileSink
+from openapi_client.multipart import FileData, MultipartEncoder
 from openapi_client.api_response import ApiResponse, T as ApiResponseT
 import openapi_client.models
-from openapi_client import rest
+from openapi_client import compression, json_codec, rest, retry
+from openapi_client.transport import create_transport
 from openapi_client.exceptions import (
     ApiValueError,
     ApiException,
@@ -59,6 +63,9 @@ class ApiClient:
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, str, int)
+    # `Accept-Encoding` with `Configuration.compression` on, and off
+    ACCEPT_ENCODING: Optional[str] = compression.ACCEPT_ENCODING
+    UNCOMPRESSED_ENCODING: Optional[str] = None
     NATIVE_TYPES_MAPPING = {
         'int': int,
         'long': int, # TODO remove as only py3 is supported?
@@ -71,6 +78,9 @@ class ApiClient:
         'object': object,
     }
     _pool = None
+    # per-client caches of `base_headers` and `auth_params`
+    _base_headers = None
+    _auth_params = None
 
     def __init__(
         self,
@@ -84,7 +94,8 @@ class ApiClient:
             configuration = Configuration.get_default()
         self.configuration = configuration
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        self.rest_client = create_transport(configuration)
+        self.json_codec = json_codec.get_codec(configuration.json_codec)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -99,6 +110,10 @@ class ApiClient:
     def __exit__(self, exc_type, exc_value, traceback):
         pass
 
+    def close(self):
+        """Releases the connections held by the transport."""
+        self.rest_client.close()
+
     @property
     def user_agent(self):
         """User agent for this API client"""
@@ -180,6 +195,11 @@ class ApiClient:
         # header parameters
         header_params = header_params or {}
         header_params.update(self.default_headers)
+        accept_encoding = (
+            self.ACCEPT_ENCODING if config.compression else self.UNCOMPRESSED_ENCODING
+        )
+        if accept_encoding:
+            header_params.setdefault('Accept-Encoding', accept_encoding)
         if self.cookie:
             header_params['Cookie'] = self.cookie
         if header_params:
@@ -212,6 +232,12 @@ class ApiClient:
             )
             if files:
                 post_params.extend(self.files_parameters(files))
+            if header_params.get('Content-Type') == 'multipart/form-data':
+                post_params = MultipartEncoder(
+                    post_params,
+                    chunk_size=config.upload_chunk_size,
+                    progress=config.upload_progress,
+                )
 
         # auth setting
         self.update_params_for_auth(
@@ -225,8 +251,7 @@ class ApiClient:
         )
 
         # body
-        if body:
-            body = self.sanitize_for_serialization(body)
+        body = self.serialize_body(method, body, header_params.get('Content-Type'))
 
         # request url
         if _host is None or self.configuration.ignore_operation_servers:
@@ -268,20 +293,128 @@ class ApiClient:
         :return: RESTResponse
         """
 
-        try:
-            # perform request and return response
-            response_data = self.rest_client.request(
+        metrics = self.configuration.transfer_metrics
+
+        def send(headers):
+            response = self.rest_client.request(
                 method, url,
-                headers=header_params,
+                headers=headers,
                 body=body, post_params=post_params,
                 _request_timeout=_request_timeout
             )
+            if metrics is not None:
+                metrics.track(response, method, url)
+            return response
+
+        try:
+            # perform request and return response
+            limiter = self.configuration.rate_limiter
+            if limiter is not None:
+                send = functools.partial(limiter.request, send, method, url)
+            breaker = self.configuration.circuit_breaker
+            if breaker is not None:
+                send = functools.partial(breaker.request, send, method, url)
+            policy = retry.policy_for(self.configuration.retry_policy, method, url)
+            if policy is not None:
+                send = functools.partial(policy.request, send, method, url)
+            flight = self.configuration.single_flight
+            if flight is not None:
+                send = functools.partial(flight.request, send, method, url)
+            cache = self.configuration.http_cache
+            if cache is not None:
+                response_data = cache.request(send, method, url, header_params)
+            else:
+                response_data = send(header_params)
 
         except ApiException as e:
             raise e
 
         return response_data
 
+    def serialize_body(self, method, body, content_type):
+        """Sanitizes a request body and encodes it as JSON when the
+        `content_type` is JSON or unset.
+
+        :param method: Method of the request.
+        :param body: Request body.
+        :param content_type: `Content-Type` of the request, if any.
+        :return: the body to send.
+        """
+        config = self.configuration
+        json_body = (
+            body is not None
+            and method in ('POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE')
+            and (not content_type or re.search('json', content_type, re.IGNORECASE))
+        )
+        if json_body and config.stream_request_bodies:
+            # sanitized and encoded an element at a time while it is sent
+            return json_codec.JSONStream(
+                self.json_codec, body, config.upload_chunk_size,
+                sanitize=self.sanitize_for_serialization,
+            )
+        if body:
+            body = self.sanitize_for_serialization(body)
+        if json_body:
+            # encoded here with the configured codec; transports send it as is
+            body = json_codec.JSONBody(self.json_codec.dumpb(body))
+        return body
+
+    def base_headers(self):
+        """Headers every request of this client carries, sanitized: the
+        default headers and the cookie, which override those of the
+        request, and `Accept-Encoding`, which does not.
+
+        Built again only when `default_headers`, `cookie` or
+        `Configuration.compression` change.
+
+        :return: tuple of form (headers, accept_encoding), where
+            accept_encoding is None when the client does not ask for it.
+        """
+        cached = self._base_headers
+        compression = self.configuration.compression
+        if (
+            cached is not None
+            and cached[0] == self.default_headers
+            and cached[1] is self.cookie
+            and cached[2] == compression
+        ):
+            return cached[3]
+        headers = dict(self.default_headers)
+        accept_encoding = None
+        if 'Accept-Encoding' not in headers:
+            accept_encoding = (
+                self.ACCEPT_ENCODING if compression else self.UNCOMPRESSED_ENCODING
+            ) or None
+        if self.cookie:
+            headers['Cookie'] = self.cookie
+        result = (self.sanitize_for_serialization(headers), accept_encoding)
+        self._base_headers = (dict(self.default_headers), self.cookie, compression, result)
+        return result
+
+    def auth_params(self, auth_settings):
+        """Headers and query parameters that `update_params_for_auth` adds
+        for `auth_settings`.
+
+        Kept per configuration and access token, the only credential of the
+        API's security scheme: setting `Configuration.access_token`, or
+        giving the client another configuration, computes them again.
+
+        :param auth_settings: Authentication setting identifiers list.
+        :return: tuple of form (headers, queries).
+        """
+        config = self.configuration
+        token = config.access_token
+        cached = self._auth_params
+        if cached is None or cached[0] is not config or cached[1] != token:
+            cached = self._auth_params = (config, token, {})
+        params = cached[2].get(auth_settings)
+        if params is None:
+            headers: Dict[str, str] = {}
+            queries: List[Tuple[str, str]] = []
+            self.update_params_for_auth(headers, queries, auth_settings, None, None, None)
+            params = cached[2][auth_settings] = (headers, tuple(queries))
+        return params
+
     def response_deserialize(
         self,
         response_data: rest.RESTResponse,
@@ -293,17 +426,22 @@ class ApiClient:
         :return: ApiResponse
         """
 
-        msg = "RESTResponse.read() must be called before passing it to response_deserialize()"
-        assert response_data.data is not None, msg
-
         response_type = response_types_map.get(str(response_data.status), None)
         if not response_type and isinstance(response_data.status, int) and 100 <= response_data.status <= 599:
             # if not found, look for '1XX', '2XX', etc.
             response_type = response_types_map.get(str(response_data.status)[0] + "XX", None)
 
+        # files are streamed to disk from an unread (synchronous) response
+        msg = "RESTResponse.read() must be called before passing it to response_deserialize()"
+        assert response_data.data is not None or (
+            response_type == "file" and isinstance(response_data, rest.RESTResponse)
+        ), msg
+
         # deserialize response data
         response_text = None
         return_data = None
+        # a coalesced response is deserialized once for all its callers
+        shared = getattr(response_data, "shared", None)
         try:
             if response_type == "bytearray":
                 return_data = response_data.data
@@ -312,11 +450,26 @@ class ApiClient:
             elif response_type is not None:
                 match = None
                 content_type = response_data.getheader('content-type')
-                if content_type is not None:
+                if content_type is not None and 'charset=' in content_type:
                     match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
                 encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                return_data = self.deserialize(response_text, response_type, content_type)
+                if (
+                    200 <= response_data.status <= 299
+                    and encoding.lower() in ("utf-8", "utf8")
+                    and content_type is not None
+                    and self.__is_json(content_type)
+                ):
+                    # JSON is validated straight from the response bytes,
+                    # without a decoded copy of the body
+                    body = response_data.data
+                else:
+                    body = response_text = response_data.data.decode(encoding)
+                if shared is not None:
+                    return_data = shared.get(response_type, lambda: self.deserialize(
+                        body, response_type, content_type
+                    ))
+                else:
+                    return_data = self.deserialize(body, response_type, content_type)
         finally:
             if not 200 <= response_data.status <= 299:
                 raise ApiException.from_response(
@@ -329,7 +482,7 @@ class ApiClient:
             status_code = response_data.status,
             data = return_data,
             headers = response_data.getheaders(),
-            raw_data = response_data.data
+            raw_data = response_data.data if self.configuration.retain_raw_data else None
         )
 
     def sanitize_for_serialization(self, obj):
@@ -387,10 +540,16 @@ class ApiClient:
             for key, val in obj_dict.items()
         }
 
-    def deserialize(self, response_text: str, response_type: str, content_type: Optional[str]):
+    def deserialize(
+        self,
+        response_text: Union[str, bytes],
+        response_type: str,
+        content_type: Optional[str]
+    ):
         """Deserializes response into an object.
 
-        :param response: RESTResponse object to be deserialized.
+        :param response_text: response body; JSON may also be passed as
+            UTF-8 bytes.
         :param response_type: class literal for
             deserialized object, or string of class name.
         :param content_type: content type of response.
@@ -398,17 +557,34 @@ class ApiClient:
         :return: deserialized object.
         """
 
+        # type strings are compiled once into a plan, see deserializer.py
+        plan = None
+        if isinstance(response_type, str):
+            plan = get_plan(response_type, self.__resolve_type)
+
         # fetch data from response object
         if content_type is None:
             try:
-                data = json.loads(response_text)
+                data = self.json_codec.loads(response_text)
             except ValueError:
                 data = response_text
-        elif re.match(r'^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE):
-            if response_text == "":
+        elif self.__is_json(content_type):
+            if len(response_text) == 0:
                 data = ""
+            elif plan is not None:
+                configuration = self.configuration
+                if configuration.lazy_models:
+                    return plan.from_json_lazy(
+                        response_text, self.__deserialize, self.json_codec.loads
+                    )
+                if configuration.trusted_responses:
+                    return plan.from_json_trusted(
+                        response_text, self.__deserialize, self.json_codec.loads,
+                        configuration.trusted_responses_validate_one_in,
+                    )
+                return plan.from_json(response_text, self.__deserialize, self.json_codec.loads)
             else:
-                data = json.loads(response_text)
+                data = self.json_codec.loads(response_text)
         elif re.match(r'^text\/[a-z.+-]+\s*(;|$)', content_type, re.IGNORECASE):
             data = response_text
         else:
@@ -417,8 +593,22 @@ class ApiClient:
                 reason="Unsupported content type: {0}".format(content_type)
             )
 
+        if plan is not None:
+            return plan.from_data(data, self.__deserialize)
         return self.__deserialize(data, response_type)
 
+    @staticmethod
+    def __is_json(content_type):
+        return re.match(
+            r'^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE
+        ) is not None
+
+    def __resolve_type(self, klass):
+        """Returns the class named `klass` in a response type string."""
+        if klass in self.NATIVE_TYPES_MAPPING:
+            return self.NATIVE_TYPES_MAPPING[klass]
+        return getattr(openapi_client.models, klass)
+
     def __deserialize(self, data, klass):
         """Deserializes dict, list, str into an object.
 
@@ -446,10 +636,7 @@ class ApiClient:
                         for k, v in data.items()}
 
             # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
-            else:
-                klass = getattr(openapi_client.models, klass)
+            klass = self.__resolve_type(klass)
 
         if klass in self.PRIMITIVE_TYPES:
             return self.__deserialize_primitive(data, klass)
@@ -547,9 +734,9 @@ class ApiClient:
         params = []
         for k, v in files.items():
             if isinstance(v, str):
-                with open(v, 'rb') as f:
-                    filename = os.path.basename(f.name)
-                    filedata = f.read()
+                # read while the request is sent (see multipart.MultipartEncoder)
+                filename = os.path.basename(v)
+                filedata = FileData(v)
             elif isinstance(v, bytes):
                 filename = k
                 filedata = v
@@ -704,8 +891,8 @@ class ApiClient:
             filename = m.group(1)
             path = os.path.join(os.path.dirname(path), filename)
 
-        with open(path, "wb") as f:
-            f.write(response.data)
+        with FileSink(path, self.configuration.download_buffer_size, algorithm=None) as sink:
+            sink.write_response(response)
 
         return path
 
@@ -738,6 +925,7 @@ class ApiClient:
         :return: date.
         """
         try:
+            from dateutil.parser import parse
             return parse(string).date()
         except ImportError:
             return string
@@ -756,6 +944,7 @@ class ApiClient:
         :return: datetime.
         """
         try:
+            from dateutil.parser import parse
             return parse(string)
         except ImportError:
             return string
@@ -14,8 +14,12 @@ class ApiResponse(BaseModel, Generic[T]):
     status_code: StrictInt = Field(description="HTTP status code")
     headers: Optional[Mapping[str, str]] = Field(None, description="HTTP headers")
     data: T = Field(description="Deserialized data given the data type")
-    raw_data: StrictBytes = Field(description="Raw data (HTTP response body)")
+    raw_data: Optional[StrictBytes] = Field(
+        None,
+        description="Raw data (HTTP response body), when `Configuration.retain_raw_data` is set",
+    )
 
     model_config = {
-        "arbitrary_types_allowed": True
+        "arbitrary_types_allowed": True,
+        "defer_build": True,
     }
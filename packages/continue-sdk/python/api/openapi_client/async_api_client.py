@@ -0,0 +1,162 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import functools
+
+from openapi_client.configuration import Configuration
+from openapi_client.api_client import ApiClient
+from openapi_client import async_rest, json_codec, retry
+from openapi_client.transport import create_async_transport
+from openapi_client.exceptions import ApiException
+
+
+class AsyncApiClient(ApiClient):
+    """Generic asyncio API client for OpenAPI client library builds.
+
+    Request serialization (`param_serialize`) and response deserialization
+    (`response_deserialize`) are inherited unchanged from `ApiClient`; only
+    the network I/O is awaited, on an aiohttp session bound to the running
+    event loop.
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to
+        the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    """
+
+    # aiohttp and httpx ask for the codings they can decode themselves,
+    # unless told not to
+    ACCEPT_ENCODING = None
+    UNCOMPRESSED_ENCODING = "identity"
+
+    def __init__(
+        self,
+        configuration=None,
+        header_name=None,
+        header_value=None,
+        cookie=None
+    ) -> None:
+        # use default configuration if none is provided
+        if configuration is None:
+            configuration = Configuration.get_default()
+        self.configuration = configuration
+
+        self.rest_client = create_async_transport(configuration)
+        self.json_codec = json_codec.get_codec(configuration.json_codec)
+        self.default_headers = {}
+        if header_name is not None:
+            self.default_headers[header_name] = header_value
+        self.cookie = cookie
+        # Set default User-Agent.
+        self.user_agent = 'OpenAPI-Generator/1.0.0/python'
+        self.client_side_validation = configuration.client_side_validation
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):  # type: ignore[override]
+        """Releases the connections held by the transport."""
+        await self.rest_client.close()
+
+    _default = None
+
+    @classmethod
+    def get_default(cls):
+        """Return new instance of AsyncApiClient.
+
+        This method returns newly created, based on default constructor,
+        object of AsyncApiClient class or returns a copy of default
+        AsyncApiClient.
+
+        :return: The AsyncApiClient object.
+        """
+        if cls._default is None:
+            cls._default = AsyncApiClient()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, default):
+        """Set default instance of AsyncApiClient.
+
+        It stores default AsyncApiClient.
+
+        :param default: object of AsyncApiClient.
+        """
+        cls._default = default
+
+    async def call_api(  # type: ignore[override]
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ) -> async_rest.RESTResponse:
+        """Makes the HTTP request (asynchronous)
+        :param method: Method to call.
+        :param url: Path to method endpoint.
+        :param header_params: Header parameters to be
+            placed in the request header.
+        :param body: Request body.
+        :param post_params dict: Request post form parameters,
+            for `application/x-www-form-urlencoded`, `multipart/form-data`.
+        :param _request_timeout: timeout setting for this request.
+        :return: RESTResponse
+        """
+
+        metrics = self.configuration.transfer_metrics
+
+        async def send(headers):
+            response = await self.rest_client.request(
+                method, url,
+                headers=headers,
+                body=body, post_params=post_params,
+                _request_timeout=_request_timeout
+            )
+            if metrics is not None:
+                metrics.track(response, method, url)
+            return response
+
+        try:
+            # perform request and return response
+            limiter = self.configuration.rate_limiter
+            if limiter is not None:
+                send = functools.partial(limiter.request_async, send, method, url)
+            breaker = self.configuration.circuit_breaker
+            if breaker is not None:
+                send = functools.partial(breaker.request_async, send, method, url)
+            policy = retry.policy_for(self.configuration.retry_policy, method, url)
+            if policy is not None:
+                send = functools.partial(policy.request_async, send, method, url)
+            flight = self.configuration.single_flight
+            if flight is not None:
+                send = functools.partial(flight.request_async, send, method, url)
+            cache = self.configuration.http_cache
+            if cache is not None:
+                response_data = await cache.request_async(
+                    send, method, url, header_params
+                )
+            else:
+                response_data = await send(header_params)
+
+        except ApiException as e:
+            raise e
+
+        return response_data
@@ -0,0 +1,249 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import io
+import ssl
+from typing import Any, Optional
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None  # type: ignore[assignment]
+
+from urllib3._collections import HTTPHeaderDict
+
+from openapi_client.exceptions import ApiException, ApiValueError
+from openapi_client.rest import serialize_body
+from openapi_client.transport import AsyncTransport, StreamingBody
+
+RESTResponseType = Any if aiohttp is None else aiohttp.ClientResponse
+
+
+class RESTResponse(io.IOBase):
+
+    def __init__(self, resp) -> None:
+        self.response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+        self.data = None
+        # coalesce.SharedResult when several callers share this response
+        self.shared = None
+        # called with (bytes received, bytes decoded) once the body has
+        # been read, see compression.TransferMetrics
+        self.on_body = None
+
+    async def read(self):
+        if self.data is None:
+            self.data = await self.response.read()
+            if self.on_body is not None:
+                self.on_body(self._received(len(self.data)), len(self.data))
+        return self.data
+
+    def _received(self, decoded):
+        # aiohttp decodes compressed bodies itself and counts the bytes it
+        # received (since aiohttp 3.12); other responses are not decoded
+        content = getattr(self.response, "content", None)
+        received = getattr(content, "total_raw_bytes", None)
+        if received is None:
+            length = self.getheader("Content-Length")
+            received = int(length) if length and length.isdigit() else decoded
+        return received
+
+    async def stream(self, chunk_size=65536):
+        """Yields the body in chunks as it arrives, or all of it at once if
+        it was already read."""
+        if self.data is not None:
+            yield self.data
+            return
+        response = self.response
+        decoded = 0
+        if aiohttp is not None and isinstance(response, aiohttp.ClientResponse):
+            try:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    decoded += len(chunk)
+                    yield chunk
+            finally:
+                response.release()
+        else:
+            async for chunk in response.iter_chunked(chunk_size):
+                decoded += len(chunk)
+                yield chunk
+        if self.on_body is not None:
+            self.on_body(self._received(decoded), decoded)
+
+    def getheaders(self):
+        """Returns a CIMultiDictProxy of the response headers."""
+        return self.response.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.response.headers.get(name, default)
+
+
+class _BufferedResponse:
+    """Minimal stand-in for `aiohttp.ClientResponse` over a complete body."""
+
+    def __init__(self, status, headers, body, reason=None) -> None:
+        self.status = status
+        self.reason = reason
+        self.headers = HTTPHeaderDict(headers)
+        self._body = bytes(body)
+
+    async def read(self):
+        return self._body
+
+    async def iter_chunked(self, n):
+        for start in range(0, len(self._body), n):
+            yield self._body[start:start + n]
+
+
+def build_response(status, headers, body, reason=None):
+    """Wraps a response produced outside aiohttp in a `RESTResponse`.
+
+    :param status: HTTP status code.
+    :param headers: response headers, as a mapping or list of pairs.
+    :param body: complete response body.
+    :param reason: HTTP reason phrase.
+    :return: RESTResponse
+    """
+    return RESTResponse(_BufferedResponse(status, headers, body, reason))
+
+
+class RESTClientObject(AsyncTransport):
+    """The default asyncio transport: a shared `aiohttp.ClientSession`."""
+
+    def __init__(self, configuration) -> None:
+        if aiohttp is None:
+            raise ImportError(
+                "The asyncio client requires aiohttp. "
+                "Install it with `pip install openapi-client[async]`."
+            )
+
+        # maxsize is number of requests to host that are allowed in parallel
+        self.maxsize = configuration.connection_pool_maxsize
+
+        self.ssl_context = ssl.create_default_context(
+            cafile=configuration.ssl_ca_cert,
+            cadata=configuration.ca_cert_data,
+        )
+        if configuration.cert_file:
+            self.ssl_context.load_cert_chain(
+                configuration.cert_file, keyfile=configuration.key_file
+            )
+
+        if not configuration.verify_ssl:
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+
+        self.proxy = configuration.proxy
+        self.proxy_headers = configuration.proxy_headers
+
+        # the session is created lazily so that it is bound to the running
+        # event loop rather than the one (if any) active at construction time
+        self.pool_manager: Optional[aiohttp.ClientSession] = None
+
+    async def close(self) -> None:
+        if self.pool_manager is not None:
+            await self.pool_manager.close()
+            self.pool_manager = None
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Execute request
+
+        :param method: http request method
+        :param url: http request url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        """
+        method = method.upper()
+        assert method in [
+            'GET',
+            'HEAD',
+            'DELETE',
+            'POST',
+            'PUT',
+            'PATCH',
+            'OPTIONS'
+        ]
+
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        headers = headers or {}
+
+        timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = aiohttp.ClientTimeout(total=_request_timeout)
+            elif (
+                    isinstance(_request_timeout, tuple)
+                    and len(_request_timeout) == 2
+                ):
+                timeout = aiohttp.ClientTimeout(
+                    sock_connect=_request_timeout[0],
+                    sock_read=_request_timeout[1]
+                )
+
+        args = {
+            "method": method,
+            "url": url,
+            "headers": headers,
+        }
+        if timeout is not None:
+            args["timeout"] = timeout
+
+        if self.proxy:
+            args["proxy"] = self.proxy
+        if self.proxy_headers:
+            args["proxy_headers"] = self.proxy_headers
+
+        data = serialize_body(method, headers, body, post_params)
+        if isinstance(data, StreamingBody):
+            data = data.async_chunks()
+        if data is not None:
+            args["data"] = data
+
+        if self.pool_manager is None:
+            self.pool_manager = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.maxsize,
+                    ssl=self.ssl_context
+                ),
+                trust_env=True,
+            )
+
+        try:
+            r = await self.pool_manager.request(**args)
+        except aiohttp.ClientSSLError as e:
+            msg = "\n".join([type(e).__name__, str(e)])
+            raise ApiException(status=0, reason=msg)
+
+        return RESTResponse(r)
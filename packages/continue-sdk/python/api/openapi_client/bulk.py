@@ -0,0 +1,163 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from openapi_client.exceptions import ApiTypeError, ApiValueError
+from openapi_client.models.get_assistant200_response import GetAssistant200Response
+from openapi_client.operations import DATA, OPERATIONS, call, call_async
+
+T = TypeVar("T")
+
+_GET_ASSISTANT = OPERATIONS["get_assistant"]
+
+
+class BulkResult(Generic[T]):
+    """Outcome of one item of a bulk call: `data` on success, `error` (the
+    exception the single call would have raised) on failure."""
+
+    __slots__ = ("key", "data", "error")
+
+    def __init__(
+        self,
+        key,
+        data: Optional[T] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        self.key = key
+        self.data = data
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def result(self) -> T:
+        """Returns `data`, or raises `error`."""
+        if self.error is not None:
+            raise self.error
+        return self.data  # type: ignore[return-value]
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return "BulkResult(%r, error=%r)" % (self.key, self.error)
+        return "BulkResult(%r, ok)" % (self.key,)
+
+
+def _slugs(items) -> List[Tuple[str, str]]:
+    """Validates the `(owner_slug, package_slug)` pairs once for the batch,
+    in place of `validate_call` on every request."""
+    slugs = []
+    for item in items:
+        try:
+            owner_slug, package_slug = item
+        except (TypeError, ValueError):
+            raise ApiValueError(
+                "expected (owner_slug, package_slug) pairs, got %r" % (item,)
+            )
+        if not isinstance(owner_slug, str) or not isinstance(package_slug, str):
+            raise ApiTypeError(
+                "owner_slug and package_slug must be str, got %r" % (item,)
+            )
+        slugs.append((owner_slug, package_slug))
+    return slugs
+
+
+def _check_options(max_concurrency, always_use_proxy, organization_id):
+    if max_concurrency < 1:
+        raise ApiValueError("max_concurrency must be at least 1")
+    for name, value in (("always_use_proxy", always_use_proxy),
+                        ("organization_id", organization_id)):
+        if value is not None and not isinstance(value, str):
+            raise ApiTypeError("%s must be str, got %r" % (name, value))
+
+
+def _arguments(pair, always_use_proxy, organization_id, _request_timeout):
+    return _GET_ASSISTANT.arguments(
+        owner_slug=pair[0],
+        package_slug=pair[1],
+        always_use_proxy=always_use_proxy,
+        organization_id=organization_id,
+        _request_timeout=_request_timeout,
+    )
+
+
+def get_assistants_bulk(
+    api,
+    items: Iterable[Sequence[str]],
+    max_concurrency: int = 8,
+    always_use_proxy: Optional[str] = None,
+    organization_id: Optional[str] = None,
+    _request_timeout: Any = None,
+) -> List[BulkResult[GetAssistant200Response]]:
+    """Fetches many assistants with `DefaultApi.get_assistant`, in parallel.
+
+    Requests run on up to `max_concurrency` threads over the client's
+    connection pool (keep it at most `Configuration.connection_pool_maxsize`
+    to avoid waiting for connections). Arguments are validated once for the
+    batch. A failed item does not fail the batch: each result carries the
+    assistant or the exception.
+
+    :param api: a `DefaultApi`.
+    :param items: ``(owner_slug, package_slug)`` pairs.
+    :return: one `BulkResult` per item, in input order, keyed by its pair.
+    """
+    slugs = _slugs(items)
+    _check_options(max_concurrency, always_use_proxy, organization_id)
+    api_client = api.api_client
+
+    def fetch(pair):
+        try:
+            data = call(api_client, _GET_ASSISTANT, DATA, _arguments(
+                pair, always_use_proxy, organization_id, _request_timeout
+            ))
+        except Exception as e:
+            return BulkResult(pair, error=e)
+        return BulkResult(pair, data=data)
+
+    workers = min(max_concurrency, len(slugs))
+    if workers <= 1:
+        return [fetch(pair) for pair in slugs]
+    with ThreadPoolExecutor(workers, thread_name_prefix="openapi-client-bulk") as pool:
+        return list(pool.map(fetch, slugs))
+
+
+async def get_assistants_bulk_async(
+    api,
+    items: Iterable[Sequence[str]],
+    max_concurrency: int = 32,
+    always_use_proxy: Optional[str] = None,
+    organization_id: Optional[str] = None,
+    _request_timeout: Any = None,
+) -> List[BulkResult[GetAssistant200Response]]:
+    """Asyncio counterpart of `get_assistants_bulk` for `AsyncDefaultApi`;
+    at most `max_concurrency` requests are in flight at once."""
+    slugs = _slugs(items)
+    _check_options(max_concurrency, always_use_proxy, organization_id)
+    api_client = api.api_client
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(pair):
+        async with semaphore:
+            try:
+                data = await call_async(api_client, _GET_ASSISTANT, DATA, _arguments(
+                    pair, always_use_proxy, organization_id, _request_timeout
+                ))
+            except Exception as e:
+                return BulkResult(pair, error=e)
+            return BulkResult(pair, data=data)
+
+    return list(await asyncio.gather(*[fetch(pair) for pair in slugs]))
@@ -0,0 +1,498 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import asyncio
+import email.utils
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from openapi_client import rest
+
+# request headers that identify the caller; responses are never shared
+# between identities
+IDENTITY_HEADERS = ("Authorization", "Cookie")
+# headers of a 304 response that must not replace the stored ones
+_NOT_UPDATED = frozenset(("content-length", "content-encoding", "transfer-encoding"))
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parses a Cache-Control header into a dict of lower-cased directives.
+
+    Directives without an argument map to None.
+    """
+    directives: Dict[str, Optional[str]] = {}
+    if not value:
+        return directives
+    for part in value.split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip().strip('"') or None
+    return directives
+
+
+def _seconds(directives, name):
+    try:
+        return max(int(directives[name]), 0)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _http_date(value):
+    if not value:
+        return None
+    try:
+        parsed = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed.timestamp() if parsed is not None else None
+
+
+def _header(headers, name, default=None):
+    """Case-insensitive lookup in a dict or a list of pairs."""
+    name = name.lower()
+    items = headers.items() if hasattr(headers, "items") else headers
+    for key, value in items:
+        if key.lower() == name:
+            return value
+    return default
+
+
+def request_key(method: str, url: str, headers, extra_headers=()) -> str:
+    """Digest of the request line, the caller's credentials and
+    `extra_headers`; identical requests of the same user share a key."""
+    digest = hashlib.sha256()
+    digest.update(method.upper().encode("utf-8"))
+    digest.update(b"\0" + url.encode("utf-8"))
+    for name in IDENTITY_HEADERS + tuple(extra_headers):
+        digest.update(b"\0" + str(_header(headers or {}, name, "")).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class CacheEntry:
+    """A stored response and the request headers it was selected by."""
+
+    __slots__ = ("status", "headers", "body", "stored_at", "vary")
+
+    def __init__(
+        self,
+        status: int,
+        headers: List[Tuple[str, str]],
+        body: bytes,
+        stored_at: float,
+        vary: Dict[str, Optional[str]],
+    ) -> None:
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+        self.vary = vary
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers) + 64
+
+    def header(self, name, default=None):
+        return _header(self.headers, name, default)
+
+    def freshness_lifetime(self) -> float:
+        directives = parse_cache_control(self.header("Cache-Control"))
+        if "no-cache" in directives:
+            return 0
+        max_age = _seconds(directives, "max-age")
+        if max_age is not None:
+            return max_age
+        expires = _http_date(self.header("Expires"))
+        if expires is not None:
+            date = _http_date(self.header("Date")) or self.stored_at
+            return max(expires - date, 0)
+        return 0
+
+    def stale_while_revalidate(self) -> float:
+        directives = parse_cache_control(self.header("Cache-Control"))
+        if "must-revalidate" in directives or "no-cache" in directives:
+            return 0
+        return _seconds(directives, "stale-while-revalidate") or 0
+
+    def age(self, now: float) -> float:
+        try:
+            initial = max(int(self.header("Age", 0)), 0)
+        except ValueError:
+            initial = 0
+        return initial + max(now - self.stored_at, 0)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "headers": self.headers,
+            "stored_at": self.stored_at,
+            "vary": self.vary,
+        }
+
+
+class CacheLookup:
+    """Outcome of `HTTPCache.lookup` for one GET request.
+
+    `headers` are the request headers to send on a miss, including
+    `If-None-Match` / `If-Modified-Since` when a stale entry can be
+    revalidated.
+    """
+
+    __slots__ = ("key", "entry", "headers", "fresh", "serve_stale")
+
+    def __init__(self, key, entry, headers, fresh, serve_stale) -> None:
+        self.key = key
+        self.entry = entry
+        self.headers = headers
+        self.fresh = fresh
+        self.serve_stale = serve_stale
+
+
+class HTTPCache:
+    """Private HTTP cache for GET responses (RFC 9111).
+
+    Set it on `Configuration.http_cache` to let `ApiClient` and
+    `AsyncApiClient` reuse Hub responses::
+
+        configuration.http_cache = HTTPCache(max_bytes=64 * 1024 * 1024)
+
+    Successful responses carrying `Cache-Control: max-age`, `Expires`, an
+    `ETag` or a `Last-Modified` header are stored. Fresh entries are served
+    without a request; stale ones are revalidated with a conditional
+    request, and a 304 refreshes the entry. Within `stale-while-revalidate`
+    the stale entry is returned at once and revalidated in the background.
+    `no-store` in the request or the response bypasses the cache, and
+    `no-cache` in the request forces revalidation.
+
+    Entries are keyed by URL (which carries query parameters such as
+    `organizationId`) and a digest of the caller's credentials, so
+    responses are never shared between users, and honour `Vary`.
+
+    :param max_bytes: size of the in-memory LRU, counting bodies and
+        headers; least recently used entries are evicted first.
+    :param directory: optional directory where entries are persisted, so
+        that they survive restarts. Entries evicted from memory are reloaded
+        from it.
+    :param clock: returns the current time in seconds since the epoch.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 32 * 1024 * 1024,
+        directory: Optional[str] = None,
+        clock=time.time,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.directory = os.path.expanduser(directory) if directory else None
+        self.clock = clock
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._revalidating: set = set()
+        self._tasks: set = set()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stale_served = 0
+
+    # -- storage ------------------------------------------------------------
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".entry")
+
+    def _get(self, key) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        entry = CacheEntry(
+            meta["status"],
+            [tuple(pair) for pair in meta["headers"]],
+            body,
+            meta["stored_at"],
+            meta["vary"],
+        )
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key, entry):
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            if entry.size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+
+    def _put(self, key, entry):
+        self._remember(key, entry)
+        if self.directory is None:
+            return
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json.dumps(entry.to_json()).encode("utf-8") + b"\n")
+                f.write(entry.body)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+    def _delete(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= entry.size
+        if self.directory is not None:
+            try:
+                os.unlink(self._path(key))
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Drops every entry, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".entry"):
+                    try:
+                        os.unlink(os.path.join(self.directory, name))
+                    except OSError:
+                        pass
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns the cache counters and the memory footprint."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+                "stale_served": self.stale_served,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    # -- protocol -----------------------------------------------------------
+
+    def lookup(self, method, url, headers) -> Optional[CacheLookup]:
+        """Selects the stored response for a request.
+
+        :return: None when the request must bypass the cache.
+        """
+        if method.upper() != "GET":
+            return None
+        headers = dict(headers or {})
+        request_directives = parse_cache_control(_header(headers, "Cache-Control"))
+        if "no-store" in request_directives:
+            return None
+
+        key = request_key(method, url, headers)
+        entry = self._get(key)
+        if entry is not None and any(
+            _header(headers, name) != value for name, value in entry.vary.items()
+        ):
+            entry = None
+        if entry is None:
+            self._count("misses")
+            return CacheLookup(key, None, headers, False, False)
+
+        now = self.clock()
+        age = entry.age(now)
+        lifetime = entry.freshness_lifetime()
+        fresh = "no-cache" not in request_directives and age < lifetime
+        serve_stale = (
+            not fresh
+            and "no-cache" not in request_directives
+            and age < lifetime + entry.stale_while_revalidate()
+        )
+        if fresh:
+            self._count("hits")
+            return CacheLookup(key, entry, headers, True, False)
+
+        conditional = dict(headers)
+        etag = entry.header("ETag")
+        last_modified = entry.header("Last-Modified")
+        if etag:
+            conditional["If-None-Match"] = etag
+        if last_modified:
+            conditional["If-Modified-Since"] = last_modified
+        if serve_stale:
+            self._count("stale_served")
+        else:
+            self._count("misses")
+        return CacheLookup(key, entry, conditional, False, serve_stale)
+
+    def store(self, lookup, status, headers, body) -> Optional[CacheEntry]:
+        """Records the response to a looked-up request.
+
+        :return: the entry to answer from on a 304 (revalidated), otherwise
+            None, meaning the response itself is returned.
+        """
+        headers = [(str(k), str(v)) for k, v in
+                   (headers.items() if hasattr(headers, "items") else headers)]
+        now = self.clock()
+
+        if status == 304 and lookup.entry is not None:
+            entry = lookup.entry
+            updated = {k.lower() for k, _ in headers if k.lower() not in _NOT_UPDATED}
+            merged = [(k, v) for k, v in entry.headers if k.lower() not in updated]
+            merged.extend((k, v) for k, v in headers if k.lower() not in _NOT_UPDATED)
+            entry = CacheEntry(entry.status, merged, entry.body, now, entry.vary)
+            self._count("revalidated")
+            self._put(lookup.key, entry)
+            return entry
+
+        directives = parse_cache_control(_header(headers, "Cache-Control"))
+        vary = _header(headers, "Vary")
+        if status != 200 or "no-store" in directives or (vary or "").strip() == "*":
+            if status < 500:
+                self._delete(lookup.key)
+            return None
+
+        if _header(headers, "Content-Encoding"):
+            # the body is stored decoded
+            headers = [(k, v) for k, v in headers
+                       if k.lower() not in ("content-encoding", "content-length")]
+        entry = CacheEntry(status, headers, bytes(body), now, {
+            name.strip(): _header(lookup.headers, name.strip())
+            for name in (vary or "").split(",") if name.strip()
+        })
+        if (
+            entry.freshness_lifetime() > 0
+            or entry.header("ETag")
+            or entry.header("Last-Modified")
+        ):
+            self._put(lookup.key, entry)
+        return None
+
+    def _cached_headers(self, entry):
+        now = self.clock()
+        headers = [(k, v) for k, v in entry.headers if k.lower() != "age"]
+        headers.append(("Age", str(int(entry.age(now)))))
+        return headers
+
+    # -- clients ------------------------------------------------------------
+
+    def request(self, send, method, url, headers):
+        """Answers a request from the cache or through `send`.
+
+        :param send: callable taking the request headers and returning a
+            `rest.RESTResponse`.
+        """
+        lookup = self.lookup(method, url, headers)
+        if lookup is None:
+            return send(headers)
+        if lookup.fresh or lookup.serve_stale:
+            if lookup.serve_stale and self._start_revalidation(lookup.key):
+                threading.Thread(
+                    target=self._revalidate, args=(send, lookup), daemon=True
+                ).start()
+            return rest.build_response(
+                lookup.entry.status, self._cached_headers(lookup.entry), lookup.entry.body
+            )
+        return self._fetch(send, lookup)
+
+    def _fetch(self, send, lookup):
+        response = send(lookup.headers)
+        body = response.read()
+        entry = self.store(lookup, response.status, response.getheaders(), body)
+        if entry is None:
+            return response
+        return rest.build_response(entry.status, self._cached_headers(entry), entry.body)
+
+    def _revalidate(self, send, lookup):
+        try:
+            self._fetch(send, lookup)
+        except Exception:
+            # the stale entry was already served; the next request retries
+            pass
+        finally:
+            self._finish_revalidation(lookup.key)
+
+    async def request_async(self, send, method, url, headers):
+        """Asyncio counterpart of `request`; `send` is a coroutine function
+        returning an `async_rest.RESTResponse`."""
+        from openapi_client import async_rest
+
+        lookup = self.lookup(method, url, headers)
+        if lookup is None:
+            return await send(headers)
+        if lookup.fresh or lookup.serve_stale:
+            if lookup.serve_stale and self._start_revalidation(lookup.key):
+                task = asyncio.ensure_future(self._revalidate_async(send, lookup))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            return async_rest.build_response(
+                lookup.entry.status, self._cached_headers(lookup.entry), lookup.entry.body
+            )
+        return await self._fetch_async(send, lookup)
+
+    async def _fetch_async(self, send, lookup):
+        from openapi_client import async_rest
+
+        response = await send(lookup.headers)
+        body = await response.read()
+        entry = self.store(lookup, response.status, response.getheaders(), body)
+        if entry is None:
+            return response
+        return async_rest.build_response(
+            entry.status, self._cached_headers(entry), entry.body
+        )
+
+    async def _revalidate_async(self, send, lookup):
+        try:
+            await self._fetch_async(send, lookup)
+        except Exception:
+            pass
+        finally:
+            self._finish_revalidation(lookup.key)
+
+    def _start_revalidation(self, key):
+        with self._lock:
+            if key in self._revalidating:
+                return False
+            self._revalidating.add(key)
+            return True
+
+    def _finish_revalidation(self, key):
+        with self._lock:
+            self._revalidating.discard(key)
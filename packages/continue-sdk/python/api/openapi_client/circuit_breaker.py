@@ -0,0 +1,262 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+from urllib.parse import urlsplit
+
+from openapi_client.exceptions import CircuitOpenException
+from openapi_client.retry import transport_errors
+from openapi_client.routes import match_operation
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+FAILURE_STATUSES = frozenset((500, 502, 503, 504))
+
+
+class _Circuit:
+
+    __slots__ = ("state", "failures", "opened_at", "reopen_after", "probes",
+                 "successes", "rejected")
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.reopen_after = 0.0
+        self.probes = 0
+        self.successes = 0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """Fails requests fast while a host keeps failing.
+
+    Set it on `Configuration.circuit_breaker`::
+
+        configuration.circuit_breaker = CircuitBreaker(failure_threshold=5)
+
+    Each host (and, with `per_operation`, each operation on it) has a
+    circuit. A circuit is *closed* while requests succeed; after
+    `failure_threshold` consecutive failures (a status in
+    `failure_statuses`, or a connection error or timeout) it *opens*, and
+    requests raise `CircuitOpenException` without touching the network.
+    After `recovery_timeout` seconds, randomly stretched by up to
+    `recovery_jitter` so that clients do not probe in lockstep, the
+    circuit turns *half-open*: at most `half_open_max_calls` requests are let
+    through as probes while the others keep failing fast. The circuit closes
+    after `success_threshold` successful probes and reopens on a failed one.
+
+    Client errors such as 4xx responses count as successes: the host is
+    answering.
+
+    :param on_state_change: called with ``(key, old_state, new_state)``.
+    :param clock: monotonic clock, in seconds.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        recovery_jitter: float = 0.1,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+        per_operation: bool = False,
+        failure_statuses: FrozenSet[int] = FAILURE_STATUSES,
+        failure_exceptions: Optional[Tuple[type, ...]] = None,
+        on_state_change: Optional[Callable[[Tuple[str, ...], str, str], Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.recovery_jitter = recovery_jitter
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self.per_operation = per_operation
+        self.failure_statuses = frozenset(failure_statuses)
+        self.failure_exceptions = failure_exceptions
+        self.on_state_change = on_state_change
+        self.clock = clock
+        self._circuits: Dict[Tuple[str, ...], _Circuit] = {}
+        self._lock = threading.Lock()
+        self._random = random.Random()
+
+    def key(self, method: str, url: str) -> Tuple[str, ...]:
+        """Returns the circuit key of a request: ``(host,)`` or
+        ``(host, operation)``."""
+        host = urlsplit(url).netloc
+        if self.per_operation:
+            return (host, match_operation(method, url) or method.upper())
+        return (host,)
+
+    def state(self, host: str, operation: Optional[str] = None) -> str:
+        """Returns the state of a circuit, e.g. for health checks."""
+        key = (host, operation) if operation is not None else (host,)
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return CLOSED
+            self._refresh(key, circuit)
+            return circuit.state
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Returns every circuit's state and counters, keyed by
+        ``"host"`` or ``"host operation"``."""
+        with self._lock:
+            now = self.clock()
+            result = {}
+            for key, circuit in self._circuits.items():
+                self._refresh(key, circuit)
+                result[" ".join(key)] = {
+                    "state": circuit.state,
+                    "failures": circuit.failures,
+                    "rejected": circuit.rejected,
+                    "retry_after": (
+                        max(circuit.reopen_after - now, 0.0)
+                        if circuit.state == OPEN else None
+                    ),
+                }
+            return result
+
+    def reset(self) -> None:
+        """Closes every circuit."""
+        with self._lock:
+            self._circuits.clear()
+
+    # -- state machine (callers hold the lock) -------------------------------
+
+    def _transition(self, key, circuit, state):
+        old, circuit.state = circuit.state, state
+        if state == OPEN:
+            circuit.opened_at = self.clock()
+            stretch = 1 + self._random.uniform(0, self.recovery_jitter)
+            circuit.reopen_after = circuit.opened_at + self.recovery_timeout * stretch
+        circuit.probes = 0
+        circuit.successes = 0
+        if state == CLOSED:
+            circuit.failures = 0
+        if self.on_state_change is not None and old != state:
+            self.on_state_change(key, old, state)
+
+    def _refresh(self, key, circuit):
+        if circuit.state == OPEN and self.clock() >= circuit.reopen_after:
+            self._transition(key, circuit, HALF_OPEN)
+
+    def _admit(self, key):
+        """Returns whether the request counts as a half-open probe, or
+        raises `CircuitOpenException`."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                circuit = self._circuits[key] = _Circuit()
+            self._refresh(key, circuit)
+            if circuit.state == CLOSED:
+                return False
+            if circuit.state == HALF_OPEN and circuit.probes < self.half_open_max_calls:
+                circuit.probes += 1
+                return True
+            circuit.rejected += 1
+            retry_after = max(circuit.reopen_after - self.clock(), 0.0)
+        raise CircuitOpenException(
+            host=key[0],
+            operation=key[1] if len(key) > 1 else None,
+            retry_after=retry_after,
+        )
+
+    def _record(self, key, probe, failed):
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                # reset() while the request was in flight
+                return
+            if probe:
+                circuit.probes = max(circuit.probes - 1, 0)
+                if circuit.state != HALF_OPEN:
+                    return
+                if failed:
+                    self._transition(key, circuit, OPEN)
+                    return
+                circuit.successes += 1
+                if circuit.successes >= self.success_threshold:
+                    self._transition(key, circuit, CLOSED)
+                return
+            if circuit.state != CLOSED:
+                return
+            if failed:
+                circuit.failures += 1
+                if circuit.failures >= self.failure_threshold:
+                    self._transition(key, circuit, OPEN)
+            else:
+                circuit.failures = 0
+
+    def _release(self, key, probe):
+        """Gives back a probe slot after an error that says nothing about
+        the host's health."""
+        if probe:
+            with self._lock:
+                circuit = self._circuits.get(key)
+                if circuit is not None:
+                    circuit.probes = max(circuit.probes - 1, 0)
+
+    def _is_failure(self, error):
+        if self.failure_exceptions is None:
+            self.failure_exceptions = transport_errors()
+        return isinstance(error, self.failure_exceptions)
+
+    # -- clients -------------------------------------------------------------
+
+    def request(self, send, method, url, headers):
+        """Sends the request through `send` unless the circuit is open.
+
+        :param send: callable taking the request headers and returning a
+            `rest.RESTResponse`.
+        """
+        key = self.key(method, url)
+        probe = self._admit(key)
+        try:
+            response = send(headers)
+        except Exception as e:
+            if self._is_failure(e):
+                self._record(key, probe, True)
+            else:
+                self._release(key, probe)
+            raise
+        except BaseException:
+            self._release(key, probe)
+            raise
+        self._record(key, probe, response.status in self.failure_statuses)
+        return response
+
+    async def request_async(self, send, method, url, headers):
+        """Asyncio counterpart of `request`; `send` is a coroutine function
+        returning an `async_rest.RESTResponse`."""
+        key = self.key(method, url)
+        probe = self._admit(key)
+        try:
+            response = await send(headers)
+        except Exception as e:
+            if self._is_failure(e):
+                self._record(key, probe, True)
+            else:
+                self._release(key, probe)
+            raise
+        except BaseException:
+            self._release(key, probe)
+            raise
+        self._record(key, probe, response.status in self.failure_statuses)
+        return response
@@ -0,0 +1,178 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Any, Dict
+
+from openapi_client.cache import request_key
+from openapi_client.routes import match_operation
+
+# conditional requests only coalesce with requests validating the same entry
+_KEY_HEADERS = ("Accept", "If-None-Match", "If-Modified-Since", "Range")
+
+# result of an asyncio call whose leader was cancelled before it completed
+_ABANDONED = object()
+
+
+class SharedResult:
+    """Deserialized results of a response shared by coalesced callers.
+
+    `ApiClient.response_deserialize` stores the decoded body here, per
+    response type, so that it is computed once for every caller.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._results: Dict[Any, Any] = {}
+
+    def get(self, key, compute):
+        with self._lock:
+            if key not in self._results:
+                self._results[key] = compute()
+            return self._results[key]
+
+
+class _Call:
+
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesces identical concurrent GET requests into one.
+
+    Set it on `Configuration.single_flight`::
+
+        configuration.single_flight = SingleFlight()
+
+    While a GET is in flight, callers issuing the same request (same URL,
+    credentials and `Accept`) wait for it and receive the same response,
+    whose body is read once, and the same deserialized model: treat results
+    as read-only when coalescing is enabled. Errors, including `ApiException`
+    for error statuses, are shared as well. Requests are only coalesced with
+    requests of the same kind of client: the synchronous client shares
+    across threads, `AsyncApiClient` across tasks of one event loop. When
+    the task sending a request is cancelled, the tasks waiting for it are
+    not: one of them sends the request again for the others.
+
+    Per-operation counters are returned by `snapshot()`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._futures: Dict[Any, "asyncio.Future"] = {}
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"requests": 0, "coalesced": 0}
+        )
+
+    def _record(self, method, url, coalesced):
+        operation = match_operation(method, url) or method.upper() + " " + url
+        counters = self._counters[operation]
+        counters["requests"] += 1
+        if coalesced:
+            counters["coalesced"] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """Returns ``{operation: {"requests": n, "coalesced": m}}``, where
+        `coalesced` counts the calls answered by another call's request."""
+        with self._lock:
+            return {k: dict(v) for k, v in self._counters.items()}
+
+    def request(self, send, method, url, headers):
+        """Sends the request through `send`, or joins an identical one in
+        flight.
+
+        :param send: callable taking the request headers and returning a
+            `rest.RESTResponse`.
+        """
+        if method.upper() != "GET":
+            return send(headers)
+        key = request_key(method, url, headers, _KEY_HEADERS)
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            self._record(method, url, not leader)
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.response
+
+        try:
+            response = send(headers)
+            response.read()
+            response.shared = SharedResult()
+            call.response = response
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return response
+
+    async def request_async(self, send, method, url, headers):
+        """Asyncio counterpart of `request`; `send` is a coroutine function
+        returning an `async_rest.RESTResponse`."""
+        if method.upper() != "GET":
+            return await send(headers)
+        loop = asyncio.get_running_loop()
+        key = (loop, request_key(method, url, headers, _KEY_HEADERS))
+        recorded = False
+        while True:
+            with self._lock:
+                future = self._futures.get(key)
+                leader = future is None
+                if leader:
+                    future = self._futures[key] = loop.create_future()
+                if not recorded:
+                    self._record(method, url, not leader)
+                    recorded = True
+            if leader:
+                break
+            response = await asyncio.shield(future)
+            if response is not _ABANDONED:
+                return response
+            # the leader was cancelled: send the request again, or join
+            # the waiting caller that did
+
+        try:
+            response = await send(headers)
+            await response.read()
+            response.shared = SharedResult()
+            future.set_result(response)
+        except asyncio.CancelledError:
+            # the cancellation is the leader's own, not the other callers'
+            future.set_result(_ABANDONED)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # mark the exception retrieved when nobody joined the call
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                del self._futures[key]
+        return response
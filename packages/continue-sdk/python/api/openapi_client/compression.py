@@ -0,0 +1,86 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import threading
+from typing import Any, Dict, Optional
+
+from urllib3.util.request import ACCEPT_ENCODING as _URLLIB3_ENCODINGS
+
+from openapi_client.routes import match_operation
+
+# the content codings urllib3 can decode here: gzip and deflate, plus br
+# with brotli (or brotlicffi) and zstd with Python 3.14 or backports.zstd
+ACCEPT_ENCODING = ", ".join(_URLLIB3_ENCODINGS.split(","))
+
+
+def content_encoding(response) -> Optional[str]:
+    """The `Content-Encoding` of a response, or None if its body is sent
+    as is."""
+    encoding = response.getheader("Content-Encoding")
+    if encoding is None:
+        return None
+    encoding = encoding.strip().lower()
+    return None if encoding in ("", "identity") else encoding
+
+
+class TransferMetrics:
+    """Response body sizes per operation: bytes received and bytes once
+    decoded, which differ for compressed responses.
+
+    Shared by every client of a configuration through
+    `Configuration.transfer_metrics`; read the counters atomically with
+    `snapshot()`. Only bodies read to the end are counted.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._operations: Dict[str, Dict[str, Any]] = {}
+
+    def track(self, response, method: str, url: str) -> None:
+        """Counts the body of `response` (a `rest.RESTResponse`) once it
+        has been read."""
+        operation = match_operation(method, url) or method.upper()
+        response.on_body = lambda received, decoded: self.record(
+            operation, content_encoding(response), received, decoded
+        )
+
+    def record(self, operation: str, encoding: Optional[str], received: int, decoded: int) -> None:
+        with self._lock:
+            counters = self._operations.get(operation)
+            if counters is None:
+                counters = self._operations[operation] = {
+                    "responses": 0,
+                    "compressed_responses": 0,
+                    "received_bytes": 0,
+                    "decoded_bytes": 0,
+                    "encodings": {},
+                }
+            counters["responses"] += 1
+            counters["received_bytes"] += received
+            counters["decoded_bytes"] += decoded
+            if encoding is not None:
+                counters["compressed_responses"] += 1
+                counters["encodings"][encoding] = counters["encodings"].get(encoding, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Returns a consistent copy of the counters, keyed by operation
+        id, with the overall `ratio` of decoded to received bytes."""
+        with self._lock:
+            result = {}
+            for operation, counters in self._operations.items():
+                copied = dict(counters, encodings=dict(counters["encodings"]))
+                received = counters["received_bytes"]
+                copied["ratio"] = counters["decoded_bytes"] / received if received else None
+                result[operation] = copied
+            return result
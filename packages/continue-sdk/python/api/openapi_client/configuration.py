@@ -207,6 +207,20 @@ class Configuration:
         self.temp_folder_path = None
         """Temp file folder for downloading files
         """
+        self.download_buffer_size = 1 << 20
+        """Bytes read from the response and written to disk at a time when
+           downloading files (see `download.FileSink`).
+        """
+        self.upload_chunk_size = 1 << 16
+        """Bytes per chunk of request bodies sent as they are produced:
+           files read for `multipart/form-data` bodies (see
+           `multipart.MultipartEncoder`) and JSON bodies with
+           `stream_request_bodies`.
+        """
+        self.upload_progress: Any = None
+        """Callable receiving ``(bytes sent, total bytes or None)`` as
+           `multipart/form-data` bodies are sent. None reports nothing.
+        """
         # Authentication Settings
         self.api_key = {}
         if api_key:
@@ -288,6 +302,60 @@ class Configuration:
            cpu_count * 5 is used as default value to increase performance.
         """
 
+        self.transport: Any = None
+        """Transport used by ApiClient: a registered name ("urllib3",
+           "http2"), a factory taking this configuration, or a
+           `transport.Transport` instance such as `inprocess.WSGITransport`.
+           None selects urllib3.
+        """
+        self.async_transport: Any = None
+        """Transport used by AsyncApiClient: a registered name ("aiohttp",
+           "http2"), a factory, or a `transport.AsyncTransport` instance.
+           None selects aiohttp.
+        """
+
+        self.http2_max_connections: Optional[int] = None
+        """Connections the "http2" transport may open. HTTP/2 multiplexes
+           concurrent requests to a host over one connection, so more are
+           only opened when the server caps its streams. None falls back to
+           `connection_pool_maxsize`.
+        """
+        self.http2_max_concurrent_streams: Optional[int] = 100
+        """Requests the "http2" transport keeps in flight at once; further
+           callers wait for a stream to finish. None disables the limit.
+        """
+        self.http2_prior_knowledge = False
+        """Speak HTTP/2 without ALPN negotiation. Required for cleartext
+           (h2c) servers, e.g. a local stand-in Hub.
+        """
+
+        self.http_cache: Any = None
+        """`cache.HTTPCache` answering GET requests from stored responses,
+           shared by every client using this configuration. None disables
+           caching.
+        """
+        self.retry_policy: Any = None
+        """`retry.RetryPolicy` applied to every request, or a dict mapping
+           operation ids to policies (None disables retries for that
+           operation; the "default" key covers the others). This is on top
+           of the connection-level `retries` handled by urllib3.
+        """
+        self.rate_limiter: Any = None
+        """`rate_limit.RateLimiter` throttling the requests sent to the
+           network, shared by every client using this configuration. None
+           disables it.
+        """
+        self.circuit_breaker: Any = None
+        """`circuit_breaker.CircuitBreaker` failing requests fast while a
+           host keeps failing, shared by every client using this
+           configuration. None disables it.
+        """
+        self.single_flight: Any = None
+        """`coalesce.SingleFlight` merging identical concurrent GET requests
+           into one, shared by every client using this configuration. None
+           sends each request.
+        """
+
         self.proxy: Optional[str] = None
         """Proxy URL
         """
@@ -302,6 +370,11 @@ class Configuration:
         """
         # Enable client side validation
         self.client_side_validation = True
+        """Validate the arguments of API methods, as pydantic's
+           `validate_call` does. When off, arguments are only bound to the
+           method's parameters and sent as given. Read by API clients when
+           they are created.
+        """
 
         self.socket_options = None
         """Options to pass down to the underlying urllib3 socket
@@ -315,15 +388,81 @@ class Configuration:
         """date format
         """
 
+        self.json_codec: Any = None
+        """JSON codec for request bodies and responses: "json", "orjson",
+           "msgspec", a `json_codec.JSONCodec`, or None for msgspec if it
+           is installed and json otherwise (see `json_codec.default_codec`).
+        """
+
+        self.compression = True
+        """Ask for compressed responses with `Accept-Encoding`: gzip and
+           deflate, plus br and zstd when urllib3 can decode them (see
+           `compression.ACCEPT_ENCODING`). Bodies are decoded a chunk at a
+           time as they are read. Asyncio clients leave the codings to
+           aiohttp; with compression off they ask for `identity`.
+        """
+        self.transfer_metrics: Any = None
+        """`compression.TransferMetrics` counting, per operation, the bytes
+           received and decoded by the clients using this configuration.
+           None counts nothing. Asyncio clients count compressed bytes with
+           aiohttp 3.12 or later, and the `Content-Length` before.
+        """
+
+        self.stream_request_bodies = False
+        """Encode JSON request bodies while they are sent, with chunked
+           transfer encoding, instead of into one string beforehand (see
+           `json_codec.JSONStream`). Saves memory and time to first byte on
+           large bodies, such as `sync_secrets` for big organizations.
+        """
+
+        self.retain_raw_data = False
+        """Keep the response body in `ApiResponse.raw_data`. Off by default:
+           once deserialized, a large body is only kept as models.
+        """
+
+        self.trusted_responses = False
+        """Build response models without validating them, for payloads from
+           a Hub that is trusted to follow the schema. Only the shape of the
+           payload is checked: properties, nulls and scalar types, but not
+           the contents of free-form objects such as `config`. Payloads
+           failing the check are validated as usual.
+        """
+
+        self.trusted_responses_validate_one_in = 100
+        """With `trusted_responses`, fully validate the first response of
+           each response type and then one in N, so that schema drift still
+           raises; 0 never validates.
+        """
+
+        self.lazy_models = False
+        """Keep heavy response fields, such as assistants' `config` and
+           `raw_yaml`, as slices of the response body that are only decoded
+           when read (see `lazy.LAZY_FIELDS`). Requires msgspec.
+        """
+
     def __deepcopy__(self, memo:  Dict[int, Any]) -> Self:
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k not in ('logger', 'logger_file_handler'):
+            if k not in ('logger', 'logger_file_handler', 'transport', 'async_transport',
+                         'http_cache', 'single_flight', 'retry_policy',
+                         'circuit_breaker', 'rate_limiter', 'json_codec',
+                         'transfer_metrics'):
                 setattr(result, k, copy.deepcopy(v, memo))
         # shallow copy of loggers
         result.logger = copy.copy(self.logger)
+        # transports own connections and caches own entries; both are
+        # shared, not copied
+        result.transport = self.transport
+        result.async_transport = self.async_transport
+        result.http_cache = self.http_cache
+        result.single_flight = self.single_flight
+        result.retry_policy = self.retry_policy
+        result.circuit_breaker = self.circuit_breaker
+        result.rate_limiter = self.rate_limiter
+        result.json_codec = self.json_codec
+        result.transfer_metrics = self.transfer_metrics
         # use setters to configure loggers
         result.logger_file = self.logger_file
         result.debug = self.debug
@@ -0,0 +1,424 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import itertools
+import json
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+# type string grammar: Name | List[T] | Dict[K, T] | Optional[T]
+_CONTAINERS = ("List", "Dict", "Optional")
+
+_object_setattr = object.__setattr__
+
+
+def parse_type(type_string: str) -> Tuple:
+    """Parses a response type string such as ``"List[ListAssistants200ResponseInner]"``.
+
+    :return: ``("list", node)``, ``("dict", node)``, ``("optional", node)``
+        or ``("name", name)``.
+    """
+    node, rest = _parse(type_string.replace(" ", ""))
+    if rest:
+        raise ValueError("Malformed type definition: %r" % type_string)
+    return node
+
+
+def _parse(text):
+    bracket = text.find("[")
+    head = text if bracket < 0 else text[:bracket]
+    end = min((i for i in (text.find(","), text.find("]")) if i >= 0), default=len(text))
+    if bracket < 0 or bracket > end or head not in _CONTAINERS:
+        return ("name", text[:end]), text[end:]
+    args = []
+    text = text[bracket + 1:]
+    while True:
+        node, text = _parse(text)
+        args.append(node)
+        if not text:
+            raise ValueError("Malformed type definition: missing ']'")
+        separator, text = text[0], text[1:]
+        if separator == "]":
+            break
+    if head == "Dict":
+        if len(args) != 2:
+            raise ValueError("Malformed Dict type definition")
+        return ("dict", args[1]), text
+    if len(args) != 1:
+        raise ValueError("Malformed %s type definition" % head)
+    return ("list" if head == "List" else "optional", args[0]), text
+
+
+def _is_model(klass):
+    return isinstance(klass, type) and issubclass(klass, BaseModel) and hasattr(klass, "from_dict")
+
+
+class _FieldsSetFixer:
+    """Marks every field of the models in a validated value as set.
+
+    Generated `from_dict` methods pass every property to `model_validate`,
+    so their models report all fields in `model_fields_set`, which decides
+    whether `to_dict` emits nullable fields as null; models validated
+    straight from JSON only report the keys present in the payload.
+    """
+
+    def __init__(self) -> None:
+        self._models: Dict[type, Optional[Callable[[Any], None]]] = {}
+
+    def for_type(self, tp) -> Optional[Callable[[Any], None]]:
+        """Returns a callable fixing values of type `tp`, or None when `tp`
+        holds no models."""
+        if _is_model(tp):
+            return self._for_model(tp)
+        args = [a for a in get_args(tp) if a is not type(None)]
+        origin = get_origin(tp)
+        if origin in (list, List, tuple, set, frozenset):
+            fix = self.for_type(args[0]) if args else None
+            if fix is None:
+                return None
+
+            def fix_items(value):
+                if isinstance(value, (list, tuple, set, frozenset)):
+                    for item in value:
+                        fix(item)
+            return fix_items
+        if origin in (dict, Dict):
+            fix = self.for_type(args[1]) if len(args) == 2 else None
+            if fix is None:
+                return None
+
+            def fix_values(value):
+                if isinstance(value, dict):
+                    for item in value.values():
+                        fix(item)
+            return fix_values
+        if origin is Union:
+            fixes = [(a, self.for_type(a)) for a in args]
+            fixes = [(a, f) for a, f in fixes if f is not None]
+            if not fixes:
+                return None
+
+            def fix_union(value):
+                for arg, fix in fixes:
+                    if not _is_model(arg) or isinstance(value, arg):
+                        fix(value)
+                        return
+            return fix_union
+        return None
+
+    def _for_model(self, klass):
+        if klass in self._models:
+            fix = self._models[klass]
+            return fix if fix is not None else (lambda value: self._models[klass](value))
+        self._models[klass] = None  # recursive models
+        all_fields = set(klass.model_fields)
+        nested = []
+        for name, field in klass.model_fields.items():
+            fix = self.for_type(field.annotation)
+            if fix is not None:
+                nested.append((name, fix))
+
+        def fix_model(value):
+            if value.__class__ is not klass and not isinstance(value, klass):
+                return
+            _object_setattr(value, "__pydantic_fields_set__", all_fields.copy())
+            if nested:
+                values = value.__dict__
+                for name, fix in nested:
+                    item = values[name]
+                    if item is not None:
+                        fix(item)
+
+        self._models[klass] = fix_model
+        return fix_model
+
+
+class _Mismatch(Exception):
+    """A payload does not have the shape of the type it is built as."""
+
+
+# exact classes parsed JSON may hold for a scalar annotation
+_SCALARS = {str: (str,), bool: (bool,), int: (int,), float: (float, int)}
+
+
+class _Constructor:
+    """Builds models from parsed JSON without validating them.
+
+    Each model type is compiled once into a function that checks the
+    payload shape (objects, arrays, required and nullable properties,
+    scalar types) and sets the models' fields directly, as
+    `model_construct` does, with every field marked as set like `from_dict`.
+    Values typed `Any`, such as `config`, are kept as parsed without being
+    walked. A payload that does not fit raises `_Mismatch`.
+    """
+
+    def __init__(self) -> None:
+        self._models: Dict[type, Optional[Callable[[Any], Any]]] = {}
+
+    def for_type(self, tp) -> Optional[Callable[[Any], Any]]:
+        """Returns a callable building values of type `tp`, or None when
+        any value is accepted as is."""
+        if hasattr(tp, "__metadata__"):  # Annotated, e.g. StrictStr
+            return self.for_type(tp.__origin__)
+        if _is_model(tp):
+            return self._for_model(tp)
+        if tp in _SCALARS:
+            return self._for_scalars(_SCALARS[tp], float_only=tp is float)
+        origin = get_origin(tp)
+        args = get_args(tp)
+        if origin in (list, List):
+            return self._for_list(self.for_type(args[0]) if args else None)
+        if origin in (dict, Dict):
+            return self._for_dict(self.for_type(args[1]) if len(args) == 2 else None)
+        if origin is Union:
+            return self._for_union(args)
+        return None
+
+    @staticmethod
+    def _for_scalars(classes, float_only=False):
+        def build_scalar(value):
+            if value.__class__ not in classes:
+                raise _Mismatch(value)
+            if float_only and value.__class__ is int:
+                return float(value)
+            return value
+        return build_scalar
+
+    @staticmethod
+    def _for_list(build):
+        def build_list(value):
+            if value.__class__ is not list:
+                raise _Mismatch(value)
+            return value if build is None else [build(item) for item in value]
+        return build_list
+
+    @staticmethod
+    def _for_dict(build):
+        def build_dict(value):
+            if value.__class__ is not dict:
+                raise _Mismatch(value)
+            return value if build is None else {k: build(v) for k, v in value.items()}
+        return build_dict
+
+    def _for_union(self, args):
+        nullable = type(None) in args
+        members = [a for a in args if a is not type(None)]
+        bases = [a.__origin__ if hasattr(a, "__metadata__") else a for a in members]
+        if len(bases) > 1 and all(base in _SCALARS for base in bases):
+            # a value of an exact member type is kept as is, as in pydantic's
+            # smart union mode: an int stays an int in Union[float, int]
+            build = self._for_scalars(tuple({base for base in bases}))
+            if not nullable:
+                return build
+            return lambda value: value if value is None else build(value)
+        builds = [self.for_type(a) for a in members]
+        if any(build is None for build in builds):
+            return None
+
+        def build_union(value):
+            if value is None and nullable:
+                return value
+            for build in builds:
+                try:
+                    return build(value)
+                except _Mismatch:
+                    pass
+            raise _Mismatch(value)
+        return build_union
+
+    def _for_model(self, klass):
+        if klass in self._models:
+            build = self._models[klass]
+            return build if build is not None else (lambda value: self._models[klass](value))
+        self._models[klass] = None  # recursive models
+        all_fields = set(klass.model_fields)
+        fields = [
+            (name, field.alias or name, self.for_type(field.annotation))
+            for name, field in klass.model_fields.items()
+        ]
+        plain = not klass.__private_attributes__ and not klass.__pydantic_post_init__
+
+        def build_model(value):
+            if value.__class__ is not dict:
+                raise _Mismatch(value)
+            get = value.get
+            values = {}
+            for name, alias, build in fields:
+                item = get(alias)
+                values[name] = item if build is None else build(item)
+            if not plain:
+                return klass.model_construct(all_fields.copy(), **values)
+            model = klass.__new__(klass)
+            _object_setattr(model, "__dict__", values)
+            _object_setattr(model, "__pydantic_fields_set__", all_fields.copy())
+            _object_setattr(model, "__pydantic_extra__", None)
+            _object_setattr(model, "__pydantic_private__", None)
+            return model
+
+        self._models[klass] = build_model
+        return build_model
+
+
+class DeserializerPlan:
+    """A response type string compiled once into a converter.
+
+    `from_json` turns the JSON text (str or bytes) of a response into typed
+    values. Types made of models, lists, dicts and optionals are validated
+    in one call by a pydantic `TypeAdapter`; payloads it rejects (and other
+    types) go through `from_data`, the element-by-element `from_dict` path,
+    so results and errors are the same either way.
+    """
+
+    def __init__(self, type_string: str, resolve: Callable[[str], Any]) -> None:
+        self.type_string = type_string
+        self.tree = parse_type(type_string)
+        python_type = self._python_type(self.tree, resolve)
+        self._adapter = None
+        self._fix = None
+        self._build = None
+        if python_type is not None:
+            self._adapter = TypeAdapter(Optional[python_type])
+            self._fix = _FieldsSetFixer().for_type(python_type)
+            self._build = _Constructor().for_type(Optional[python_type])
+        self._type = python_type
+        self._lazy = None
+        self._convert = self._converter(self.tree, resolve)
+        self._responses = itertools.count()
+
+    def _python_type(self, node, resolve):
+        """Returns the type validated by the adapter, or None when a leaf
+        is not a model."""
+        kind, arg = node
+        if kind == "name":
+            klass = resolve(arg)
+            return klass if _is_model(klass) else None
+        inner = self._python_type(arg, resolve)
+        if inner is None:
+            return None
+        if kind == "list":
+            return List[Optional[inner]]
+        if kind == "dict":
+            return Dict[str, Optional[inner]]
+        return Optional[inner]
+
+    def _converter(self, node, resolve):
+        kind, arg = node
+        if kind == "name":
+            klass = resolve(arg)
+            if _is_model(klass):
+                from_dict = klass.from_dict
+                return lambda data, fallback: None if data is None else from_dict(data)
+            return lambda data, fallback: None if data is None else fallback(data, klass)
+        convert = self._converter(arg, resolve)
+        if kind == "list":
+            return lambda data, fallback: None if data is None else [
+                convert(item, fallback) for item in data
+            ]
+        if kind == "dict":
+            return lambda data, fallback: None if data is None else {
+                k: convert(v, fallback) for k, v in data.items()
+            }
+        return convert
+
+    def from_data(self, data, fallback: Callable[[Any, type], Any]):
+        """Converts parsed JSON `data`.
+
+        :param fallback: converts a leaf that is not a model, given
+            ``(data, class)``.
+        """
+        return self._convert(data, fallback)
+
+    def from_json(
+        self,
+        text: Union[str, bytes],
+        fallback: Callable[[Any, type], Any],
+        loads: Callable[[Union[str, bytes]], Any] = json.loads,
+    ):
+        """Parses and converts the JSON document `text`; `loads` parses it
+        when the adapter does not apply."""
+        if self._adapter is not None:
+            try:
+                value = self._adapter.validate_json(text)
+            except ValueError:
+                pass
+            else:
+                if self._fix is not None and value is not None:
+                    self._fix(value)
+                return value
+        return self._convert(loads(text), fallback)
+
+    def from_json_trusted(
+        self,
+        text: Union[str, bytes],
+        fallback: Callable[[Any, type], Any],
+        loads: Callable[[Union[str, bytes]], Any] = json.loads,
+        validate_one_in: int = 0,
+    ):
+        """Like `from_json`, but builds models from the parsed payload after
+        checking only its shape (see `_Constructor`), skipping validation.
+
+        :param validate_one_in: every N-th call (the first included) goes
+            through `from_json` instead, so a payload that stopped matching
+            the models still fails; 0 never validates.
+        """
+        if self._build is None or (
+            validate_one_in and next(self._responses) % validate_one_in == 0
+        ):
+            return self.from_json(text, fallback, loads)
+        data = loads(text)
+        try:
+            return self._build(data)
+        except _Mismatch:
+            # validated element by element, raising its errors
+            return self._convert(data, fallback)
+
+    def from_json_lazy(
+        self,
+        text: Union[str, bytes],
+        fallback: Callable[[Any, type], Any],
+        loads: Callable[[Union[str, bytes]], Any] = json.loads,
+    ):
+        """Like `from_json`, but the heavy fields listed in `lazy.LAZY_FIELDS`
+        stay raw JSON until read (see `lazy.LazyModel`). Types without such
+        fields are decoded by `from_json`."""
+        if self._type is None:
+            return self.from_json(text, fallback, loads)
+        if self._lazy is None:
+            from openapi_client.lazy import LazyDecoder
+            self._lazy = LazyDecoder(Optional[self._type])
+        if not self._lazy.lazy:
+            return self.from_json(text, fallback, loads)
+        try:
+            return self._lazy.decode(text)
+        except self._lazy.DecodeError:
+            # not the expected shape: the eager path raises its errors
+            return self.from_json(text, fallback, loads)
+
+
+_plans: Dict[str, DeserializerPlan] = {}
+_plans_lock = threading.Lock()
+
+
+def get_plan(type_string: str, resolve: Callable[[str], Any]) -> DeserializerPlan:
+    """Returns the memoized plan of `type_string`; `resolve` maps a type
+    name to its class and must give the same answer on every call."""
+    plan = _plans.get(type_string)
+    if plan is None:
+        with _plans_lock:
+            plan = _plans.get(type_string)
+            if plan is None:
+                plan = _plans[type_string] = DeserializerPlan(type_string, resolve)
+    return plan
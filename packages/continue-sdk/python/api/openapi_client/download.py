@@ -0,0 +1,289 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import functools
+import hashlib
+import os
+import re
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+import urllib3
+
+from openapi_client.exceptions import ApiException
+
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+# errors that cut a body short, as opposed to failures writing it to disk
+_READ_ERRORS = (urllib3.exceptions.HTTPError, OSError)
+_CONTENT_RANGE = re.compile(r'^\s*bytes\s+(\d+)-(\d+)/(\d+|\*)\s*$', re.IGNORECASE)
+
+
+class FileSink:
+    """Writes a response body to `path` chunk by chunk, hashing the bytes
+    as they are written.
+
+    :param path: file to write; it is created or truncated.
+    :param buffer_size: bytes read from the response at a time.
+    :param algorithm: `hashlib` algorithm of `hexdigest`, or None not to
+        hash.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        algorithm: Optional[str] = "sha256",
+    ) -> None:
+        self.path = path
+        self.buffer_size = buffer_size
+        self.algorithm = algorithm
+        self.size = 0
+        self._hash = hashlib.new(algorithm) if algorithm else None
+        self._file = open(path, "wb")
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+        self.size += len(chunk)
+
+    def write_response(self, response) -> None:
+        """Copies the rest of `response` (a `rest.RESTResponse`)."""
+        for chunk in response.stream(self.buffer_size):
+            self.write(chunk)
+
+    def restart(self) -> None:
+        """Discards what has been written, for a body sent again in full."""
+        self._file.seek(0)
+        self._file.truncate()
+        if self._hash is not None:
+            self._hash = hashlib.new(self.algorithm)
+        self.size = 0
+
+    @property
+    def hexdigest(self) -> Optional[str]:
+        return self._hash.hexdigest() if self._hash is not None else None
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "FileSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class DownloadResult:
+    """What `download` wrote.
+
+    :param path: the downloaded file.
+    :param size: its size in bytes.
+    :param digest: hex digest of its bytes, or None without `algorithm`.
+    :param algorithm: `hashlib` algorithm of `digest`.
+    :param resumes: Range requests needed to complete it.
+    :param status: HTTP status of the first response.
+    :param headers: headers of the first response.
+    """
+
+    __slots__ = ("path", "size", "digest", "algorithm", "resumes", "status", "headers")
+
+    def __init__(self, path, size, digest, algorithm, resumes, status, headers) -> None:
+        self.path = path
+        self.size = size
+        self.digest = digest
+        self.algorithm = algorithm
+        self.resumes = resumes
+        self.status = status
+        self.headers = headers
+
+    def __repr__(self) -> str:
+        return "DownloadResult(path=%r, size=%d, %s=%s, resumes=%d)" % (
+            self.path, self.size, self.algorithm, self.digest, self.resumes
+        )
+
+
+def _validator(response) -> Optional[str]:
+    """The `If-Range` value making a resumed body the same version, if the
+    response has one; weak ETags cannot be used."""
+    etag = response.getheader("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.getheader("Last-Modified")
+
+
+def _content_range(response) -> Tuple[int, Optional[int]]:
+    """``(first byte, total size or None)`` of a 206 response."""
+    match = _CONTENT_RANGE.match(response.getheader("Content-Range") or "")
+    if match is None:
+        raise ApiException(
+            status=response.status,
+            reason="Unexpected Content-Range %r" % response.getheader("Content-Range"),
+        )
+    total = match.group(3)
+    return int(match.group(1)), None if total == "*" else int(total)
+
+
+def _copy(response, sink: FileSink) -> Optional[BaseException]:
+    """Copies `response` into `sink`; returns the error that cut the body
+    short, or None once it is complete. Disk errors are raised.
+
+    `read1` returns whatever has arrived, up to `buffer_size`, so that a
+    dropped connection loses none of the bytes already received (urllib3
+    1.x lacks it and reads whole buffers).
+    """
+    raw = response.response
+    read = getattr(raw, "read1", raw.read)
+    completed = False
+    try:
+        while True:
+            try:
+                chunk = read(sink.buffer_size)
+            except _READ_ERRORS as e:
+                return e
+            if not chunk:
+                completed = True
+                return None
+            sink.write(chunk)
+    finally:
+        if completed:
+            raw.release_conn()
+        else:
+            raw.close()
+
+
+def _remove(path) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def download(
+    api_client,
+    resource_path: str,
+    path: Optional[str] = None,
+    query_params: Optional[List[Tuple[str, Any]]] = None,
+    header_params: Optional[Dict[str, str]] = None,
+    buffer_size: Optional[int] = None,
+    algorithm: Optional[str] = "sha256",
+    max_resumes: int = 3,
+    _request_timeout: Any = None,
+) -> DownloadResult:
+    """GETs `resource_path` into a file without holding the body in
+    memory.
+
+    The body is copied `buffer_size` bytes at a time (by default
+    `Configuration.download_buffer_size`) into ``path + ".part"``, which
+    replaces `path` once complete, or into a new file in
+    `Configuration.temp_folder_path` without `path`. Bytes are hashed as
+    they are written. When the connection drops mid-body, the download
+    resumes where it stopped with a Range request, up to `max_resumes`
+    times; `If-Range` makes the server send the whole body again if it
+    changed, and the file is rewritten. Resuming needs a strong `ETag` or
+    a `Last-Modified` header, otherwise the download starts over.
+
+    The request goes through the rate limiter and circuit breaker but not
+    the response cache or request coalescing, which hold whole bodies, nor
+    the retry policy, which resuming replaces. Error responses raise
+    `ApiException`s and nothing is left on disk.
+
+    :param api_client: an `ApiClient`.
+    :param resource_path: path of the file, relative to the host.
+    :return: DownloadResult
+    """
+    configuration = api_client.configuration
+    buffer_size = buffer_size or configuration.download_buffer_size
+    header_params = dict(header_params or {})
+    # byte offsets must be those of the file, not of a compressed body
+    header_params.setdefault("Accept-Encoding", "identity")
+    method, url, headers, _, _ = api_client.param_serialize(
+        "GET", resource_path,
+        query_params=query_params,
+        header_params=header_params,
+        auth_settings=['apiKeyAuth'],
+    )
+
+    def send(headers):
+        return api_client.rest_client.request(
+            method, url, headers=headers, _request_timeout=_request_timeout
+        )
+
+    limiter = configuration.rate_limiter
+    if limiter is not None:
+        send = functools.partial(limiter.request, send, method, url)
+    breaker = configuration.circuit_breaker
+    if breaker is not None:
+        send = functools.partial(breaker.request, send, method, url)
+
+    if path is not None:
+        target = path + ".part"
+    else:
+        fd, target = tempfile.mkstemp(dir=configuration.temp_folder_path)
+        os.close(fd)
+    sink = FileSink(target, buffer_size, algorithm)
+    try:
+        first = None
+        resumes = 0
+        request_headers = headers
+        while True:
+            response = send(request_headers)
+            if not 200 <= response.status <= 299:
+                data = response.read()
+                raise ApiException.from_response(
+                    http_resp=response,
+                    body=data.decode("utf-8", "replace") if data else None,
+                    data=None,
+                )
+            if response.status == 206 and sink.size:
+                start, _ = _content_range(response)
+                if start != sink.size:
+                    response.response.close()
+                    raise ApiException(
+                        status=response.status,
+                        reason="Resumed at byte %d instead of %d" % (start, sink.size),
+                    )
+            elif sink.size:
+                sink.restart()  # the body changed, or ranges are not supported
+            if first is None:
+                first = response
+            error = _copy(response, sink)
+            if error is None:
+                break
+            resumes += 1
+            if resumes > max_resumes:
+                raise error
+            if response.status == 200:
+                validator = _validator(response)
+            else:
+                validator = request_headers.get("If-Range")
+            request_headers = dict(headers)
+            if validator and sink.size:
+                request_headers["Range"] = "bytes=%d-" % sink.size
+                request_headers["If-Range"] = validator
+            else:
+                sink.restart()
+    except BaseException:
+        sink.close()
+        _remove(target)
+        raise
+    sink.close()
+    if path is not None:
+        os.replace(target, path)
+        target = path
+    return DownloadResult(
+        target, sink.size, sink.hexdigest, algorithm, resumes,
+        first.status, first.getheaders(),
+    )
@@ -11,6 +11,8 @@
     Do not edit the class manually.
 """  # noqa: E501
 
+import email.utils
+import time
 from typing import Any, Optional
 from typing_extensions import Self
 
@@ -117,6 +119,8 @@ class ApiException(OpenApiException):
         self.body = body
         self.data = data
         self.headers = None
+        # seconds the server asked to wait (`Retry-After`), if any
+        self.retry_after = None
 
         if http_resp:
             if self.status is None:
@@ -129,6 +133,9 @@ class ApiException(OpenApiException):
                 except Exception:
                     pass
             self.headers = http_resp.getheaders()
+            self.retry_after = parse_retry_after(
+                http_resp.getheader('Retry-After')
+            )
 
     @classmethod
     def from_response(
@@ -157,6 +164,9 @@ class ApiException(OpenApiException):
         if http_resp.status == 422:
             raise UnprocessableEntityException(http_resp=http_resp, body=body, data=data)
 
+        if http_resp.status == 429:
+            raise TooManyRequestsException(http_resp=http_resp, body=body, data=data)
+
         if 500 <= http_resp.status <= 599:
             raise ServiceException(http_resp=http_resp, body=body, data=data)
         raise ApiException(http_resp=http_resp, body=body, data=data)
@@ -195,6 +205,38 @@ class ServiceException(ApiException):
     pass
 
 
+class TooManyRequestsException(ApiException):
+    """Exception for HTTP 429 Too Many Requests; see `retry_after`."""
+    pass
+
+
+class RateLimitExceededException(TooManyRequestsException):
+    """Raised without sending the request when the client-side rate limiter
+    has no token for it; `retry_after` is the wait until one is available,
+    in seconds."""
+
+    def __init__(self, retry_after=None) -> None:
+        super(RateLimitExceededException, self).__init__(
+            status=0, reason="Client-side rate limit exceeded"
+        )
+        self.retry_after = retry_after
+
+
+class CircuitOpenException(ApiException):
+    """Raised without sending the request while the circuit breaker for
+    `host` (and `operation`) is open; `retry_after` is the time left until
+    it lets a probe through, in seconds."""
+
+    def __init__(self, host, operation=None, retry_after=None) -> None:
+        target = host if operation is None else "%s (%s)" % (host, operation)
+        super(CircuitOpenException, self).__init__(
+            status=0, reason="Circuit breaker open for %s" % target
+        )
+        self.host = host
+        self.operation = operation
+        self.retry_after = retry_after
+
+
 class ConflictException(ApiException):
     """Exception for HTTP 409 Conflict."""
     pass
@@ -214,3 +256,21 @@ def render_path(path_to_item):
         else:
             result += "['{0}']".format(pth)
     return result
+
+
+def parse_retry_after(value, now=None) -> Optional[float]:
+    """Parses a `Retry-After` header (delay-seconds or HTTP-date) into
+    seconds from now, or None when absent or malformed."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        parsed = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed is None:
+        return None
+    now = time.time() if now is None else now
+    return max(parsed.timestamp() - now, 0.0)
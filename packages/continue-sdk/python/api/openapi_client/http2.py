@@ -0,0 +1,368 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import asyncio
+import io
+import ssl
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+from openapi_client import async_rest, rest
+from openapi_client.exceptions import ApiException
+from openapi_client.transport import AsyncTransport, StreamingBody, Transport
+
+
+def _require_httpx():
+    if httpx is None:
+        raise ImportError(
+            "The HTTP/2 transport requires httpx and h2. "
+            "Install them with `pip install openapi-client[http2]`."
+        )
+
+
+def _ssl_context(configuration):
+    context = ssl.create_default_context(
+        cafile=configuration.ssl_ca_cert,
+        cadata=configuration.ca_cert_data,
+    )
+    if configuration.cert_file:
+        context.load_cert_chain(
+            configuration.cert_file, keyfile=configuration.key_file
+        )
+    if not configuration.verify_ssl:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def _client_args(configuration):
+    max_connections = configuration.http2_max_connections
+    if max_connections is None:
+        max_connections = configuration.connection_pool_maxsize
+    args = {
+        "http1": not configuration.http2_prior_knowledge,
+        "http2": True,
+        "verify": _ssl_context(configuration),
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+        "timeout": None,
+        "trust_env": True,
+    }
+    if configuration.proxy:
+        args["proxy"] = httpx.Proxy(
+            configuration.proxy, headers=configuration.proxy_headers
+        )
+    return args
+
+
+def _timeout(_request_timeout):
+    if _request_timeout:
+        if isinstance(_request_timeout, (int, float)):
+            return httpx.Timeout(_request_timeout)
+        elif (
+                isinstance(_request_timeout, tuple)
+                and len(_request_timeout) == 2
+            ):
+            return httpx.Timeout(
+                None,
+                connect=_request_timeout[0],
+                read=_request_timeout[1]
+            )
+    return None
+
+
+def _ssl_error(e):
+    return isinstance(e.__cause__ or e.__context__, ssl.SSLError)
+
+
+class HTTP2Metrics:
+    """Counters describing the traffic of one HTTP/2 transport.
+
+    All counters are cumulative except `in_flight`; read them atomically
+    with `snapshot()`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.queued = 0
+        self.queue_time = 0.0
+        self.http_versions: Counter = Counter()
+
+    def stream_opened(self, waited: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            if waited > 0:
+                self.queued += 1
+                self.queue_time += waited
+
+    def stream_closed(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def response_received(self, http_version: str) -> None:
+        with self._lock:
+            self.http_versions[http_version] += 1
+
+    def request_failed(self) -> None:
+        with self._lock:
+            self.errors += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns a consistent copy of the counters, e.g. for health checks."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "queued": self.queued,
+                "queue_time": self.queue_time,
+                "http_versions": dict(self.http_versions),
+            }
+
+
+class _Stream:
+    """One stream slot; `release` is idempotent."""
+
+    def __init__(self, semaphore, metrics, waited) -> None:
+        self._semaphore = semaphore
+        self._metrics = metrics
+        self._released = False
+        metrics.stream_opened(waited)
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._metrics.stream_closed()
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+
+class _RawStream(io.RawIOBase):
+    """File-like view of an httpx response's undecoded byte stream.
+
+    The response, and its stream slot, are released as soon as the body is
+    exhausted or closed.
+    """
+
+    def __init__(self, response, stream) -> None:
+        self._response = response
+        self._stream = stream
+        self._chunks = response.iter_raw()
+        self._buffer = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                self._response.close()
+                self._stream.release()
+                return 0
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._response.close()
+            self._stream.release()
+        super().close()
+
+
+class HTTP2Transport(Transport):
+    """Transport over an `httpx.Client` with HTTP/2 enabled.
+
+    Requests to the same origin are multiplexed over a shared connection
+    when the server negotiates HTTP/2 (via ALPN, or unconditionally with
+    `Configuration.http2_prior_knowledge`); otherwise httpx falls back to
+    HTTP/1.1. At most `Configuration.http2_max_concurrent_streams` requests
+    are in flight at once; further callers wait for a stream to finish.
+    A stream stays open until its response body is read or closed.
+
+    Response bodies are streamed and decoded by urllib3, so the returned
+    `RESTResponse` behaves like the default transport's.
+    """
+
+    def __init__(self, configuration) -> None:
+        _require_httpx()
+        self.client = httpx.Client(**_client_args(configuration))
+        self.metrics = HTTP2Metrics()
+        max_streams = configuration.http2_max_concurrent_streams
+        self._streams = (
+            threading.BoundedSemaphore(max_streams) if max_streams else None
+        )
+
+    def _open_stream(self):
+        waited = 0.0
+        if self._streams is not None and not self._streams.acquire(blocking=False):
+            start = time.monotonic()
+            self._streams.acquire()
+            waited = time.monotonic() - start
+        return _Stream(self._streams, self.metrics, waited)
+
+    def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        method = method.upper()
+        headers = headers or {}
+        content = rest.serialize_body(method, headers, body, post_params)
+        request = self.client.build_request(
+            method, url, headers=headers, content=content,
+            timeout=_timeout(_request_timeout),
+        )
+        stream = self._open_stream()
+        try:
+            response = self.client.send(request, stream=True)
+        except httpx.ConnectError as e:
+            stream.release()
+            self.metrics.request_failed()
+            if not _ssl_error(e):
+                raise
+            msg = "\n".join([type(e).__name__, str(e)])
+            raise ApiException(status=0, reason=msg)
+        except BaseException:
+            stream.release()
+            self.metrics.request_failed()
+            raise
+
+        self.metrics.response_received(response.http_version)
+        return rest.build_response(
+            response.status_code,
+            response.headers.multi_items(),
+            _RawStream(response, stream),
+            response.reason_phrase,
+        )
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class _AsyncResponse:
+    """Adapts `httpx.Response` to the interface of `aiohttp.ClientResponse`
+    used by `async_rest.RESTResponse`."""
+
+    def __init__(self, response, stream) -> None:
+        self.raw = response
+        self.status = response.status_code
+        self.reason = response.reason_phrase
+        self.headers = response.headers
+        self._stream = stream
+
+    async def read(self):
+        try:
+            return await self.raw.aread()
+        finally:
+            await self.raw.aclose()
+            self._stream.release()
+
+    async def iter_chunked(self, n):
+        try:
+            async for chunk in self.raw.aiter_bytes(n):
+                yield chunk
+        finally:
+            await self.raw.aclose()
+            self._stream.release()
+
+
+class AsyncHTTP2Transport(AsyncTransport):
+    """Asyncio transport over an `httpx.AsyncClient` with HTTP/2 enabled.
+
+    Stream limits and metrics behave as in `HTTP2Transport`.
+    """
+
+    def __init__(self, configuration) -> None:
+        _require_httpx()
+        self.client = httpx.AsyncClient(**_client_args(configuration))
+        self.metrics = HTTP2Metrics()
+        self._max_streams = configuration.http2_max_concurrent_streams
+        # created on first use so that it binds to the running event loop
+        self._streams = None
+
+    async def _open_stream(self):
+        if self._max_streams and self._streams is None:
+            self._streams = asyncio.Semaphore(self._max_streams)
+        waited = 0.0
+        if self._streams is not None:
+            if self._streams.locked():
+                start = time.monotonic()
+                await self._streams.acquire()
+                waited = time.monotonic() - start
+            else:
+                await self._streams.acquire()
+        return _Stream(self._streams, self.metrics, waited)
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        method = method.upper()
+        headers = headers or {}
+        content = rest.serialize_body(method, headers, body, post_params)
+        if isinstance(content, StreamingBody):
+            content = content.async_chunks()
+        request = self.client.build_request(
+            method, url, headers=headers, content=content,
+            timeout=_timeout(_request_timeout),
+        )
+        stream = await self._open_stream()
+        try:
+            response = await self.client.send(request, stream=True)
+        except httpx.ConnectError as e:
+            stream.release()
+            self.metrics.request_failed()
+            if not _ssl_error(e):
+                raise
+            msg = "\n".join([type(e).__name__, str(e)])
+            raise ApiException(status=0, reason=msg)
+        except BaseException:
+            stream.release()
+            self.metrics.request_failed()
+            raise
+
+        self.metrics.response_received(response.http_version)
+        return async_rest.RESTResponse(_AsyncResponse(response, stream))
+
+    async def close(self) -> None:
+        await self.client.aclose()
@@ -0,0 +1,260 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import asyncio
+import io
+import sys
+import threading
+from urllib.parse import unquote_to_bytes, urlsplit
+
+from openapi_client import async_rest, rest
+from openapi_client.transport import AsyncTransport, StreamingBody, Transport
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _split_url(url):
+    parts = urlsplit(url)
+    host = parts.hostname or "localhost"
+    port = parts.port or _DEFAULT_PORTS.get(parts.scheme, 80)
+    return parts, host, port
+
+
+def _encode(data):
+    if data is None:
+        return b""
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    if isinstance(data, StreamingBody):
+        return data.to_bytes()
+    return bytes(data)
+
+
+def _prepare(method, headers, body, post_params):
+    method = method.upper()
+    headers = dict(headers or {})
+    data = _encode(rest.serialize_body(method, headers, body, post_params))
+    return method, headers, data
+
+
+class WSGITransport(Transport):
+    """Calls a WSGI application in-process instead of opening a socket.
+
+    Useful to test or benchmark the client against a local stand-in Hub::
+
+        configuration.transport = WSGITransport(app)
+
+    :param app: the WSGI application.
+    :param remote_addr: value of `REMOTE_ADDR` seen by the application.
+    """
+
+    def __init__(self, app, remote_addr="127.0.0.1") -> None:
+        self.app = app
+        self.remote_addr = remote_addr
+
+    def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        method, headers, data = _prepare(method, headers, body, post_params)
+        parts, host, port = _split_url(url)
+
+        environ = {
+            "REQUEST_METHOD": method,
+            "SCRIPT_NAME": "",
+            "PATH_INFO": unquote_to_bytes(parts.path).decode("latin-1"),
+            "QUERY_STRING": parts.query,
+            "SERVER_NAME": host,
+            "SERVER_PORT": str(port),
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "REMOTE_ADDR": self.remote_addr,
+            "CONTENT_LENGTH": str(len(data)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": parts.scheme or "http",
+            "wsgi.input": io.BytesIO(data),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for key, value in headers.items():
+            key = key.upper().replace("-", "_")
+            if key == "CONTENT_TYPE":
+                environ["CONTENT_TYPE"] = str(value)
+            elif key != "CONTENT_LENGTH":
+                environ["HTTP_" + key] = str(value)
+        environ.setdefault("HTTP_HOST", parts.netloc)
+
+        started = {}
+        chunks = []
+
+        def start_response(status, response_headers, exc_info=None):
+            if exc_info is not None and started:
+                raise exc_info[1].with_traceback(exc_info[2])
+            started["status"] = status
+            started["headers"] = response_headers
+            return chunks.append
+
+        result = self.app(environ, start_response)
+        try:
+            for chunk in result:
+                chunks.append(chunk)
+        finally:
+            if hasattr(result, "close"):
+                result.close()
+
+        code, _, reason = started["status"].partition(" ")
+        return rest.build_response(
+            int(code), started["headers"], b"".join(chunks), reason or None
+        )
+
+
+async def _call_asgi(app, method, url, headers, data):
+    parts, host, port = _split_url(url)
+    raw_headers = [
+        (str(k).lower().encode("latin-1"), str(v).encode("latin-1"))
+        for k, v in headers.items()
+    ]
+    if not any(k == b"host" for k, _ in raw_headers):
+        raw_headers.append((b"host", parts.netloc.encode("latin-1")))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": parts.scheme or "http",
+        "path": unquote_to_bytes(parts.path).decode("utf-8"),
+        "raw_path": parts.path.encode("latin-1"),
+        "query_string": parts.query.encode("latin-1"),
+        "root_path": "",
+        "headers": raw_headers,
+        "server": (host, port),
+        "client": ("127.0.0.1", 0),
+    }
+
+    request_sent = False
+    response_done = asyncio.Event()
+    started = {}
+    chunks = []
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": data, "more_body": False}
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            started["status"] = message["status"]
+            started["headers"] = [
+                (k.decode("latin-1"), v.decode("latin-1"))
+                for k, v in message.get("headers", [])
+            ]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_done.set()
+
+    try:
+        await app(scope, receive, send)
+    finally:
+        response_done.set()
+    return started["status"], started["headers"], b"".join(chunks)
+
+
+class ASGITransport(Transport):
+    """Calls an ASGI application in-process from the synchronous client.
+
+    The application runs on a private event loop thread that lives as long
+    as the transport, so state the app keeps on its loop survives between
+    requests. Lifespan events are not sent.
+
+    :param app: the ASGI application.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="openapi-client-asgi",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        method, headers, data = _prepare(method, headers, body, post_params)
+        future = asyncio.run_coroutine_threadsafe(
+            _call_asgi(self.app, method, url, headers, data),
+            self._ensure_loop(),
+        )
+        status, response_headers, content = future.result()
+        return rest.build_response(status, response_headers, content)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join()
+                self._loop.close()
+                self._loop = None
+                self._thread = None
+
+
+class AsyncASGITransport(AsyncTransport):
+    """Awaits an ASGI application in-process from `AsyncApiClient`.
+
+    :param app: the ASGI application.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        method, headers, data = _prepare(method, headers, body, post_params)
+        status, response_headers, content = await _call_asgi(
+            self.app, method, url, headers, data
+        )
+        return async_rest.build_response(status, response_headers, content)
@@ -0,0 +1,319 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import json
+import re
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+from openapi_client.exceptions import ApiTypeError, ApiValueError
+from openapi_client.transport import StreamingBody
+
+# bytes per chunk of a JSONStream
+DEFAULT_CHUNK_SIZE = 1 << 16
+# containers nested deeper than this are encoded whole by the codec
+_STREAM_DEPTH = 2
+
+
+# a float with all exponent bits set, as MessagePack writes it
+_MSGPACK_NON_FINITE = re.compile(b"\xcb[\x7f\xff][\xf0-\xff]")
+
+
+def _may_be_non_finite(data: bytes) -> bool:
+    """Whether `data`, a document written by a fast library, may hold a
+    non-finite float: those are written as null, or as "nan" / "inf" keys."""
+    return b"null" in data or b'nan"' in data or b'inf"' in data
+
+
+def _holds_non_finite(obj: Any) -> bool:
+    """Whether `obj` holds a float `json` writes as `NaN` or `Infinity`."""
+    stack = [obj]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        value = pop()
+        cls = type(value)
+        if cls is str:
+            continue
+        if isinstance(value, dict):
+            extend(value.values())
+            extend(value)
+        elif isinstance(value, (list, tuple)):
+            extend(value)
+        elif isinstance(value, float) and value - value != 0.0:
+            return True
+    return False
+
+
+class JSONCodec:
+    """Encodes and decodes JSON with the standard library.
+
+    Subclasses plug in faster libraries. They must give the same results as
+    `json` for plain JSON values (dict, list, str, int, float, bool, None),
+    which is all the client hands them, and raise the same exceptions:
+    anything a library does not handle exactly falls back to `json`.
+    Output may differ in whitespace and in escaping non-ASCII characters.
+    `OrjsonCodec` is the one exception, see there.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        """Encodes `obj` as a JSON document."""
+        return json.dumps(obj)
+
+    def dumpb(self, obj: Any) -> bytes:
+        """Encodes `obj` as a UTF-8 JSON document."""
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decodes the JSON document `data` (str, or bytes in UTF-8)."""
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return "<%s %s>" % (type(self).__name__, self.name)
+
+
+class OrjsonCodec(JSONCodec):
+    """`orjson` codec.
+
+    orjson decodes integers wider than 64 bits as floats, which would take
+    a scan of every document to detect, so it is not picked by "auto";
+    select it only for payloads without such integers. Documents with nulls
+    are walked in Python for non-finite floats, so it encodes them slower
+    than `MsgspecCodec`.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+        self._orjson = orjson
+        # types json.dumps rejects are passed on to it
+        self._options = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_SUBCLASS
+        )
+
+    def dumpb(self, obj):
+        try:
+            data = self._orjson.dumps(obj, option=self._options)
+        except TypeError:
+            return super().dumpb(obj)
+        # non-finite floats: json writes NaN and Infinity, orjson null
+        if _may_be_non_finite(data) and _holds_non_finite(obj):
+            return super().dumpb(obj)
+        return data
+
+    def dumps(self, obj):
+        return self.dumpb(obj).decode("utf-8")
+
+    def loads(self, data):
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            # NaN, lone surrogates, numbers out of range: json decides
+            return json.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """`msgspec` codec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+        self._msgspec = msgspec
+        self._msgpack = msgspec.msgpack.Encoder()
+
+    def dumpb(self, obj):
+        try:
+            data = self._msgspec.json.encode(obj)
+        except (TypeError, ValueError, OverflowError):
+            # bool and None keys, unsupported types
+            return super().dumpb(obj)
+        # non-finite floats: json writes NaN and Infinity, msgspec null
+        if _may_be_non_finite(data) and self._holds_non_finite(obj):
+            return super().dumpb(obj)
+        return data
+
+    def _holds_non_finite(self, obj):
+        # MessagePack writes every float as 0xcb and its IEEE 754 bytes, so
+        # this takes one pass in C; a false match only costs the json path
+        try:
+            return _MSGPACK_NON_FINITE.search(self._msgpack.encode(obj)) is not None
+        except (TypeError, ValueError, OverflowError):
+            return _holds_non_finite(obj)
+
+    def dumps(self, obj):
+        return self.dumpb(obj).decode("utf-8")
+
+    def loads(self, data):
+        try:
+            return self._msgspec.json.decode(data)
+        except self._msgspec.DecodeError:
+            return json.loads(data)
+
+
+CODECS: Dict[str, type] = {
+    "json": JSONCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+# tried in order by "auto"; orjson is left out, see OrjsonCodec
+AUTO_ORDER = ("msgspec", "json")
+
+
+def get_codec(selected: Union[None, str, JSONCodec] = None) -> JSONCodec:
+    """Returns the codec selected by `Configuration.json_codec`.
+
+    :param selected: a `JSONCodec`, a name in `CODECS`, or "auto" / None
+        for the process default (see `set_default_codec`).
+    """
+    if selected is None or selected == "auto":
+        return default_codec()
+    if isinstance(selected, JSONCodec):
+        return selected
+    if not isinstance(selected, str):
+        raise ApiTypeError("JSON codec must be a name or a JSONCodec, got %r" % (selected,))
+    try:
+        factory = CODECS[selected]
+    except KeyError:
+        raise ApiValueError(
+            "Unknown JSON codec `{0}`. Must be one of {1}.".format(selected, sorted(CODECS))
+        )
+    return factory()
+
+
+_default: Optional[JSONCodec] = None
+
+
+def default_codec() -> JSONCodec:
+    """Returns the process default codec: the first installed of
+    `AUTO_ORDER` unless changed with `set_default_codec`."""
+    global _default
+    if _default is None:
+        for name in AUTO_ORDER:
+            try:
+                _default = CODECS[name]()
+                break
+            except ImportError:
+                continue
+    return _default  # type: ignore[return-value]
+
+
+def set_default_codec(selected: Union[None, str, JSONCodec]) -> None:
+    """Changes the codec used by models' `to_json` / `from_json` and by
+    clients whose `Configuration.json_codec` is None. None restores "auto"."""
+    global _default
+    _default = None
+    if selected is not None and selected != "auto":
+        _default = get_codec(selected)
+
+
+def dumps(obj: Any) -> str:
+    """Encodes `obj` with the default codec."""
+    return default_codec().dumps(obj)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decodes `data` with the default codec."""
+    return default_codec().loads(data)
+
+
+class JSONBody:
+    """A request body already encoded by `ApiClient`; `rest.serialize_body`
+    sends `data` as is."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def __repr__(self) -> str:
+        return "JSONBody(%r)" % (self.data,)
+
+
+class JSONStream(StreamingBody):
+    """A request body encoded as it is sent, `chunk_size` bytes at a time.
+
+    The top levels of `data` are walked here and everything below them,
+    such as each element of a long list, is encoded by `codec`, so that
+    neither the whole document nor the time to encode it stands between
+    the request and its first byte. The output is what `codec.dumpb`
+    gives, separators included. Having no `content_length`, the body is
+    sent with chunked transfer encoding.
+
+    :param sanitize: converts values to plain JSON values before they are
+        encoded, e.g. `ApiClient.sanitize_for_serialization`. Models in the
+        top levels are opened with their `to_dict`, so that the rest of
+        `data` is converted an element at a time rather than copied whole.
+    """
+
+    def __init__(
+        self,
+        codec: JSONCodec,
+        data: Any,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        sanitize: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
+        self.codec = codec
+        self.data = data
+        self.chunk_size = chunk_size
+        self.sanitize = sanitize
+        # the codec's own separators, e.g. b", " for json and b"," for msgspec
+        self._item_separator = codec.dumpb([0, 0])[2:-2]
+        self._key_separator = codec.dumpb({"": 0})[3:-2]
+
+    def __iter__(self) -> Iterator[bytes]:
+        buffer = bytearray()
+        for piece in self._encode(self.data, 0):
+            buffer += piece
+            if len(buffer) >= self.chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    def _encode(self, value: Any, depth: int) -> Iterator[bytes]:
+        sanitize = self.sanitize
+        if depth < _STREAM_DEPTH and sanitize is not None and not isinstance(value, (list, dict)):
+            to_dict = getattr(value, "to_dict", None)
+            value = to_dict() if callable(to_dict) else sanitize(value)
+        if depth < _STREAM_DEPTH and value and isinstance(value, list):
+            yield b"["
+            for i, item in enumerate(value):
+                if i:
+                    yield self._item_separator
+                yield from self._encode(item, depth + 1)
+            yield b"]"
+        elif (
+            depth < _STREAM_DEPTH and value and isinstance(value, dict)
+            and all(isinstance(key, str) for key in value)
+        ):
+            dumpb = self.codec.dumpb
+            yield b"{"
+            for i, (key, item) in enumerate(value.items()):
+                if i:
+                    yield self._item_separator
+                yield dumpb(key)
+                yield self._key_separator
+                yield from self._encode(item, depth + 1)
+            yield b"}"
+        else:
+            yield self.codec.dumpb(value if sanitize is None else sanitize(value))
+
+    def __repr__(self) -> str:
+        return "JSONStream(%s, %r)" % (self.codec.name, type(self.data).__name__)
@@ -0,0 +1,380 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import json
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+from openapi_client.deserializer import _Constructor, _is_model, _Mismatch
+from openapi_client.models.get_assistant200_response import GetAssistant200Response
+from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+from openapi_client.models.list_assistants200_response_inner_config_result import (
+    ListAssistants200ResponseInnerConfigResult,
+)
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+
+# Fields kept as raw JSON until first read, by model. They must be nullable:
+# the rest of the model is validated with them set to None.
+LAZY_FIELDS: Dict[type, Tuple[str, ...]] = {
+    ListAssistants200ResponseInnerConfigResult: ("config",),
+    ListAssistants200ResponseInner: ("raw_yaml",),
+    GetAssistant200Response: ("raw_yaml",),
+}
+
+_object_setattr = object.__setattr__
+
+
+def _lazy_values(model) -> Optional[Dict[str, Any]]:
+    try:
+        return object.__getattribute__(model, "__lazy__")
+    except AttributeError:
+        return None
+
+
+class LazyModel:
+    """Mixin of the lazy variants of the models in `LAZY_FIELDS`.
+
+    A lazy model is an instance of its generated model class. Its lazy fields
+    hold `msgspec.Raw` slices of the response body, which they keep alive,
+    and are decoded and checked on first read. Anything that reads every
+    field at once (`to_dict`, `model_dump`, comparison, copying, pickling,
+    assignment) decodes them first, nested models included.
+    """
+
+    __slots__ = ()
+
+    # name -> callable turning the decoded JSON into the field value
+    __lazy_builders__: Dict[str, Callable[[Any], Any]] = {}
+    __lazy_base__: type = BaseModel
+
+    def __getattr__(self, name):
+        values = _lazy_values(self)
+        if values is not None and name in values:
+            return self.__materialize(name, values)
+        return super().__getattr__(name)  # type: ignore[misc]
+
+    def __materialize(self, name, values):
+        raw = values.get(name)
+        fields = self.__dict__
+        if raw is not None:
+            fields[name] = self.__lazy_builders__[name](_decode(raw))
+            values.pop(name, None)
+        # a concurrent reader may have got here first
+        return fields[name]
+
+    def materialize(self) -> Any:
+        """Decodes every lazy field of this model and of the models it
+        holds; returns the model."""
+        values = _lazy_values(self)
+        if values is not None:
+            for name in list(values):
+                self.__materialize(name, values)
+            # fields read one by one were appended; dumps follow field order
+            fields = self.__dict__
+            _object_setattr(self, "__dict__", {
+                name: fields[name] for name in type(self).model_fields if name in fields
+            })
+            _object_setattr(self, "__lazy__", None)
+        builders = self.__lazy_builders__
+        for name, value in self.__dict__.items():
+            # decoded lazy fields are plain JSON, which can be large
+            if name not in builders:
+                _materialize_value(value)
+        return self
+
+    def __eq__(self, other):
+        self.materialize()
+        if isinstance(other, LazyModel):
+            other.materialize()
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        base = type(self).__lazy_base__
+        other_base = other.__lazy_base__ if isinstance(other, LazyModel) else other.__class__
+        return (
+            base is other_base
+            and self.__dict__ == other.__dict__
+            and self.__pydantic_private__ == other.__pydantic_private__
+            and (self.__pydantic_extra__ or {}) == (other.__pydantic_extra__ or {})
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __setattr__(self, name, value):
+        # validate_assignment revalidates the other fields too
+        self.materialize()
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        self.materialize()
+        super().__delattr__(name)
+
+    def __iter__(self):
+        self.materialize()
+        return super().__iter__()
+
+    def __repr_args__(self):
+        self.materialize()
+        return super().__repr_args__()
+
+    def __copy__(self):
+        self.materialize()
+        copied = super().__copy__()
+        _object_setattr(copied, "__lazy__", None)
+        return copied
+
+    def __deepcopy__(self, memo=None):
+        self.materialize()
+        copied = super().__deepcopy__(memo)
+        _object_setattr(copied, "__lazy__", None)
+        return copied
+
+    def __getstate__(self):
+        self.materialize()
+        return super().__getstate__()
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        _object_setattr(self, "__lazy__", None)
+
+    def model_dump(self, *args, **kwargs):
+        self.materialize()
+        return super().model_dump(*args, **kwargs)
+
+    def model_dump_json(self, *args, **kwargs):
+        self.materialize()
+        return super().model_dump_json(*args, **kwargs)
+
+
+def _materialize_value(value):
+    if isinstance(value, LazyModel):
+        value.materialize()
+    elif isinstance(value, list):
+        for item in value:
+            if isinstance(item, (LazyModel, list, dict)):
+                _materialize_value(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            if isinstance(item, (LazyModel, list, dict)):
+                _materialize_value(item)
+
+
+def materialize(value: Any) -> Any:
+    """Decodes the lazy fields of every model in `value` (a model, or lists
+    and dicts of them); returns `value`."""
+    _materialize_value(value)
+    return value
+
+
+def _decode(raw):
+    try:
+        return msgspec.json.decode(raw)
+    except msgspec.DecodeError:
+        # NaN, lone surrogates: json decides, as in json_codec
+        return json.loads(bytes(raw))
+
+
+def _field_builder(annotation):
+    """Checks a decoded lazy value like `_Constructor`; values it does not
+    accept are validated, raising pydantic's error if they are invalid."""
+    build = _Constructor().for_type(annotation)
+    adapter = TypeAdapter(annotation)
+
+    def build_field(value):
+        if build is not None:
+            try:
+                return build(value)
+            except _Mismatch:
+                pass
+        return adapter.validate_python(value)
+    return build_field
+
+
+class _Compiler:
+    """Compiles a response type into a msgspec type that keeps lazy fields
+    as `msgspec.Raw`, and a function building models from what it decodes.
+
+    Only models holding lazy fields, directly or through nested models, get
+    a struct; other values are decoded normally and left to `from_dict`.
+    """
+
+    def __init__(self) -> None:
+        self._needs: Dict[type, bool] = {}
+        self._models: Dict[type, Tuple[Any, Callable[[Any], Any]]] = {}
+
+    def needs_struct(self, tp) -> bool:
+        if _is_model(tp):
+            if tp not in self._needs:
+                self._needs[tp] = False  # recursive models
+                self._needs[tp] = bool(_lazy_names(tp)) or any(
+                    self.needs_struct(field.annotation) for field in tp.model_fields.values()
+                )
+            return self._needs[tp]
+        return any(self.needs_struct(arg) for arg in get_args(tp))
+
+    def compile(self, tp) -> Tuple[Any, Optional[Callable[[Any], Any]]]:
+        """Returns ``(msgspec type, builder)``; the builder is None when
+        decoded values are used as they are."""
+        if not self.needs_struct(tp):
+            return Any, None
+        if _is_model(tp):
+            return self._for_model(tp)
+        origin = get_origin(tp)
+        args = get_args(tp)
+        if origin in (list, List):
+            item_type, build = self.compile(args[0])
+            if build is None:
+                return Any, None
+            return List[item_type], (
+                lambda value: value if value is None else [build(item) for item in value]
+            )
+        if origin in (dict, Dict):
+            item_type, build = self.compile(args[1])
+            if build is None:
+                return Any, None
+            return Dict[str, item_type], (
+                lambda value: value if value is None else {k: build(v) for k, v in value.items()}
+            )
+        members = [a for a in args if a is not type(None)]
+        if origin is Union and len(members) == 1:
+            item_type, build = self.compile(members[0])
+            if build is None:
+                return Any, None
+            return Optional[item_type], (lambda value: value if value is None else build(value))
+        return Any, None
+
+    def _for_model(self, klass):
+        if klass in self._models:
+            return self._models[klass]
+        lazy_names = _lazy_names(klass)
+        fields = []
+        struct_fields = []
+        for name, field in klass.model_fields.items():
+            alias = field.alias or name
+            if name in lazy_names:
+                struct_fields.append((alias, msgspec.Raw, None))
+                fields.append((name, alias, True, None))
+            else:
+                field_type, build = self.compile(field.annotation)
+                struct_fields.append((alias, Optional[field_type], None))
+                fields.append((name, alias, False, build))
+        struct = msgspec.defstruct(
+            "Lazy" + klass.__name__, struct_fields, kw_only=True, rename=None
+        )
+        lazy_class = lazy_model_class(klass)
+        from_dict = klass.from_dict
+
+        def build_model(decoded):
+            values = {}
+            raws = {}
+            for name, alias, is_lazy, build in fields:
+                value = getattr(decoded, alias)
+                if is_lazy:
+                    if value is not None:
+                        raws[name] = value
+                    value = None
+                elif build is not None:
+                    value = build(value)
+                values[alias] = value
+            model = from_dict(values)
+            lazy = lazy_class.__new__(lazy_class)
+            fields_dict = model.__dict__
+            for name in raws:
+                del fields_dict[name]
+            _object_setattr(lazy, "__dict__", fields_dict)
+            _object_setattr(lazy, "__pydantic_fields_set__", model.__pydantic_fields_set__)
+            _object_setattr(lazy, "__pydantic_extra__", model.__pydantic_extra__)
+            _object_setattr(lazy, "__pydantic_private__", model.__pydantic_private__)
+            _object_setattr(lazy, "__lazy__", raws or None)
+            return lazy
+
+        self._models[klass] = (struct, build_model)
+        return self._models[klass]
+
+
+def _lazy_names(klass) -> Tuple[str, ...]:
+    names = LAZY_FIELDS.get(klass, ())
+    for name in names:
+        field = klass.model_fields[name]
+        if type(None) not in get_args(field.annotation):
+            raise TypeError("Lazy field %s.%s must be nullable" % (klass.__name__, name))
+    return names
+
+
+_lazy_classes: Dict[type, type] = {}
+
+
+def lazy_model_class(klass: type) -> type:
+    """Returns the lazy subclass of the generated model `klass`."""
+    lazy_class = _lazy_classes.get(klass)
+    if lazy_class is None:
+        name = "Lazy" + klass.__name__
+        builders = {
+            field: _field_builder(klass.model_fields[field].annotation)
+            for field in _lazy_names(klass)
+        }
+        lazy_class = type(name, (LazyModel, klass), {
+            "__slots__": ("__lazy__",),
+            "__module__": __name__,
+            "__qualname__": name,
+            "__doc__": "%s with lazily decoded %s." % (
+                klass.__name__, ", ".join(builders) or "nested models"),
+            "__lazy_builders__": builders,
+            "__lazy_base__": klass,
+        })
+        # importable by name, for pickle
+        setattr(sys.modules[__name__], name, lazy_class)
+        _lazy_classes[klass] = lazy_class
+    return lazy_class
+
+
+class LazyDecoder:
+    """Decodes a response of `python_type` into lazy models.
+
+    `decode` raises `DecodeError` when the body is not JSON of the expected
+    shape, so callers can fall back to the eager path for its errors. Types
+    without heavy fields have no lazy form: `lazy` is False for them and
+    they are to be decoded eagerly.
+    """
+
+    DecodeError: Any = None
+
+    def __init__(self, python_type) -> None:
+        if msgspec is None:
+            raise ImportError(
+                "Lazy models require msgspec. "
+                "Install it with `pip install openapi-client[msgspec]`."
+            )
+        msgspec_type, self._build = _Compiler().compile(python_type)
+        self._decoder = msgspec.json.Decoder(msgspec_type)
+
+    @property
+    def lazy(self) -> bool:
+        """Whether `decode` gives lazy models rather than raw values."""
+        return self._build is not None
+
+    def decode(self, text: Union[str, bytes]):
+        if self._build is None:
+            raise TypeError("no lazy form: decode the response eagerly")
+        return self._build(self._decoder.decode(text))
+
+
+if msgspec is not None:
+    LazyDecoder.DecodeError = (msgspec.DecodeError, msgspec.ValidationError)
@@ -12,20 +12,60 @@
     Do not edit the class manually.
 """  # noqa: E501
 
+import importlib
+from typing import TYPE_CHECKING
 
-# import models into model package
-from openapi_client.models.get_assistant200_response import GetAssistant200Response
-from openapi_client.models.get_assistant403_response import GetAssistant403Response
-from openapi_client.models.get_assistant404_response import GetAssistant404Response
-from openapi_client.models.get_free_trial_status200_response import GetFreeTrialStatus200Response
-from openapi_client.models.get_models_add_on_checkout_url200_response import GetModelsAddOnCheckoutUrl200Response
-from openapi_client.models.get_models_add_on_checkout_url500_response import GetModelsAddOnCheckoutUrl500Response
-from openapi_client.models.get_policy200_response import GetPolicy200Response
-from openapi_client.models.list_assistant_full_slugs429_response import ListAssistantFullSlugs429Response
-from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
-from openapi_client.models.list_assistants200_response_inner_config_result import ListAssistants200ResponseInnerConfigResult
-from openapi_client.models.list_assistants401_response import ListAssistants401Response
-from openapi_client.models.list_assistants404_response import ListAssistants404Response
-from openapi_client.models.list_organizations200_response import ListOrganizations200Response
-from openapi_client.models.list_organizations200_response_organizations_inner import ListOrganizations200ResponseOrganizationsInner
-from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+# public names and the modules defining them, imported on first access
+# (PEP 562) so that importing the package stays cheap
+_LAZY_IMPORTS = {
+    # models
+    "GetAssistant200Response": "openapi_client.models.get_assistant200_response",
+    "GetAssistant403Response": "openapi_client.models.get_assistant403_response",
+    "GetAssistant404Response": "openapi_client.models.get_assistant404_response",
+    "GetFreeTrialStatus200Response": "openapi_client.models.get_free_trial_status200_response",
+    "GetModelsAddOnCheckoutUrl200Response": "openapi_client.models.get_models_add_on_checkout_url200_response",
+    "GetModelsAddOnCheckoutUrl500Response": "openapi_client.models.get_models_add_on_checkout_url500_response",
+    "GetPolicy200Response": "openapi_client.models.get_policy200_response",
+    "ListAssistantFullSlugs429Response": "openapi_client.models.list_assistant_full_slugs429_response",
+    "ListAssistants200ResponseInner": "openapi_client.models.list_assistants200_response_inner",
+    "ListAssistants200ResponseInnerConfigResult": "openapi_client.models.list_assistants200_response_inner_config_result",
+    "ListAssistants401Response": "openapi_client.models.list_assistants401_response",
+    "ListAssistants404Response": "openapi_client.models.list_assistants404_response",
+    "ListOrganizations200Response": "openapi_client.models.list_organizations200_response",
+    "ListOrganizations200ResponseOrganizationsInner": "openapi_client.models.list_organizations200_response_organizations_inner",
+    "SyncSecretsRequest": "openapi_client.models.sync_secrets_request",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if TYPE_CHECKING:
+    # import models into model package
+    from openapi_client.models.get_assistant200_response import GetAssistant200Response
+    from openapi_client.models.get_assistant403_response import GetAssistant403Response
+    from openapi_client.models.get_assistant404_response import GetAssistant404Response
+    from openapi_client.models.get_free_trial_status200_response import GetFreeTrialStatus200Response
+    from openapi_client.models.get_models_add_on_checkout_url200_response import GetModelsAddOnCheckoutUrl200Response
+    from openapi_client.models.get_models_add_on_checkout_url500_response import GetModelsAddOnCheckoutUrl500Response
+    from openapi_client.models.get_policy200_response import GetPolicy200Response
+    from openapi_client.models.list_assistant_full_slugs429_response import ListAssistantFullSlugs429Response
+    from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+    from openapi_client.models.list_assistants200_response_inner_config_result import ListAssistants200ResponseInnerConfigResult
+    from openapi_client.models.list_assistants401_response import ListAssistants401Response
+    from openapi_client.models.list_assistants404_response import ListAssistants404Response
+    from openapi_client.models.list_organizations200_response import ListOrganizations200Response
+    from openapi_client.models.list_organizations200_response_organizations_inner import ListOrganizations200ResponseOrganizationsInner
+    from openapi_client.models.sync_secrets_request import SyncSecretsRequest
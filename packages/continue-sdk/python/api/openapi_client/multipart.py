@@ -0,0 +1,198 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import io
+import json
+import mmap
+import os
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
+
+from openapi_client.transport import StreamingBody
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+class FileData:
+    """The contents of the file at `path`, read while the request body is
+    sent rather than when the request is built."""
+
+    __slots__ = ("path",)
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def __repr__(self) -> str:
+        return "FileData(%r)" % (self.path,)
+
+
+def _size(data) -> Optional[int]:
+    """Bytes `data` will produce, or None if that cannot be known before
+    reading it (pipes, sockets)."""
+    if isinstance(data, FileData):
+        return os.stat(data.path).st_size
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return len(data)
+    try:
+        if not data.seekable():
+            return None
+        position = data.tell()
+        end = data.seek(0, io.SEEK_END)
+        data.seek(position)
+    except (AttributeError, OSError):
+        return None
+    return end - position
+
+
+def _read_mapped(f, size, chunk_size) -> Iterator[bytes]:
+    """Yields `size` bytes of the file `f` from its current position,
+    through mmap where the file supports it."""
+    start = f.tell()
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        mapped = None  # empty, special or in-memory files
+    if mapped is None:
+        yield from _read_file(f, size, chunk_size)
+        return
+    try:
+        end = start + size
+        if len(mapped) < end:
+            raise ValueError("%r shrank while it was being sent" % getattr(f, "name", f))
+        for offset in range(start, end, chunk_size):
+            yield mapped[offset:min(offset + chunk_size, end)]
+    finally:
+        mapped.close()
+
+
+def _read_file(f, size, chunk_size) -> Iterator[bytes]:
+    left = size
+    while left is None or left > 0:
+        chunk = f.read(chunk_size if left is None else min(chunk_size, left))
+        if not chunk:
+            if left:
+                raise ValueError("%r shrank while it was being sent" % getattr(f, "name", f))
+            return
+        if left is not None:
+            left -= len(chunk)
+        yield chunk
+
+
+class MultipartEncoder(StreamingBody):
+    """A `multipart/form-data` body produced chunk by chunk as it is sent.
+
+    Encodes like `urllib3.encode_multipart_formdata`, except that file
+    contents given as `FileData` or as binary file objects are read lazily,
+    `chunk_size` bytes at a time (through mmap for regular files), so that
+    memory stays bounded whatever the size of the files. `content_length`
+    is known up front unless a file object cannot seek, such as a pipe;
+    the body is then sent with chunked transfer encoding.
+
+    The body can be iterated several times, e.g. to retry a request; file
+    objects are sought back to where they started.
+
+    :param fields: ``(name, value)`` pairs, where value is a string or a
+        ``(filename, data[, content_type])`` tuple as with urllib3; data is
+        bytes, a string, a `FileData` or a binary file object.
+    :param boundary: multipart boundary, random by default.
+    :param chunk_size: bytes read from files at a time.
+    :param progress: callable receiving ``(bytes sent, content_length)``
+        after each chunk.
+    """
+
+    def __init__(
+        self,
+        fields: List[Tuple[str, Any]],
+        boundary: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> None:
+        self.boundary = boundary or choose_boundary()
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.content_type = "multipart/form-data; boundary=%s" % self.boundary
+        # (encoded part head, data, size of data) per field
+        self._parts = []
+        for name, value in fields:
+            if isinstance(value, dict):
+                value = json.dumps(value)
+            field = RequestField.from_tuples(name, value)
+            data = field.data
+            if isinstance(data, int):
+                data = str(data)
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+            head = ("--%s\r\n" % self.boundary).encode("latin-1")
+            head += field.render_headers().encode("utf-8")
+            self._parts.append((head, data, _size(data)))
+        self._tail = ("--%s--\r\n" % self.boundary).encode("latin-1")
+        sizes = [size for _, _, size in self._parts]
+        if None in sizes:
+            self.content_length = None
+        else:
+            self.content_length = sum(
+                len(head) + size + 2 for (head, _, _), size in zip(self._parts, sizes)
+            ) + len(self._tail)
+
+    def headers(self) -> dict:
+        """`Content-Type` and, when known, `Content-Length` of the body."""
+        headers = {"Content-Type": self.content_type}
+        if self.content_length is not None:
+            headers["Content-Length"] = str(self.content_length)
+        return headers
+
+    def _data(self, data, size) -> Iterator[bytes]:
+        chunk_size = self.chunk_size
+        if isinstance(data, FileData):
+            with open(data.path, "rb") as f:
+                yield from _read_mapped(f, size, chunk_size)
+        elif isinstance(data, (bytes, bytearray)):
+            if data:
+                yield bytes(data)
+        elif isinstance(data, memoryview):
+            if data:
+                yield data.tobytes()
+        else:
+            start = data.tell() if size is not None else None
+            try:
+                if size is not None:
+                    yield from _read_mapped(data, size, chunk_size)
+                else:
+                    yield from _read_file(data, None, chunk_size)
+            finally:
+                if start is not None:
+                    data.seek(start)
+
+    def _chunks(self) -> Iterator[bytes]:
+        for head, data, size in self._parts:
+            yield head
+            yield from self._data(data, size)
+            yield b"\r\n"
+        yield self._tail
+
+    def __iter__(self) -> Iterator[bytes]:
+        sent = 0
+        progress = self.progress
+        for chunk in self._chunks():
+            yield chunk
+            if progress is not None:
+                sent += len(chunk)
+                progress(sent, self.content_length)
+
+    def __repr__(self) -> str:
+        return "MultipartEncoder(%d fields, content_length=%r)" % (
+            len(self._parts), self.content_length
+        )
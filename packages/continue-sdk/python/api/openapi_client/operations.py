@@ -0,0 +1,676 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import inspect
+import re
+import threading
+from typing import Any, Dict, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+# calling styles of every operation, by suffix of the method name: the
+# deserialized data, an `ApiResponse`, or the raw response left unread
+DATA = ""
+HTTP_INFO = "_with_http_info"
+RAW = "_without_preload_content"
+STYLES = (DATA, HTTP_INFO, RAW)
+
+# where a parameter goes in the request
+PATH = "path"
+QUERY = "query"
+HEADER = "header"
+BODY = "body"
+
+# arguments every method takes after those of its operation
+_COMMON_PARAMETERS = (
+    ("_request_timeout", "Union[None, Annotated[StrictFloat, Field(gt=0)], "
+                         "Tuple[Annotated[StrictFloat, Field(gt=0)], "
+                         "Annotated[StrictFloat, Field(gt=0)]]]", None),
+    ("_request_auth", "Optional[Dict[StrictStr, Any]]", None),
+    ("_content_type", "Optional[StrictStr]", None),
+    ("_headers", "Optional[Dict[StrictStr, Any]]", None),
+    ("_host_index", "Annotated[StrictInt, Field(ge=0, le=0)]", 0),
+)
+
+_COMMON_DOC = """:param _request_timeout: timeout setting for this request. If one
+                         number provided, it will be total request
+                         timeout. It can also be a pair (tuple) of
+                         (connection, read) timeouts.
+:type _request_timeout: int, tuple(int, int), optional
+:param _request_auth: set to override the auth_settings for an a single
+                      request; this effectively ignores the
+                      authentication in the spec for a single request.
+:type _request_auth: dict, optional
+:param _content_type: force content-type for the request.
+:type _content_type: str, Optional
+:param _headers: set to override the headers for a single
+                 request; this effectively ignores the headers
+                 in the spec for a single request.
+:type _headers: dict, optional
+:param _host_index: set to override the host_index for a single
+                    request; this effectively ignores the host_index
+                    in the spec for a single request.
+:type _host_index: int, optional
+:return: Returns the result object."""
+
+
+class _TypeNamespace(dict):
+    """Names of the table's type expressions, resolved on lookup."""
+
+    def __missing__(self, name):
+        import typing
+        import openapi_client.models
+
+        if name in ("Annotated", "Field", "StrictFloat", "StrictInt", "StrictStr"):
+            import pydantic
+            import typing_extensions
+            value = getattr(typing_extensions if name == "Annotated" else pydantic, name)
+        elif hasattr(typing, name):
+            value = getattr(typing, name)
+        else:
+            value = getattr(openapi_client.models, name)
+        self[name] = value
+        return value
+
+
+_type_namespace = _TypeNamespace()
+
+
+def resolve_type(type_string: str) -> Any:
+    """Evaluates a type expression of the table, such as
+    ``"Optional[StrictStr]"`` or ``"List[ListAssistants200ResponseInner]"``;
+    other names are looked up in `openapi_client.models`."""
+    return eval(type_string, {"__builtins__": {"object": object, "None": None}}, _type_namespace)
+
+
+class Param:
+    """A parameter of an operation.
+
+    :param name: Python name of the argument.
+    :param location: `PATH`, `QUERY`, `HEADER` or `BODY`.
+    :param wire_name: name in the request, the Python name by default.
+    :param type: type expression, see `resolve_type`.
+    :param required: whether the argument is required; optional ones
+        default to None and are left out of the request when None.
+    :param description: shown in docstrings and validation errors.
+    """
+
+    __slots__ = ("name", "location", "wire_name", "type", "required", "description")
+
+    def __init__(
+        self,
+        name: str,
+        location: str,
+        type: str = "StrictStr",
+        wire_name: Optional[str] = None,
+        required: bool = False,
+        description: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.location = location
+        self.type = type
+        self.wire_name = wire_name or name
+        self.required = required
+        self.description = description
+
+    @property
+    def annotation(self) -> str:
+        """Type expression of the argument, as the generator wrote it."""
+        annotation = self.type if self.required else "Optional[%s]" % self.type
+        if self.description is not None:
+            annotation = "Annotated[%s, Field(description=%r)]" % (annotation, self.description)
+        return annotation
+
+    def __repr__(self) -> str:
+        return "Param(%r, %r)" % (self.name, self.location)
+
+
+class Operation:
+    """Everything needed to call one endpoint: the table row `DefaultApi`
+    and `AsyncDefaultApi` methods are generated from.
+
+    :param operation_id: name of the plain method.
+    :param method: HTTP method.
+    :param path: path template, relative to the host.
+    :param params: the operation's `Param`s, in signature order.
+    :param response_types: response type string by status code, as
+        `ApiClient.response_deserialize` takes it.
+    :param summary: first line of the docstrings.
+    :param notes: longer description.
+    :param accept: media types the response can have.
+    :param content_types: media types of the body, if it takes one.
+    :param auth: names of the authentication settings to apply.
+    """
+
+    def __init__(
+        self,
+        operation_id: str,
+        method: str,
+        path: str,
+        params: Sequence[Param] = (),
+        response_types: Optional[Dict[str, Optional[str]]] = None,
+        summary: str = "",
+        notes: str = "",
+        accept: Sequence[str] = ("application/json",),
+        content_types: Sequence[str] = (),
+        auth: Sequence[str] = ("apiKeyAuth",),
+    ) -> None:
+        self.operation_id = operation_id
+        self.method = method
+        self.path = path
+        self.params = tuple(params)
+        self.response_types = response_types or {}
+        self.summary = summary
+        self.notes = notes
+        self.accept = list(accept)
+        self.content_types = list(content_types)
+        self.auth = list(auth)
+        self._names = (
+            tuple(p.name for p in self.params) + tuple(n for n, _, _ in _COMMON_PARAMETERS)
+        )
+        self._defaults = dict.fromkeys(self._names)
+        self._defaults["_host_index"] = 0
+        self._required = tuple((i, p.name) for i, p in enumerate(self.params) if p.required)
+        self._validator = None
+        self._template: Optional[RequestTemplate] = None
+        self._lock = threading.Lock()
+
+    @property
+    def return_type(self) -> str:
+        """Type expression of the deserialized data of a 2XX response."""
+        for status, response_type in self.response_types.items():
+            if status.startswith("2") and response_type is not None:
+                return response_type
+        return "None"
+
+    def signature(self, style: str = DATA) -> inspect.Signature:
+        """Signature of the `style` method, without `self`; annotations
+        are type expressions."""
+        parameters = [
+            inspect.Parameter(
+                p.name, inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=inspect.Parameter.empty if p.required else None,
+                annotation=p.annotation,
+            )
+            for p in self.params
+        ]
+        parameters.extend(
+            inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                              default=default, annotation=annotation)
+            for name, annotation, default in _COMMON_PARAMETERS
+        )
+        if style == DATA:
+            returns = self.return_type
+        elif style == HTTP_INFO:
+            returns = "ApiResponse[%s]" % self.return_type
+        else:
+            returns = "RESTResponseType"
+        return inspect.Signature(parameters, return_annotation=returns)
+
+    @property
+    def docstring(self) -> str:
+        lines = [self.summary, ""]
+        if self.notes:
+            lines += [self.notes, ""]
+        for p in self.params:
+            text = p.description or ""
+            if p.required:
+                text = (text + " (required)").lstrip()
+            lines.append(":param %s: %s" % (p.name, text))
+            lines.append(":type %s: %s" % (p.name, "str" if p.type == "StrictStr" else p.type))
+        return "\n".join(lines) + "\n" + _COMMON_DOC
+
+    def validate(self, args, kwargs) -> Dict[str, Any]:
+        """Validates the arguments of a call as `validate_call` does and
+        returns them by name, defaults included."""
+        validator = self._validator
+        if validator is None:
+            validator = self._build_validator()
+        return validator(*args, **kwargs)
+
+    def _build_validator(self):
+        # built on the first call, once for all three calling styles
+        with self._lock:
+            if self._validator is None:
+                from pydantic import validate_call
+
+                signature = self.signature().replace(return_annotation=inspect.Signature.empty)
+                signature = signature.replace(parameters=[
+                    p.replace(annotation=resolve_type(p.annotation))
+                    for p in signature.parameters.values()
+                ])
+
+                def bind(*args, **kwargs):
+                    bound = signature.bind(*args, **kwargs)
+                    bound.apply_defaults()
+                    return bound.arguments
+
+                bind.__name__ = bind.__qualname__ = self.operation_id
+                bind.__signature__ = signature  # type: ignore[attr-defined]
+                bind.__annotations__ = {
+                    p.name: p.annotation for p in signature.parameters.values()
+                }
+                self._validator = validate_call(bind)
+            return self._validator
+
+    def bind(self, args, kwargs) -> Dict[str, Any]:
+        """Binds the arguments of a call to the operation's parameters, as
+        `validate` does, but passes the values on as they are: only calls
+        that do not fit the signature raise, with a `TypeError`."""
+        names = self._names
+        if len(args) > len(names):
+            raise TypeError("%s() takes %d positional arguments but %d were given"
+                            % (self.operation_id, len(names), len(args)))
+        values = dict(self._defaults)
+        values.update(zip(names, args))
+        for name in kwargs:
+            if name not in values:
+                raise TypeError("%s() got an unexpected keyword argument %r"
+                                % (self.operation_id, name))
+            if names.index(name) < len(args):
+                raise TypeError("%s() got multiple values for argument %r"
+                                % (self.operation_id, name))
+        values.update(kwargs)
+        for index, name in self._required:
+            if index >= len(args) and name not in kwargs:
+                raise TypeError("%s() missing required argument %r" % (self.operation_id, name))
+        return values
+
+    def arguments(self, **kwargs) -> Dict[str, Any]:
+        """Unvalidated arguments by name: those given, None for the other
+        parameters and the defaults of the common ones."""
+        values = dict(self._defaults)
+        for name in kwargs:
+            if name not in values:
+                raise TypeError("%s() got an unexpected keyword argument %r"
+                                % (self.operation_id, name))
+        values.update(kwargs)
+        return values
+
+    @property
+    def template(self) -> "RequestTemplate":
+        """The operation's `RequestTemplate`, compiled on first use."""
+        template = self._template
+        if template is None:
+            template = self._template = RequestTemplate(self)
+        return template
+
+    def serialize(self, api_client, **kwargs) -> Tuple:
+        """Serializes a request, as the generated ``_<operation>_serialize``
+        methods did, from keyword arguments that are not validated."""
+        return self.template.serialize(api_client, self.arguments(**kwargs))
+
+    def __repr__(self) -> str:
+        return "Operation(%r, %r, %r)" % (self.operation_id, self.method, self.path)
+
+
+def _prefer_json(media_types: Sequence[str]) -> Optional[str]:
+    # the choice of `ApiClient.select_header_accept` and
+    # `select_header_content_type`
+    for media_type in media_types:
+        if re.search('json', media_type, re.IGNORECASE):
+            return media_type
+    return media_types[0] if media_types else None
+
+
+class RequestTemplate:
+    """The parts of an operation's requests that do not change between
+    calls, worked out once: the path split around its parameters, the
+    parameters by location, and the `Accept` and default `Content-Type`
+    headers.
+
+    `serialize` gives the same requests as `ApiClient.param_serialize`
+    with the generated arguments; it also takes the client's headers
+    and authentication from `ApiClient.base_headers` and
+    `ApiClient.auth_params`, which are only built again when they change.
+    Values that are not strings go through `sanitize_for_serialization`
+    as before.
+    """
+
+    __slots__ = ("method", "path", "accept", "content_type", "auth",
+                 "_path_parts", "_path_slots", "_query", "_headers", "_body")
+
+    def __init__(self, operation: Operation) -> None:
+        self.method = operation.method
+        self.path = operation.path
+        self.accept = _prefer_json(operation.accept)
+        self.content_type = _prefer_json(operation.content_types)
+        self.auth = tuple(operation.auth)
+        names = {p.wire_name: p.name for p in operation.params if p.location == PATH}
+        # literal parts at even indexes, parameter names at odd ones
+        self._path_parts = re.split(r"\{([^{}]+)\}", operation.path)
+        self._path_slots = tuple(
+            (index, names[part])
+            for index, part in enumerate(self._path_parts)
+            if index % 2 and part in names
+        )
+        for index in range(1, len(self._path_parts), 2):
+            self._path_parts[index] = "{%s}" % self._path_parts[index]
+        self._query = tuple((p.name, p.wire_name) for p in operation.params if p.location == QUERY)
+        self._headers = tuple(
+            (p.name, p.wire_name) for p in operation.params if p.location == HEADER
+        )
+        bodies = [p.name for p in operation.params if p.location == BODY]
+        self._body = bodies[0] if bodies else None
+
+    def serialize(self, api_client, values: Dict[str, Any]) -> Tuple:
+        """Returns the `RequestSerialized` tuple of a call, from its
+        arguments by name."""
+        config = api_client.configuration
+        sanitize = api_client.sanitize_for_serialization
+
+        # header parameters
+        headers: Dict[str, Any] = {}
+        if values["_headers"]:
+            headers.update(values["_headers"])
+        for name, wire_name in self._headers:
+            if values[name] is not None:
+                headers[wire_name] = values[name]
+        if self.accept is not None and 'Accept' not in headers:
+            headers['Accept'] = self.accept
+        if self.content_type is not None:
+            headers['Content-Type'] = values["_content_type"] or self.content_type
+        for key, value in headers.items():
+            if type(value) is not str:
+                headers[key] = sanitize(value)
+        base, accept_encoding = api_client.base_headers()
+        headers.update(base)
+        if accept_encoding is not None:
+            headers.setdefault('Accept-Encoding', accept_encoding)
+
+        # path parameters
+        if self._path_slots:
+            parts = list(self._path_parts)
+            safe = config.safe_chars_for_path_param
+            for index, name in self._path_slots:
+                value = values[name]
+                if value is not None:
+                    if type(value) is not str:
+                        value = str(sanitize(value))
+                    parts[index] = quote(value, safe=safe)
+            path = "".join(parts)
+        else:
+            path = self.path
+
+        # query parameters
+        queries = [(wire_name, values[name]) for name, wire_name in self._query
+                   if values[name] is not None]
+
+        # auth setting
+        request_auth = values["_request_auth"]
+        if request_auth:
+            api_client.update_params_for_auth(
+                headers, queries, self.auth, path, self.method, None,
+                request_auth=request_auth,
+            )
+        elif self.auth:
+            auth_headers, auth_queries = api_client.auth_params(self.auth)
+            headers.update(auth_headers)
+            queries.extend(auth_queries)
+
+        # body
+        body = None
+        if self._body is not None:
+            body = api_client.serialize_body(
+                self.method, values[self._body], headers.get('Content-Type')
+            )
+
+        url = config.host + path
+        if queries:
+            pairs = []
+            for key, value in queries:
+                if type(value) is bool:
+                    value = "true" if value else "false"
+                if type(value) is str:
+                    pairs.append(key + "=" + quote(value))
+                else:
+                    pairs.append(
+                        api_client.parameters_to_url_query([(key, sanitize(value))], None)
+                    )
+            url += "?" + "&".join(pairs)
+        return self.method, url, headers, body, []
+
+
+def serialize(api_client, operation: Operation, values: Dict[str, Any]) -> Tuple:
+    """Returns the `RequestSerialized` tuple of a call, from its arguments by
+    name."""
+    return operation.template.serialize(api_client, values)
+
+
+def call(api_client, operation: Operation, style: str, values: Dict[str, Any]):
+    """Sends a call with an `ApiClient` and returns what the `style`
+    method returns."""
+    param = serialize(api_client, operation, values)
+    response_data = api_client.call_api(*param, _request_timeout=values["_request_timeout"])
+    if style == RAW:
+        return response_data.response
+    response_data.read()
+    response = api_client.response_deserialize(
+        response_data=response_data,
+        response_types_map=operation.response_types,
+    )
+    return response.data if style == DATA else response
+
+
+async def call_async(api_client, operation: Operation, style: str, values: Dict[str, Any]):
+    """`call` for an `AsyncApiClient`."""
+    param = serialize(api_client, operation, values)
+    response_data = await api_client.call_api(*param, _request_timeout=values["_request_timeout"])
+    if style == RAW:
+        return response_data.response
+    await response_data.read()
+    response = api_client.response_deserialize(
+        response_data=response_data,
+        response_types_map=operation.response_types,
+    )
+    return response.data if style == DATA else response
+
+
+def _method(cls, operation: Operation, style: str, asynchronous: bool):
+    # arguments are validated unless the client's configuration turned
+    # `client_side_validation` off
+    if asynchronous:
+        async def method(self, *args, **kwargs):
+            if self.api_client.client_side_validation:
+                values = operation.validate(args, kwargs)
+            else:
+                values = operation.bind(args, kwargs)
+            return await call_async(self.api_client, operation, style, values)
+    else:
+        def method(self, *args, **kwargs):
+            if self.api_client.client_side_validation:
+                values = operation.validate(args, kwargs)
+            else:
+                values = operation.bind(args, kwargs)
+            return call(self.api_client, operation, style, values)
+
+    signature = operation.signature(style)
+    self_parameter = inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    method.__signature__ = signature.replace(  # type: ignore[attr-defined]
+        parameters=[self_parameter, *signature.parameters.values()]
+    )
+    method.__name__ = operation.operation_id + style
+    method.__qualname__ = "%s.%s" % (cls.__qualname__, method.__name__)
+    method.__module__ = cls.__module__
+    method.__doc__ = operation.docstring
+    return method
+
+
+def _serialize_method(cls, operation: Operation):
+    def serialize_method(self, **kwargs):
+        return operation.serialize(self.api_client, **kwargs)
+
+    serialize_method.__name__ = "_%s_serialize" % operation.operation_id
+    serialize_method.__qualname__ = "%s.%s" % (cls.__qualname__, serialize_method.__name__)
+    serialize_method.__module__ = cls.__module__
+    return serialize_method
+
+
+def api_methods(asynchronous: bool = False):
+    """Class decorator adding the methods of every operation in `OPERATIONS`
+    to an API class: the three calling styles, validated like
+    `validate_call` unless `Configuration.client_side_validation` is off,
+    and ``_<operation>_serialize``. Methods the class defines itself are
+    kept."""
+    def decorate(cls):
+        for operation in OPERATIONS.values():
+            methods = [_method(cls, operation, style, asynchronous) for style in STYLES]
+            methods.append(_serialize_method(cls, operation))
+            for method in methods:
+                if method.__name__ not in cls.__dict__:
+                    setattr(cls, method.__name__, method)
+        return cls
+    return decorate
+
+
+def _index(operations) -> Dict[str, Operation]:
+    return {operation.operation_id: operation for operation in operations}
+
+
+_ALWAYS_USE_PROXY = Param(
+    "always_use_proxy", QUERY, wire_name="alwaysUseProxy",
+    description="Whether to always use the Continue-managed proxy for model requests",
+)
+_ORGANIZATION_ID = Param(
+    "organization_id", QUERY, wire_name="organizationId",
+    description=(
+        "ID of the organization to scope assistants to. If not provided, personal assistants are "
+        "returned."
+    ),
+)
+
+# every operation of the API, by operation id
+OPERATIONS: Dict[str, Operation] = _index([
+    Operation(
+        "get_assistant", "GET", "/ide/get-assistant/{ownerSlug}/{packageSlug}",
+        params=[
+            Param("owner_slug", PATH, wire_name="ownerSlug", required=True,
+                  description="Slug of the user or organization that owns the assistant"),
+            Param("package_slug", PATH, wire_name="packageSlug", required=True,
+                  description="Slug of the assistant package"),
+            _ALWAYS_USE_PROXY,
+            _ORGANIZATION_ID,
+        ],
+        response_types={
+            '200': "GetAssistant200Response",
+            '401': "ListAssistants401Response",
+            '403': "GetAssistant403Response",
+            '404': "GetAssistant404Response",
+        },
+        summary="Get a specific assistant by slug",
+        notes=(
+            "Returns a single assistant configuration by its owner and package slug. This "
+            "endpoint is useful when you need to retrieve or refresh a specific assistant without "
+            "fetching the entire list."
+        ),
+    ),
+    Operation(
+        "get_free_trial_status", "GET", "/ide/free-trial-status",
+        response_types={
+            '200': "GetFreeTrialStatus200Response",
+            '404': "ListAssistants404Response",
+        },
+        summary="Get free trial status for user",
+        notes=(
+            "Returns the current free trial status for the authenticated user, including usage "
+            "counts and limits for chat and autocomplete features."
+        ),
+    ),
+    Operation(
+        "get_models_add_on_checkout_url", "GET", "/ide/get-models-add-on-checkout-url",
+        params=[
+            Param("profile_id", QUERY,
+                  description="Profile ID to include in the callback URL"),
+            Param("vscode_uri_scheme", QUERY,
+                  description="VS Code URI scheme to include in the callback URL"),
+        ],
+        response_types={
+            '200': "GetModelsAddOnCheckoutUrl200Response",
+            '404': "ListAssistants404Response",
+            '500': "GetModelsAddOnCheckoutUrl500Response",
+        },
+        summary="Get Stripe checkout URL for models add-on",
+        notes=(
+            "Creates a Stripe checkout session for the models add-on subscription and returns the "
+            "checkout URL."
+        ),
+    ),
+    Operation(
+        "get_policy", "GET", "/ide/policy",
+        response_types={
+            '200': "GetPolicy200Response",
+            '404': "ListAssistants404Response",
+        },
+        summary="Get organization policy",
+        notes=(
+            "Returns the policy configuration for the first organization that the user belongs to "
+            "which has a policy configured."
+        ),
+    ),
+    Operation(
+        "list_assistant_full_slugs", "GET", "/ide/list-assistant-full-slugs",
+        response_types={
+            '429': "ListAssistantFullSlugs429Response",
+        },
+        summary="List assistant full slugs (currently returns 429)",
+        notes=(
+            "This endpoint is temporarily disabled and returns a 429 status code to prevent "
+            "constant refreshes of the full assistant list until a fixed client version can be "
+            "deployed."
+        ),
+    ),
+    Operation(
+        "list_assistants", "GET", "/ide/list-assistants",
+        params=[_ALWAYS_USE_PROXY, _ORGANIZATION_ID],
+        response_types={
+            '200': "List[ListAssistants200ResponseInner]",
+            '401': "ListAssistants401Response",
+            '404': "ListAssistants404Response",
+        },
+        summary="List assistants for IDE",
+        notes=(
+            "Returns a complete list of assistants available to the user, with their full "
+            "configurations, icons, and other metadata needed by the IDE to display and use "
+            "them.  This endpoint performs a full refresh of the list of assistants, including "
+            "unrolling configurations and resolving secrets."
+        ),
+    ),
+    Operation(
+        "list_organizations", "GET", "/ide/list-organizations",
+        response_types={
+            '200': "ListOrganizations200Response",
+            '404': "ListAssistants404Response",
+        },
+        summary="List organizations for user",
+        notes=(
+            "Returns a list of organizations that the authenticated user belongs to, including "
+            "organization metadata and pre-signed icon URLs."
+        ),
+    ),
+    Operation(
+        "sync_secrets", "POST", "/ide/sync-secrets",
+        params=[
+            Param("sync_secrets_request", BODY, type="SyncSecretsRequest", required=True),
+        ],
+        response_types={
+            '200': "List[Optional[object]]",
+            '404': "ListAssistants404Response",
+        },
+        summary="Synchronize secrets for user",
+        notes=(
+            "Resolves and synchronizes secrets for the authenticated user based on the provided "
+            "Fully Qualified Secret Names (FQSNs)."
+        ),
+        content_types=("application/json",),
+    ),
+])
@@ -0,0 +1,246 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import asyncio
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from openapi_client.exceptions import ApiValueError, RateLimitExceededException
+from openapi_client.routes import match_route
+
+BLOCK = "block"
+FAIL_FAST = "fail_fast"
+
+
+class RateLimit:
+    """A token bucket: `rate` requests per second on average, and bursts of
+    up to `burst` requests (default: one second's worth)."""
+
+    __slots__ = ("rate", "burst")
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ApiValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(rate, 1))
+
+    def __repr__(self) -> str:
+        return "RateLimit(rate=%r, burst=%r)" % (self.rate, self.burst)
+
+
+def _take(tokens, updated, now, limit, max_wait):
+    """Refills a bucket and tries to reserve one token.
+
+    :return: ``(tokens, updated, granted, wait)``. When granted, the token
+        is reserved (the balance may go negative) and the caller must wait
+        `wait` seconds before sending; otherwise nothing is taken and `wait`
+        is the delay until a token would be available.
+    """
+    if now > updated:
+        tokens = min(limit.burst, tokens + (now - updated) * limit.rate)
+    updated = now
+    wait = max(0.0, (1 - tokens) / limit.rate)
+    if max_wait is not None and wait > max_wait:
+        return tokens, updated, False, wait
+    return tokens - 1, updated, True, wait
+
+
+class MemoryBackend:
+    """Buckets held in this process, shared by its threads."""
+
+    def __init__(self) -> None:
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, key, limit, now, max_wait):
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (limit.burst, now))
+            tokens, updated, granted, wait = _take(tokens, updated, now, limit, max_wait)
+            self._buckets[key] = (tokens, updated)
+        return granted, wait
+
+
+def _shared_memory_dir():
+    return "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+class SharedMemoryBackend:
+    """Buckets in a memory-mapped file, shared by every process that opens
+    the same `path` on this machine.
+
+    The table holds `slots` buckets (open addressing on a 64-bit key hash)
+    and is locked with `fcntl.flock`, so this backend needs a POSIX system.
+    Time is read from the system-wide monotonic clock.
+
+    :param path: file backing the table; by default in `/dev/shm`.
+    :param slots: bucket capacity, used when the file is created.
+    """
+
+    _MAGIC = b"OACRLv1\0"
+    _HEADER = struct.Struct("<8sI4x")
+    _SLOT = struct.Struct("<Qdd")
+
+    def __init__(self, path: Optional[str] = None, slots: int = 1024) -> None:
+        try:
+            import fcntl
+        except ImportError:  # pragma: no cover - Windows
+            raise ImportError("SharedMemoryBackend requires fcntl (POSIX)")
+        self._fcntl = fcntl
+        self.path = path or os.path.join(
+            _shared_memory_dir(), "openapi-client-rate-limit"
+        )
+        self._lock = threading.Lock()
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            header = os.pread(self._fd, self._HEADER.size, 0)
+            if len(header) == self._HEADER.size:
+                magic, existing = self._HEADER.unpack(header)
+                if magic != self._MAGIC:
+                    raise ApiValueError("%s is not a rate limit table" % self.path)
+                slots = existing
+            else:
+                os.ftruncate(self._fd, self._HEADER.size + slots * self._SLOT.size)
+                os.pwrite(self._fd, self._HEADER.pack(self._MAGIC, slots), 0)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self.slots = slots
+        self._map = mmap.mmap(self._fd, self._HEADER.size + slots * self._SLOT.size)
+
+    @staticmethod
+    def _hash(key):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+        return struct.unpack("<Q", digest)[0] or 1
+
+    def take(self, key, limit, now, max_wait):
+        h = self._hash(key)
+        with self._lock:
+            self._fcntl.flock(self._fd, self._fcntl.LOCK_EX)
+            try:
+                for i in range(self.slots):
+                    offset = self._HEADER.size + ((h + i) % self.slots) * self._SLOT.size
+                    slot_hash, tokens, updated = self._SLOT.unpack_from(self._map, offset)
+                    if slot_hash == h:
+                        break
+                    if slot_hash == 0:
+                        tokens, updated = limit.burst, now
+                        break
+                else:
+                    raise ApiValueError(
+                        "rate limit table %s is full (%d slots)" % (self.path, self.slots)
+                    )
+                tokens, updated, granted, wait = _take(tokens, updated, now, limit, max_wait)
+                self._SLOT.pack_into(self._map, offset, h, tokens, updated)
+            finally:
+                self._fcntl.flock(self._fd, self._fcntl.LOCK_UN)
+        return granted, wait
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+
+class RateLimiter:
+    """Client-side token-bucket rate limiting.
+
+    Set it on `Configuration.rate_limiter`::
+
+        configuration.rate_limiter = RateLimiter({
+            "/ide/list-assistants": RateLimit(0.5, burst=2),
+            "default": RateLimit(10, burst=20),
+        })
+
+    `limits` maps resource paths, as declared by the API (e.g.
+    `/ide/get-assistant/{ownerSlug}/{packageSlug}`), to a `RateLimit`; the
+    "default" entry gives every other path a bucket of its own, and without
+    it those paths are not throttled. With `per_token` each bearer token
+    (tenant) gets its own buckets, otherwise they are shared by every caller.
+
+    Every request sent to the network takes a token, including retries;
+    responses served by the cache or a coalesced request do not. In
+    `"block"` mode the caller waits for its token (awaits, in
+    `AsyncApiClient`); a wait longer than `max_wait` raises
+    `RateLimitExceededException` instead, as does any wait in
+    `"fail_fast"` mode.
+
+    :param backend: where the buckets live: `MemoryBackend` (default) for
+        one process, `SharedMemoryBackend` for every process on the machine.
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, RateLimit],
+        per_token: bool = True,
+        mode: str = BLOCK,
+        max_wait: Optional[float] = None,
+        backend=None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], object] = time.sleep,
+    ) -> None:
+        if mode not in (BLOCK, FAIL_FAST):
+            raise ApiValueError("mode must be %r or %r" % (BLOCK, FAIL_FAST))
+        self.limits = dict(limits)
+        self.per_token = per_token
+        self.mode = mode
+        self.max_wait = max_wait
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.clock = clock
+        self.sleep = sleep
+
+    def _acquire(self, method, url, headers):
+        """Reserves a token; returns the seconds to wait before sending."""
+        route = match_route(method, url)
+        template = route[1] if route is not None else None
+        limit = self.limits.get(template) if template is not None else None
+        if limit is None:
+            limit = self.limits.get("default")
+        if limit is None:
+            return 0.0
+        key = template or "default"
+        if self.per_token:
+            authorization = ""
+            for name, value in (headers or {}).items():
+                if name.lower() == "authorization":
+                    authorization = str(value)
+            key += "\0" + hashlib.sha256(authorization.encode("utf-8")).hexdigest()
+        max_wait = 0.0 if self.mode == FAIL_FAST else self.max_wait
+        granted, wait = self.backend.take(key, limit, self.clock(), max_wait)
+        if not granted:
+            raise RateLimitExceededException(retry_after=wait)
+        return wait
+
+    def request(self, send, method, url, headers):
+        """Sends the request through `send` once a token is available.
+
+        :param send: callable taking the request headers and returning a
+            `rest.RESTResponse`.
+        """
+        wait = self._acquire(method, url, headers)
+        if wait > 0:
+            self.sleep(wait)
+        return send(headers)
+
+    async def request_async(self, send, method, url, headers):
+        """Asyncio counterpart of `request`; `send` is a coroutine function
+        returning an `async_rest.RESTResponse`."""
+        wait = self._acquire(method, url, headers)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return await send(headers)
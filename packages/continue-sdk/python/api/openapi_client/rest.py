@@ -16,13 +16,21 @@ import io
 import json
 import re
 import ssl
+from urllib.parse import urlencode
 
 import urllib3
+from urllib3._collections import HTTPHeaderDict
 
+from openapi_client.compression import content_encoding
 from openapi_client.exceptions import ApiException, ApiValueError
+from openapi_client.json_codec import JSONBody, JSONStream
+from openapi_client.multipart import MultipartEncoder
+from openapi_client.transport import Transport
 
 SUPPORTED_SOCKS_PROXIES = {"socks5", "socks5h", "socks4", "socks4a"}
 RESTResponseType = urllib3.HTTPResponse
+# decoded bytes read at a time from compressed bodies
+_DECODE_CHUNK_SIZE = 1 << 16
 
 
 def is_socks_proxy_url(url):
@@ -42,12 +50,54 @@ class RESTResponse(io.IOBase):
         self.status = resp.status
         self.reason = resp.reason
         self.data = None
+        # coalesce.SharedResult when several callers share this response
+        self.shared = None
+        # called with (bytes received, bytes decoded) once the body has
+        # been read, see compression.TransferMetrics
+        self.on_body = None
 
     def read(self):
         if self.data is None:
-            self.data = self.response.data
+            if content_encoding(self) is None:
+                self.data = self.response.data
+                received = self.response.tell()
+            else:
+                # decoded a chunk at a time, so that the compressed body is
+                # never held in full next to the decoded one
+                body = io.BytesIO()
+                for chunk in self.response.stream(_DECODE_CHUNK_SIZE):
+                    body.write(chunk)
+                self.data = body.getvalue()
+                received = self.response.tell()
+                # the stream left the urllib3 response empty; callers of
+                # `_without_preload_content` get one holding the body
+                self.response = _preloaded(self.response, self.data)
+            if self.on_body is not None:
+                self.on_body(received, len(self.data))
         return self.data
 
+    def stream(self, chunk_size=65536):
+        """Yields the body in chunks as it arrives, or all of it at once if
+        it was already read. The connection is released when the body has
+        been read to the end, and closed if the iteration stops early."""
+        if self.data is not None:
+            yield self.data
+            return
+        completed = False
+        decoded = 0
+        try:
+            for chunk in self.response.stream(chunk_size):
+                decoded += len(chunk)
+                yield chunk
+            completed = True
+        finally:
+            if completed:
+                self.response.release_conn()
+            else:
+                self.response.close()
+        if self.on_body is not None:
+            self.on_body(self.response.tell(), decoded)
+
     def getheaders(self):
         """Returns a dictionary of the response headers."""
         return self.response.headers
@@ -57,7 +107,108 @@ class RESTResponse(io.IOBase):
         return self.response.headers.get(name, default)
 
 
-class RESTClientObject:
+def _preloaded(resp, data):
+    """A copy of the read urllib3 response `resp` whose `data` is the
+    decoded body `data`."""
+    resp.release_conn()
+    return urllib3.HTTPResponse(
+        body=io.BytesIO(data),
+        headers=resp.headers,
+        status=resp.status,
+        version=resp.version,
+        reason=resp.reason,
+        preload_content=True,
+        decode_content=False,
+        retries=resp.retries,
+        request_url=resp.url,
+    )
+
+
+def build_response(status, headers, body, reason=None):
+    """Wraps a response produced outside urllib3 in a `RESTResponse`.
+
+    :param status: HTTP status code.
+    :param headers: response headers, as a mapping or list of pairs.
+    :param body: response body, as bytes or a readable file-like object.
+    :param reason: HTTP reason phrase.
+    :return: RESTResponse whose `response` is a streaming urllib3 response.
+    """
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        body = io.BytesIO(body)
+    return RESTResponse(urllib3.HTTPResponse(
+        body=body,
+        headers=HTTPHeaderDict(headers),
+        status=status,
+        reason=reason,
+        preload_content=False,
+        decode_content=True,
+    ))
+
+
+def serialize_body(method, headers, body=None, post_params=None):
+    """Encodes the request body for transports.
+
+    :param method: http request method
+    :param headers: http request headers; `Content-Type` is rewritten for
+                    `multipart/form-data` to carry the boundary.
+    :param body: request json body, for `application/json`
+    :param post_params: request post parameters,
+                        `application/x-www-form-urlencoded`
+                        and `multipart/form-data`
+    :return: the encoded body (str or bytes), None for bodiless requests,
+             or a `transport.StreamingBody` (`json_codec.JSONStream`,
+             `multipart.MultipartEncoder`) to send as it is produced.
+    """
+    # For `GET`, `HEAD`
+    if method not in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+        return None
+
+    if isinstance(post_params, MultipartEncoder):
+        headers.update(post_params.headers())
+        return post_params
+
+    post_params = post_params or {}
+
+    # no content type provided or payload is json
+    content_type = headers.get('Content-Type')
+    if (
+        not content_type
+        or re.search('json', content_type, re.IGNORECASE)
+    ):
+        request_body = None
+        if isinstance(body, JSONBody):
+            request_body = body.data
+        elif isinstance(body, JSONStream):
+            request_body = body
+        elif body is not None:
+            request_body = json.dumps(body)
+        return request_body
+    elif content_type == 'application/x-www-form-urlencoded':
+        return urlencode(post_params)
+    elif content_type == 'multipart/form-data':
+        # Ensures that dict objects are serialized
+        post_params = [(a, json.dumps(b)) if isinstance(b, dict) else (a,b) for a, b in post_params]
+        request_body, headers['Content-Type'] = (
+            urllib3.encode_multipart_formdata(post_params)
+        )
+        return request_body
+    # Pass a `string` parameter directly in the body to support
+    # other content types than JSON when `body` argument is
+    # provided in serialized form.
+    elif isinstance(body, str) or isinstance(body, bytes):
+        return body
+    elif content_type.startswith('text/') and isinstance(body, bool):
+        return "true" if body else "false"
+    else:
+        # Cannot generate the request from given parameters
+        msg = """Cannot prepare a request message for provided
+                 arguments. Please check that your arguments match
+                 declared content type."""
+        raise ApiException(status=0, reason=msg)
+
+
+class RESTClientObject(Transport):
+    """The default transport: a urllib3 `PoolManager` (or proxy manager)."""
 
     def __init__(self, configuration) -> None:
         # urllib3.PoolManager will pass all kw parameters to connectionpool
@@ -151,7 +302,6 @@ class RESTClientObject:
                 "body parameter cannot be used with post_params parameter."
             )
 
-        post_params = post_params or {}
         headers = headers or {}
 
         timeout = None
@@ -170,77 +320,14 @@ class RESTClientObject:
         try:
             # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
             if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
-
-                # no content type provided or payload is json
-                content_type = headers.get('Content-Type')
-                if (
-                    not content_type
-                    or re.search('json', content_type, re.IGNORECASE)
-                ):
-                    request_body = None
-                    if body is not None:
-                        request_body = json.dumps(body)
-                    r = self.pool_manager.request(
-                        method,
-                        url,
-                        body=request_body,
-                        timeout=timeout,
-                        headers=headers,
-                        preload_content=False
-                    )
-                elif content_type == 'application/x-www-form-urlencoded':
-                    r = self.pool_manager.request(
-                        method,
-                        url,
-                        fields=post_params,
-                        encode_multipart=False,
-                        timeout=timeout,
-                        headers=headers,
-                        preload_content=False
-                    )
-                elif content_type == 'multipart/form-data':
-                    # must del headers['Content-Type'], or the correct
-                    # Content-Type which generated by urllib3 will be
-                    # overwritten.
-                    del headers['Content-Type']
-                    # Ensures that dict objects are serialized
-                    post_params = [(a, json.dumps(b)) if isinstance(b, dict) else (a,b) for a, b in post_params]
-                    r = self.pool_manager.request(
-                        method,
-                        url,
-                        fields=post_params,
-                        encode_multipart=True,
-                        timeout=timeout,
-                        headers=headers,
-                        preload_content=False
-                    )
-                # Pass a `string` parameter directly in the body to support
-                # other content types than JSON when `body` argument is
-                # provided in serialized form.
-                elif isinstance(body, str) or isinstance(body, bytes):
-                    r = self.pool_manager.request(
-                        method,
-                        url,
-                        body=body,
-                        timeout=timeout,
-                        headers=headers,
-                        preload_content=False
-                    )
-                elif headers['Content-Type'].startswith('text/') and isinstance(body, bool):
-                    request_body = "true" if body else "false"
-                    r = self.pool_manager.request(
-                        method,
-                        url,
-                        body=request_body,
-                        preload_content=False,
-                        timeout=timeout,
-                        headers=headers)
-                else:
-                    # Cannot generate the request from given parameters
-                    msg = """Cannot prepare a request message for provided
-                             arguments. Please check that your arguments match
-                             declared content type."""
-                    raise ApiException(status=0, reason=msg)
+                r = self.pool_manager.request(
+                    method,
+                    url,
+                    body=serialize_body(method, headers, body, post_params),
+                    timeout=timeout,
+                    headers=headers,
+                    preload_content=False
+                )
             # For `GET`, `HEAD`
             else:
                 r = self.pool_manager.request(
@@ -256,3 +343,6 @@ class RESTClientObject:
             raise ApiException(status=0, reason=msg)
 
         return RESTResponse(r)
+
+    def close(self) -> None:
+        self.pool_manager.clear()
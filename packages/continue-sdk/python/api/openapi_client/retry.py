@@ -0,0 +1,286 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Callable, FrozenSet, List, Optional, Tuple
+
+from openapi_client.exceptions import parse_retry_after
+from openapi_client.routes import match_operation
+
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+RETRY_STATUSES = frozenset((429, 502, 503, 504))
+
+
+def transport_errors() -> Tuple[type, ...]:
+    """Errors raised by the bundled transports for a request that may not
+    have reached the server (refused connections, resets, timeouts)."""
+    import urllib3
+
+    exceptions: List[type] = [
+        ConnectionError, TimeoutError, asyncio.TimeoutError,
+        urllib3.exceptions.HTTPError,
+    ]
+    try:
+        import httpx
+        exceptions.append(httpx.TransportError)
+    except ImportError:
+        pass
+    try:
+        import aiohttp
+        exceptions.append(aiohttp.ClientConnectionError)
+    except ImportError:
+        pass
+    return tuple(exceptions)
+
+
+class RetryBudget:
+    """Caps retries relative to successes so that retry storms die out.
+
+    Token-bucket throttling as in gRPC: the bucket starts full with
+    `max_tokens`; every failed attempt withdraws one token and every
+    success deposits `token_ratio`. Retries are only allowed while more
+    than half the tokens remain, so when most requests fail (e.g. a 429
+    storm) clients stop multiplying the load. Share one budget between
+    policies to make it global.
+    """
+
+    def __init__(self, max_tokens: float = 10, token_ratio: float = 0.1) -> None:
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self._tokens = float(max_tokens)
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._tokens = min(self._tokens + self.token_ratio, self.max_tokens)
+
+    def record_failure(self) -> bool:
+        """Records a failed attempt; returns whether it may be retried."""
+        with self._lock:
+            self._tokens = max(self._tokens - 1, 0)
+            return self._tokens > self.max_tokens / 2
+
+
+class RetryEvent:
+    """Describes an attempt passed to the `on_retry` / `on_give_up` hooks.
+
+    `status` is set when the server answered, `error` when the transport
+    raised; `delay` is the pause before the next attempt (None on give-up)
+    and `reason` says why no further attempt is made.
+    """
+
+    __slots__ = ("operation", "method", "url", "attempt", "status", "error",
+                 "delay", "retry_after", "reason")
+
+    def __init__(self, operation, method, url, attempt, status=None, error=None,
+                 delay=None, retry_after=None, reason=None) -> None:
+        self.operation = operation
+        self.method = method
+        self.url = url
+        self.attempt = attempt
+        self.status = status
+        self.error = error
+        self.delay = delay
+        self.retry_after = retry_after
+        self.reason = reason
+
+    def __repr__(self) -> str:
+        return "RetryEvent(%s)" % ", ".join(
+            "%s=%r" % (name, getattr(self, name)) for name in self.__slots__
+        )
+
+
+class RetryPolicy:
+    """Retries failed requests with decorrelated-jitter backoff.
+
+    Set it on `Configuration.retry_policy`, for every operation or per
+    operation id::
+
+        configuration.retry_policy = {
+            "default": RetryPolicy(max_attempts=4),
+            "list_assistant_full_slugs": None,   # disabled on purpose by the Hub
+        }
+
+    A request is retried when the transport raises one of
+    `retry_exceptions` or the response status is in `statuses`, up to
+    `max_attempts` attempts in total. Only idempotent methods are retried
+    unless `methods` says otherwise. The pause before attempt *n* is
+    ``min(max_delay, uniform(base_delay, 3 * previous))`` (decorrelated
+    jitter); a `Retry-After` header overrides it, and a request is given up
+    at once when the server asks to wait longer than `max_retry_after`.
+    When a `budget` is set, retries also stop while it is exhausted.
+
+    :param on_retry: called with a `RetryEvent` before each pause.
+    :param on_give_up: called with a `RetryEvent` when a failed attempt is
+        not retried; the failure is then returned or raised as usual.
+    :param sleep: blocking sleep used by the synchronous client.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 20.0,
+        statuses: FrozenSet[int] = RETRY_STATUSES,
+        methods: FrozenSet[str] = IDEMPOTENT_METHODS,
+        retry_exceptions: Optional[Tuple[type, ...]] = None,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+        budget: Optional[RetryBudget] = None,
+        on_retry: Optional[Callable[[RetryEvent], Any]] = None,
+        on_give_up: Optional[Callable[[RetryEvent], Any]] = None,
+        sleep: Callable[[float], Any] = time.sleep,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.retry_exceptions = retry_exceptions
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+        self.on_retry = on_retry
+        self.on_give_up = on_give_up
+        self.sleep = sleep
+        self._random = random.Random()
+
+    def _exceptions(self):
+        if self.retry_exceptions is None:
+            self.retry_exceptions = transport_errors()
+        return self.retry_exceptions
+
+    def backoff(self, previous: Optional[float]) -> float:
+        """Returns the next decorrelated-jitter delay."""
+        if previous is None:
+            previous = self.base_delay
+        upper = max(previous * 3, self.base_delay)
+        return min(self.max_delay, self._random.uniform(self.base_delay, upper))
+
+    def _next(self, event, previous):
+        """Fills in `event.delay`, or `event.reason` when giving up."""
+        if event.attempt >= self.max_attempts:
+            event.reason = "attempts exhausted"
+        elif event.method.upper() not in self.methods:
+            event.reason = "method not retried"
+        elif self.budget is not None and not self.budget.record_failure():
+            event.reason = "retry budget exhausted"
+        elif (
+            event.retry_after is not None
+            and event.retry_after > self.max_retry_after
+        ):
+            event.reason = "Retry-After exceeds max_retry_after"
+        else:
+            if event.retry_after is not None:
+                event.delay = event.retry_after
+            else:
+                event.delay = self.backoff(previous)
+            if self.on_retry is not None:
+                self.on_retry(event)
+            return
+        if self.on_give_up is not None:
+            self.on_give_up(event)
+
+    def _failure(self, method, url, attempt, response=None, error=None):
+        """Returns a `RetryEvent` when the attempt failed, else None."""
+        if error is not None:
+            if not isinstance(error, self._exceptions()):
+                return None
+            return RetryEvent(match_operation(method, url), method, url, attempt,
+                              error=error)
+        if response.status not in self.statuses:
+            if self.budget is not None:
+                self.budget.record_success()
+            return None
+        retry_after = None
+        if self.respect_retry_after:
+            retry_after = parse_retry_after(response.getheader("Retry-After"))
+        return RetryEvent(match_operation(method, url), method, url, attempt,
+                          status=response.status, retry_after=retry_after)
+
+    def request(self, send, method, url, headers):
+        """Sends the request through `send`, retrying failed attempts.
+
+        :param send: callable taking the request headers and returning a
+            `rest.RESTResponse`.
+        :return: the first successful response, or the last failed one.
+        """
+        delay = None
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = send(headers)
+            except Exception as e:
+                event = self._failure(method, url, attempt, error=e)
+                if event is None:
+                    raise
+                self._next(event, delay)
+                if event.delay is None:
+                    raise
+            else:
+                event = self._failure(method, url, attempt, response=response)
+                if event is None:
+                    return response
+                self._next(event, delay)
+                if event.delay is None:
+                    return response
+                # release the connection of the discarded response
+                response.read()
+            delay = event.delay
+            self.sleep(delay)
+
+    async def request_async(self, send, method, url, headers):
+        """Asyncio counterpart of `request`; `send` is a coroutine function
+        returning an `async_rest.RESTResponse`."""
+        delay = None
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await send(headers)
+            except Exception as e:
+                event = self._failure(method, url, attempt, error=e)
+                if event is None:
+                    raise
+                self._next(event, delay)
+                if event.delay is None:
+                    raise
+            else:
+                event = self._failure(method, url, attempt, response=response)
+                if event is None:
+                    return response
+                self._next(event, delay)
+                if event.delay is None:
+                    return response
+                await response.read()
+            delay = event.delay
+            await asyncio.sleep(delay)
+
+
+def policy_for(retry_policy, method, url) -> Optional[RetryPolicy]:
+    """Resolves `Configuration.retry_policy` for one request."""
+    if retry_policy is None or isinstance(retry_policy, RetryPolicy):
+        return retry_policy
+    operation = match_operation(method, url)
+    if operation in retry_policy:
+        return retry_policy[operation]
+    return retry_policy.get("default")
@@ -0,0 +1,57 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import re
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from openapi_client.operations import OPERATIONS
+
+# (operation id, HTTP method, path template) of every DefaultApi operation
+ROUTES: List[Tuple[str, str, str]] = [
+    (operation.operation_id, operation.method, operation.path)
+    for operation in OPERATIONS.values()
+]
+
+
+def _compile(template):
+    pattern = re.sub(r"\\{[^}]+\\}", "[^/]+", re.escape(template))
+    return re.compile(pattern + "$")
+
+
+_PATTERNS = [
+    (operation_id, method, template, _compile(template))
+    for operation_id, method, template in ROUTES
+]
+
+
+def match_route(method: str, url: str) -> Optional[Tuple[str, str]]:
+    """Returns the ``(operation id, path template)`` a request was
+    serialized from.
+
+    The URL may carry a host prefix (`Configuration.host` can include a base
+    path) and a query string. Returns None for unknown requests.
+    """
+    method = method.upper()
+    path = urlsplit(url).path
+    for operation_id, route_method, template, pattern in _PATTERNS:
+        if route_method == method and pattern.search(path):
+            return operation_id, template
+    return None
+
+
+def match_operation(method: str, url: str) -> Optional[str]:
+    """Returns the operation id a request was serialized from, or None."""
+    route = match_route(method, url)
+    return route[0] if route is not None else None
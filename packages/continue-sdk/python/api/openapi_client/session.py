@@ -0,0 +1,157 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from openapi_client.models.get_free_trial_status200_response import GetFreeTrialStatus200Response
+from openapi_client.models.get_policy200_response import GetPolicy200Response
+from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+from openapi_client.models.list_organizations200_response import ListOrganizations200Response
+
+# (field of SessionBootstrap, DefaultApi operation) fetched by bootstrap_session
+BOOTSTRAP_CALLS = (
+    ("policy", "get_policy"),
+    ("organizations", "list_organizations"),
+    ("free_trial_status", "get_free_trial_status"),
+    ("assistants", "list_assistants"),
+)
+
+
+class SessionBootstrap:
+    """Everything an IDE session needs at startup.
+
+    `timings` maps each operation id, and ``"total"``, to its wall time in
+    seconds. With ``return_exceptions=True`` a failed call leaves its field
+    None and its exception in `errors`, keyed by operation id.
+    """
+
+    __slots__ = ("policy", "organizations", "free_trial_status", "assistants",
+                 "timings", "errors")
+
+    def __init__(
+        self,
+        policy: Optional[GetPolicy200Response] = None,
+        organizations: Optional[ListOrganizations200Response] = None,
+        free_trial_status: Optional[GetFreeTrialStatus200Response] = None,
+        assistants: Optional[List[ListAssistants200ResponseInner]] = None,
+        timings: Optional[Dict[str, float]] = None,
+        errors: Optional[Dict[str, BaseException]] = None,
+    ) -> None:
+        self.policy = policy
+        self.organizations = organizations
+        self.free_trial_status = free_trial_status
+        self.assistants = assistants
+        self.timings = timings if timings is not None else {}
+        self.errors = errors if errors is not None else {}
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def __repr__(self) -> str:
+        return "SessionBootstrap(%s)" % ", ".join(
+            "%s=%r" % (name, getattr(self, name)) for name in self.__slots__
+        )
+
+
+def _kwargs(operation_id, organization_id, always_use_proxy, _request_timeout):
+    kwargs: Dict[str, Any] = {"_request_timeout": _request_timeout}
+    if operation_id == "list_assistants":
+        kwargs["organization_id"] = organization_id
+        kwargs["always_use_proxy"] = always_use_proxy
+    return kwargs
+
+
+def _collect(outcomes, timings, return_exceptions):
+    """Builds the aggregate from ``(field, operation, value, error)``."""
+    session = SessionBootstrap(timings=timings)
+    for field, operation_id, value, error in outcomes:
+        if error is not None:
+            if not return_exceptions:
+                raise error
+            session.errors[operation_id] = error
+        else:
+            setattr(session, field, value)
+    return session
+
+
+def bootstrap_session(
+    api,
+    organization_id: Optional[str] = None,
+    always_use_proxy: Optional[str] = None,
+    return_exceptions: bool = False,
+    _request_timeout: Any = None,
+) -> SessionBootstrap:
+    """Fetches the policy, organizations, free trial status and assistants
+    of a new IDE session concurrently, so that startup costs about one
+    round trip instead of four.
+
+    :param api: a `DefaultApi`.
+    :param organization_id: organization to list assistants for; personal
+        assistants when None.
+    :param return_exceptions: collect failures in `SessionBootstrap.errors`
+        instead of raising the first one (in `BOOTSTRAP_CALLS` order) once
+        every call has finished.
+    """
+
+    def call(entry):
+        field, operation_id = entry
+        started = time.perf_counter()
+        try:
+            value = getattr(api, operation_id)(**_kwargs(
+                operation_id, organization_id, always_use_proxy, _request_timeout
+            ))
+            error = None
+        except Exception as e:
+            value, error = None, e
+        return field, operation_id, value, error, time.perf_counter() - started
+
+    started = time.perf_counter()
+    pool = ThreadPoolExecutor(len(BOOTSTRAP_CALLS), thread_name_prefix="openapi-client-bootstrap")
+    with pool:
+        results = list(pool.map(call, BOOTSTRAP_CALLS))
+    timings = {operation_id: elapsed for _, operation_id, _, _, elapsed in results}
+    timings["total"] = time.perf_counter() - started
+    return _collect([r[:4] for r in results], timings, return_exceptions)
+
+
+async def bootstrap_session_async(
+    api,
+    organization_id: Optional[str] = None,
+    always_use_proxy: Optional[str] = None,
+    return_exceptions: bool = False,
+    _request_timeout: Any = None,
+) -> SessionBootstrap:
+    """Asyncio counterpart of `bootstrap_session` for `AsyncDefaultApi`."""
+
+    async def call(entry):
+        field, operation_id = entry
+        started = time.perf_counter()
+        try:
+            value = await getattr(api, operation_id)(**_kwargs(
+                operation_id, organization_id, always_use_proxy, _request_timeout
+            ))
+            error = None
+        except Exception as e:
+            value, error = None, e
+        return field, operation_id, value, error, time.perf_counter() - started
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*[call(entry) for entry in BOOTSTRAP_CALLS])
+    timings = {operation_id: elapsed for _, operation_id, _, _, elapsed in results}
+    timings["total"] = time.perf_counter() - started
+    return _collect([r[:4] for r in results], timings, return_exceptions)
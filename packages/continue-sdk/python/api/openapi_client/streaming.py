@@ -0,0 +1,253 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import re
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+from openapi_client.operations import OPERATIONS
+
+_LIST_ASSISTANTS = OPERATIONS["list_assistants"]
+_ASSISTANT_TYPE = "ListAssistants200ResponseInner"
+
+# runs the splitter steps over in C: everything up to the next bracket (or,
+# inside the array itself, comma), complete strings included
+_SKIP_DEEP = re.compile(rb'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+_SKIP_TOP = re.compile(rb'(?:[^"\[\]{},]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+_WHITESPACE = b" \t\r\n"
+
+
+def _nested(levels):
+    """A regex matching an object or array nested at most `levels` deep,
+    one alternative per byte so that failing on an incomplete element does
+    not backtrack. Brackets are not paired; the decoder checks elements."""
+    flat = rb'[^"\[\]{}]|"[^"\\]*(?:\\.[^"\\]*)*"'
+    pattern = rb'[\[{](?:' + flat + rb')*[\]}]'
+    for _ in range(levels - 1):
+        pattern = rb'[\[{](?:' + flat + rb'|' + pattern + rb')*[\]}]'
+    return re.compile(pattern)
+
+
+# a whole element in one match, when it has been received
+_ELEMENT = _nested(8)
+
+_JSON = re.compile(r'^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)', re.IGNORECASE)
+_CHARSET = re.compile(r'charset=["\']?([a-zA-Z\-\d]+)')
+
+
+class JSONArraySplitter:
+    """Splits a JSON array into the encoded JSON of its elements as the
+    bytes of the array arrive.
+
+    Only the array's own syntax is checked; each element is left to the
+    decoder. At most one element (plus the last chunk) is buffered, so
+    memory does not grow with the length of the array. The input must be
+    UTF-8.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._pos = 0  # next byte to scan
+        self._start: Optional[int] = None  # start of the current element
+        self._depth = 0
+        self._count = 0
+        self._done = False
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Adds the next bytes of the array; returns the elements they
+        complete, in order."""
+        buffer = self._buffer
+        buffer += data
+        if self._done:
+            self._check_trailing()
+            return []
+        if self._depth == 0:
+            stripped = buffer.lstrip(_WHITESPACE)
+            if not stripped:
+                return []
+            if stripped[:1] != b"[":
+                raise ValueError("Expected a JSON array, got %r" % bytes(stripped[:20]))
+
+        elements = []
+        pos = self._pos
+        start = self._start
+        depth = self._depth
+        end = len(buffer)
+        while True:
+            pos = (_SKIP_DEEP if depth > 1 else _SKIP_TOP).match(buffer, pos).end()
+            if pos == end:
+                break
+            i = pos
+            token = buffer[i]
+            if token == 0x22:  # "
+                break  # the rest of the string is yet to come
+            pos = i + 1
+            if depth == 1 and (token == 0x5B or token == 0x7B):
+                if start is None:
+                    raise ValueError("Missing ',' between array elements")
+                element = _ELEMENT.match(buffer, i)
+                if element is not None:
+                    pos = element.end()
+                    elements.append(bytes(buffer[start:pos]))
+                    start = None
+                    continue
+            if token == 0x5B or token == 0x7B:  # [ {
+                depth += 1
+                if depth == 1:
+                    start = pos
+                elif depth == 2 and start is None:
+                    raise ValueError("Missing ',' between array elements")
+            elif token == 0x5D or token == 0x7D:  # ] }
+                depth -= 1
+                if depth == 1:
+                    elements.append(bytes(buffer[start:pos]))
+                    start = None
+                elif depth == 0:
+                    if start is not None:
+                        self._scalar(buffer, start, i, elements, last=True)
+                    start = None
+                    self._done = True
+                    break
+            elif depth == 1:  # ,
+                if start is not None:
+                    self._scalar(buffer, start, i, elements, last=False)
+                start = pos
+
+        self._count += len(elements)
+        # drop what has been consumed; only the current element is kept
+        keep = pos if start is None else start
+        if keep:
+            del buffer[:keep]
+            pos -= keep
+            if start is not None:
+                start -= keep
+        self._pos, self._start, self._depth = pos, start, depth
+        if self._done:
+            self._check_trailing()
+        return elements
+
+    def _scalar(self, buffer, start, end, elements, last):
+        value = bytes(buffer[start:end]).strip(_WHITESPACE)
+        if value:
+            elements.append(value)
+        elif not last or self._count or elements:
+            # `[1,,2]`, `[1,]`; `[]` is the only empty element list
+            raise ValueError("Missing array element")
+
+    def _check_trailing(self):
+        if self._buffer[self._pos:].strip(_WHITESPACE):
+            raise ValueError("Extra data after the JSON array")
+
+    def close(self) -> None:
+        """Checks that the array was complete."""
+        if not self._done:
+            raise ValueError("Truncated JSON array")
+
+
+def _streamable(response_data) -> bool:
+    """Whether the body is a successful UTF-8 JSON document, which can be
+    split as it arrives."""
+    if not 200 <= response_data.status <= 299:
+        return False
+    content_type = response_data.getheader('content-type')
+    if content_type is None or not _JSON.match(content_type):
+        return False
+    match = _CHARSET.search(content_type) if 'charset=' in content_type else None
+    return match is None or match.group(1).lower().replace("_", "-") in ("utf-8", "utf8")
+
+
+def _serialize(api, always_use_proxy, organization_id):
+    return _LIST_ASSISTANTS.serialize(
+        api.api_client,
+        always_use_proxy=always_use_proxy,
+        organization_id=organization_id,
+    )
+
+
+def iter_assistants(
+    api,
+    always_use_proxy: Optional[str] = None,
+    organization_id: Optional[str] = None,
+    chunk_size: int = 65536,
+    _request_timeout: Any = None,
+) -> Iterator[ListAssistants200ResponseInner]:
+    """Lists assistants like `DefaultApi.list_assistants`, yielding each one
+    as soon as its bytes have been received.
+
+    The body is read `chunk_size` bytes at a time and split by a
+    `JSONArraySplitter`; each assistant is deserialized on its own, with
+    the client's settings (`json_codec`, `trusted_responses`,
+    `lazy_models`). Error responses raise as in `list_assistants`, before
+    anything is yielded; a malformed body raises when reached. Stopping
+    early closes the connection.
+
+    :param api: a `DefaultApi`.
+    """
+    api_client = api.api_client
+    param = _serialize(api, always_use_proxy, organization_id)
+    response_data = api_client.call_api(*param, _request_timeout=_request_timeout)
+    if not _streamable(response_data):
+        response_data.read()
+        assistants = api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_LIST_ASSISTANTS.response_types,
+        ).data
+        yield from assistants or ()
+        return
+
+    splitter = JSONArraySplitter()
+    chunks = response_data.stream(chunk_size)
+    try:
+        for chunk in chunks:
+            for element in splitter.feed(chunk):
+                yield api_client.deserialize(element, _ASSISTANT_TYPE, "application/json")
+    finally:
+        chunks.close()
+    splitter.close()
+
+
+async def iter_assistants_async(
+    api,
+    always_use_proxy: Optional[str] = None,
+    organization_id: Optional[str] = None,
+    chunk_size: int = 65536,
+    _request_timeout: Any = None,
+) -> AsyncIterator[ListAssistants200ResponseInner]:
+    """Asyncio counterpart of `iter_assistants` for `AsyncDefaultApi`.
+
+    To release the connection when stopping early, close the generator,
+    e.g. with `contextlib.aclosing`.
+    """
+    api_client = api.api_client
+    param = _serialize(api, always_use_proxy, organization_id)
+    response_data = await api_client.call_api(*param, _request_timeout=_request_timeout)
+    if not _streamable(response_data):
+        await response_data.read()
+        assistants = api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_LIST_ASSISTANTS.response_types,
+        ).data
+        for assistant in assistants or ():
+            yield assistant
+        return
+
+    splitter = JSONArraySplitter()
+    chunks = response_data.stream(chunk_size)
+    try:
+        async for chunk in chunks:
+            for element in splitter.feed(chunk):
+                yield api_client.deserialize(element, _ASSISTANT_TYPE, "application/json")
+    finally:
+        await chunks.aclose()
+    splitter.close()
@@ -0,0 +1,196 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import abc
+import importlib
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Union
+
+from openapi_client.exceptions import ApiTypeError, ApiValueError
+
+
+class StreamingBody(abc.ABC):
+    """A request body produced chunk by chunk while it is sent, such as a
+    `multipart.MultipartEncoder` or a `json_codec.JSONStream`.
+
+    Iterating it yields bytes, and it can be iterated again to resend it.
+    Without a `content_length`, it is sent with chunked transfer encoding.
+    asyncio transports send `async_chunks()`; transports that cannot stream
+    send `to_bytes()`.
+    """
+
+    content_length: Optional[int] = None
+
+    @abc.abstractmethod
+    def __iter__(self) -> Iterator[bytes]:
+        """Yields the body in chunks of bytes, from the start."""
+
+    async def async_chunks(self) -> AsyncIterator[bytes]:
+        """The body for asyncio transports. Each chunk is produced on the
+        event loop."""
+        for chunk in self:
+            yield chunk
+
+    def to_bytes(self) -> bytes:
+        """The whole body, for transports that cannot stream it."""
+        return b"".join(self)
+
+
+class Transport(abc.ABC):
+    """Sends a serialized request and returns a `rest.RESTResponse`.
+
+    `ApiClient` talks to the network exclusively through this interface, so
+    implementations only need to move bytes: request bodies are encoded with
+    `rest.serialize_body` and responses are wrapped with `rest.build_response`
+    (or returned as `rest.RESTResponse` directly). A `StreamingBody` is sent
+    as it is produced.
+    """
+
+    @abc.abstractmethod
+    def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Perform requests.
+
+        :param method: http request method
+        :param url: http request url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :return: rest.RESTResponse
+        """
+
+    def close(self) -> None:
+        """Releases pooled connections and other resources."""
+
+
+class AsyncTransport(abc.ABC):
+    """Asynchronous counterpart of `Transport` used by `AsyncApiClient`.
+
+    `request` returns an `async_rest.RESTResponse`.
+    """
+
+    @abc.abstractmethod
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Perform requests; see `Transport.request`."""
+
+    async def close(self) -> None:
+        """Releases pooled connections and other resources."""
+
+
+TransportFactory = Callable[[Any], Any]
+
+# Built-in transports, referenced by import path so that optional
+# dependencies (httpx, aiohttp) are only imported when selected.
+TRANSPORTS: Dict[str, Union[str, TransportFactory]] = {
+    "urllib3": "openapi_client.rest:RESTClientObject",
+    "http2": "openapi_client.http2:HTTP2Transport",
+}
+
+ASYNC_TRANSPORTS: Dict[str, Union[str, TransportFactory]] = {
+    "aiohttp": "openapi_client.async_rest:RESTClientObject",
+    "http2": "openapi_client.http2:AsyncHTTP2Transport",
+}
+
+DEFAULT_TRANSPORT = "urllib3"
+DEFAULT_ASYNC_TRANSPORT = "aiohttp"
+
+
+def register_transport(name: str, factory: TransportFactory, asynchronous: bool = False) -> None:
+    """Makes `factory` selectable as `Configuration.transport = name`
+    (or `Configuration.async_transport = name` if `asynchronous`).
+
+    :param name: transport name.
+    :param factory: callable taking a `Configuration` and returning a
+        `Transport` (or `AsyncTransport`) instance.
+    :param asynchronous: register for `AsyncApiClient` instead of `ApiClient`.
+    """
+    registry = ASYNC_TRANSPORTS if asynchronous else TRANSPORTS
+    registry[name] = factory
+
+
+def _resolve(selected, registry, base, configuration):
+    if isinstance(selected, base):
+        return selected
+
+    if isinstance(selected, str):
+        try:
+            factory = registry[selected]
+        except KeyError:
+            raise ApiValueError(
+                "Unknown transport `{0}`. Must be one of {1}.".format(
+                    selected, sorted(registry)
+                )
+            )
+        if isinstance(factory, str):
+            module_name, attr = factory.split(":")
+            factory = getattr(importlib.import_module(module_name), attr)
+    elif callable(selected):
+        factory = selected
+    else:
+        raise ApiTypeError(
+            "Transport must be a name, a factory or a {0} instance, "
+            "got {1!r}".format(base.__name__, selected)
+        )
+
+    transport = factory(configuration)
+    if not isinstance(transport, base):
+        raise ApiTypeError(
+            "Transport factory returned {0!r}, expected a {1} "
+            "instance".format(transport, base.__name__)
+        )
+    return transport
+
+
+def create_transport(configuration) -> Transport:
+    """Builds the transport selected by `configuration.transport`.
+
+    :param configuration: .Configuration object.
+    :return: Transport
+    """
+    selected = configuration.transport
+    if selected is None:
+        selected = DEFAULT_TRANSPORT
+    return _resolve(selected, TRANSPORTS, Transport, configuration)
+
+
+def create_async_transport(configuration) -> AsyncTransport:
+    """Builds the transport selected by `configuration.async_transport`.
+
+    :param configuration: .Configuration object.
+    :return: AsyncTransport
+    """
+    selected = configuration.async_transport
+    if selected is None:
+        selected = DEFAULT_ASYNC_TRANSPORT
+    return _resolve(selected, ASYNC_TRANSPORTS, AsyncTransport, configuration)
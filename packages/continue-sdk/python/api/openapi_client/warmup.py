@@ -0,0 +1,67 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import time
+from typing import Dict, Iterable, Optional, Union
+
+from pydantic import BaseModel
+
+import openapi_client.models
+from openapi_client.api_client import ApiClient
+from openapi_client.api_response import ApiResponse
+from openapi_client.deserializer import get_plan
+
+
+def _resolve_type(name):
+    """Resolves names of response type strings as `ApiClient` does."""
+    if name in ApiClient.NATIVE_TYPES_MAPPING:
+        return ApiClient.NATIVE_TYPES_MAPPING[name]
+    return getattr(openapi_client.models, name)
+
+
+def warm_up(
+    models: Optional[Iterable[Union[str, type]]] = None,
+    response_types: Iterable[str] = (),
+) -> Dict[str, float]:
+    """Builds the pydantic validators and serializers of `models` now
+    rather than on their first use.
+
+    Generated models are defined with ``defer_build=True``: a process only
+    pays for the models it validates or dumps, when it first does. Call
+    this where that cost is better paid up front, e.g. in a parent process
+    before it forks workers, which then share the built models.
+
+    :param models: model classes or names in `openapi_client.models`; every
+        model, and `ApiResponse`, by default.
+    :param response_types: response type strings, such as
+        ``"List[ListAssistants200ResponseInner]"``, whose deserialization
+        plans to compile as well (see `deserializer.get_plan`).
+    :return: seconds spent on each model name and response type; models
+        that were already built take no time.
+    """
+    if models is None:
+        models = list(openapi_client.models.__all__) + [ApiResponse]
+    timings = {}
+    for model in models:
+        klass = getattr(openapi_client.models, model) if isinstance(model, str) else model
+        if not (isinstance(klass, type) and issubclass(klass, BaseModel)):
+            raise TypeError("%r is not a model" % (model,))
+        started = time.perf_counter()
+        klass.model_rebuild()
+        timings[klass.__name__] = time.perf_counter() - started
+    for type_string in response_types:
+        started = time.perf_counter()
+        get_plan(type_string, _resolve_type)
+        timings[type_string] = time.perf_counter() - started
+    return timings
@@ -29,6 +29,12 @@ REQUIRES = [
     "pydantic >= 2",
     "typing-extensions >= 4.7.1",
 ]
+EXTRAS_REQUIRE = {
+    "async": ["aiohttp >= 3.8.4"],
+    "http2": ["httpx[http2] >= 0.26.0"],
+    "orjson": ["orjson >= 3.9"],
+    "msgspec": ["msgspec >= 0.18"],
+}
 
 setup(
     name=NAME,
@@ -39,6 +45,7 @@ setup(
     url="",
     keywords=["OpenAPI", "OpenAPI-Generator", "Continue Hub IDE API"],
     install_requires=REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     packages=find_packages(exclude=["test", "tests"]),
     include_package_data=True,
     long_description_content_type='text/markdown',
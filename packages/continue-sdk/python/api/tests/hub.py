@@ -0,0 +1,314 @@
+"""A local stand-in for the Continue Hub IDE API.
+
+`HubApp` is a plain WSGI application serving canned payloads for every
+operation in `DefaultApi`; `serve_hub` runs it on a loopback port in a
+background thread so that tests can drive the real HTTP stack, and
+`hub_configuration` / `make_api` point the clients at it in-process.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import io
+import json
+import re
+import sys
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from openapi_client import ApiClient, Configuration, DefaultApi
+from openapi_client.inprocess import AsyncASGITransport, WSGITransport
+
+
+def make_assistant(index, config_size=4):
+    return {
+        "configResult": {
+            "config": {
+                "name": "assistant-%d" % index,
+                "version": "1.0.0",
+                "models": [
+                    {"title": "model-%d" % i, "provider": "openai", "model": "gpt-4o"}
+                    for i in range(config_size)
+                ],
+            },
+            "configLoadInterrupted": False,
+            "errors": [],
+        },
+        "ownerSlug": "owner-%d" % (index % 7),
+        "packageSlug": "package-%d" % index,
+        "iconUrl": None,
+        "rawYaml": "name: assistant-%d\nversion: 1.0.0\n" % index,
+    }
+
+
+def _brotli(data):
+    import brotli
+    # the quality servers use for dynamic responses; 11 is for static files
+    return brotli.compress(data, quality=5)
+
+
+_COMPRESSORS = {
+    "gzip": lambda data: gzip.compress(data, mtime=0),
+    "deflate": zlib.compress,
+    "br": _brotli,
+}
+
+
+def _read_chunked(stream):
+    """Reads a request body sent with chunked transfer encoding, which
+    wsgiref leaves to the application."""
+    body = bytearray()
+    while True:
+        size = int(stream.readline().split(b";")[0], 16)
+        if size == 0:
+            while stream.readline() not in (b"\r\n", b"\n", b""):
+                pass  # trailers
+            return bytes(body)
+        body += stream.read(size)
+        stream.readline()
+
+
+class HubApp:
+    """WSGI application implementing the IDE endpoints.
+
+    :param assistants: number of assistants returned by `list-assistants`.
+    :param latency: seconds each request sleeps before responding.
+    :param cache_control: `Cache-Control` sent with successful GET
+        responses, which always carry an `ETag` and honour `If-None-Match`.
+    :param compress: content codings the Hub may answer with, in order of
+        preference ("gzip", "deflate", "br"), when the client accepts them.
+    """
+
+    def __init__(self, assistants=3, latency=0.0, cache_control=None, compress=()):
+        self.assistants = [make_assistant(i) for i in range(assistants)]
+        self.latency = latency
+        self.cache_control = cache_control
+        self.compress = compress
+        self.faults = []
+        self.requests = []
+        self._lock = threading.Lock()
+        self._routes = [
+            ("GET", re.compile(r"^/ide/list-assistants$"), self.list_assistants),
+            ("GET", re.compile(r"^/ide/get-assistant/([^/]+)/([^/]+)$"), self.get_assistant),
+            ("GET", re.compile(r"^/ide/policy$"), self.get_policy),
+            ("GET", re.compile(r"^/ide/list-organizations$"), self.list_organizations),
+            ("GET", re.compile(r"^/ide/free-trial-status$"), self.get_free_trial_status),
+            ("GET", re.compile(r"^/ide/get-models-add-on-checkout-url$"), self.get_checkout_url),
+            ("GET", re.compile(r"^/ide/list-assistant-full-slugs$"), self.list_full_slugs),
+            ("POST", re.compile(r"^/ide/sync-secrets$"), self.sync_secrets),
+        ]
+
+    def inject(self, status, times=1, retry_after=None):
+        """Answers the next `times` requests with `status` instead."""
+        headers = [] if retry_after is None else [("Retry-After", str(retry_after))]
+        with self._lock:
+            self.faults.extend([(status, headers)] * times)
+
+    def __call__(self, environ, start_response):
+        if self.latency:
+            time.sleep(self.latency)
+        status, headers, data = self.respond(environ)
+        start_response("%d %s" % (status, "OK" if status < 400 else "Error"), headers)
+        return [data]
+
+    def respond(self, environ):
+        """Handles one request; returns ``(status, headers, body)``."""
+        method = environ["REQUEST_METHOD"]
+        path = environ.get("PATH_INFO", "")
+        if environ.get("HTTP_TRANSFER_ENCODING", "").lower() == "chunked":
+            body = _read_chunked(environ["wsgi.input"])
+        else:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+            body = environ["wsgi.input"].read(length) if length else b""
+        with self._lock:
+            self.requests.append((method, path, environ.get("QUERY_STRING", ""), environ))
+            fault = self.faults.pop(0) if self.faults else None
+        if fault is not None:
+            status, headers = fault
+            data = json.dumps({"message": "Injected fault"}).encode("utf-8")
+            return status, headers + [
+                ("Content-Type", "application/json; charset=utf-8"),
+                ("Content-Length", str(len(data))),
+            ], data
+
+        status, payload = 404, {"message": "Not found"}
+        if not environ.get("HTTP_AUTHORIZATION", "").startswith("Bearer "):
+            status, payload = 401, {"message": "Unauthorized"}
+        else:
+            for route_method, pattern, handler in self._routes:
+                match = pattern.match(path)
+                if match and route_method == method:
+                    status, payload = handler(body, *match.groups())
+                    break
+
+        data = json.dumps(payload).encode("utf-8")
+        headers = [("Content-Type", "application/json; charset=utf-8")]
+        if method == "GET" and status == 200:
+            etag = '"%s"' % hashlib.sha1(data).hexdigest()
+            headers.append(("ETag", etag))
+            if self.cache_control:
+                headers.append(("Cache-Control", self.cache_control))
+            if environ.get("HTTP_IF_NONE_MATCH") == etag:
+                status, data = 304, b""
+        if self.compress and data:
+            headers.append(("Vary", "Accept-Encoding"))
+            accepted = [
+                c.strip().split(";")[0]
+                for c in environ.get("HTTP_ACCEPT_ENCODING", "").split(",")
+            ]
+            coding = next((c for c in self.compress if c in accepted), None)
+            if coding is not None:
+                data = _COMPRESSORS[coding](data)
+                headers.append(("Content-Encoding", coding))
+        headers.append(("Content-Length", str(len(data))))
+        return status, headers, data
+
+    def list_assistants(self, body):
+        return 200, self.assistants
+
+    def get_assistant(self, body, owner_slug, package_slug):
+        for assistant in self.assistants:
+            if (assistant["ownerSlug"], assistant["packageSlug"]) == (owner_slug, package_slug):
+                return 200, assistant
+        return 404, {"message": "Assistant not found"}
+
+    def get_policy(self, body):
+        return 200, {"policy": {"allowAnonymousTelemetry": False}, "orgSlug": "acme"}
+
+    def list_organizations(self, body):
+        return 200, {"organizations": [{"id": "org-1", "name": "Acme", "slug": "acme"}]}
+
+    def get_free_trial_status(self, body):
+        return 200, {
+            "optedInToFreeTrial": True,
+            "chatCount": 3,
+            "autocompleteCount": 10,
+            "chatLimit": 50,
+            "autocompleteLimit": 2000,
+        }
+
+    def get_checkout_url(self, body):
+        return 200, {"url": "https://checkout.stripe.com/session"}
+
+    def list_full_slugs(self, body):
+        return 429, {"message": "Too many requests"}
+
+    def sync_secrets(self, body):
+        fqsns = json.loads(body)["fqsns"]
+        return 200, [{"fqsn": fqsn, "value": "secret"} for fqsn in fqsns]
+
+
+def as_asgi(app):
+    """Exposes the `HubApp` `app` as an ASGI application.
+
+    Unlike the WSGI entry point, latency is awaited, so a single server
+    event loop can keep many slow requests in flight.
+    """
+
+    async def asgi(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            "PATH_INFO": scope["path"],
+            "QUERY_STRING": scope["query_string"].decode("latin-1"),
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+        }
+        for name, value in scope["headers"]:
+            environ["HTTP_" + name.decode("latin-1").upper().replace("-", "_")] = (
+                value.decode("latin-1")
+            )
+        if app.latency:
+            await asyncio.sleep(app.latency)
+        status, headers, content = app.respond(environ)
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers
+            ],
+        })
+        await send({"type": "http.response.body", "body": content})
+
+    return asgi
+
+
+class FakeClock:
+    """A `clock` for `HTTPCache`, `CircuitBreaker` and `RateLimiter` that
+    only moves when a test advances `now` or calls `sleep`."""
+
+    def __init__(self, now=1_000_000.0) -> None:
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def hub_configuration(app, access_token="token", transport=None, **settings):
+    """A `Configuration` sending both clients' requests to `app` in-process.
+
+    `transport` replaces the sync client's `WSGITransport`; `settings` are
+    set as `Configuration` attributes, e.g. ``http_cache=HTTPCache()``.
+    """
+    configuration = Configuration(host="http://hub.test", access_token=access_token)
+    configuration.transport = transport or WSGITransport(app)
+    configuration.async_transport = AsyncASGITransport(as_asgi(app))
+    for name, value in settings.items():
+        setattr(configuration, name, value)
+    return configuration
+
+
+def make_api(app, access_token="token", transport=None, **settings):
+    """A `DefaultApi` calling `app` in-process; see `hub_configuration`."""
+    return DefaultApi(ApiClient(hub_configuration(app, access_token, transport, **settings)))
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    request_queue_size = 512
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def serve_hub(app=None):
+    """Serve `app` (a new `HubApp` by default) on 127.0.0.1.
+
+    Yields the base URL, e.g. ``http://127.0.0.1:54321``.
+    """
+    app = app if app is not None else HubApp()
+    server = make_server(
+        "127.0.0.1", 0, app,
+        server_class=_ThreadingWSGIServer,
+        handler_class=_QuietHandler,
+    )
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    try:
+        yield "http://127.0.0.1:%d" % server.server_port
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
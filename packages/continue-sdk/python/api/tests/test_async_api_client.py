@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+
+from openapi_client import AsyncApiClient, AsyncDefaultApi, Configuration
+from openapi_client.exceptions import ApiException, NotFoundException
+from openapi_client.models.get_policy200_response import GetPolicy200Response
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+
+from tests.hub import HubApp, serve_hub
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class TestAsyncDefaultApi(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.app = HubApp(assistants=5)
+        self._server = serve_hub(self.app)
+        host = self._server.__enter__()
+        self.configuration = Configuration(host=host, access_token="token")
+
+    def tearDown(self) -> None:
+        self._server.__exit__(None, None, None)
+
+    async def test_operations_return_models(self) -> None:
+        async with AsyncApiClient(self.configuration) as api_client:
+            api = AsyncDefaultApi(api_client)
+
+            assistants = await api.list_assistants(organization_id="org-1")
+            self.assertEqual(len(assistants), 5)
+            self.assertEqual(assistants[1].package_slug, "package-1")
+
+            assistant = await api.get_assistant("owner-2", "package-2")
+            self.assertEqual(assistant.config_result.config["name"], "assistant-2")
+
+            policy = await api.get_policy()
+            self.assertIsInstance(policy, GetPolicy200Response)
+
+        self.assertEqual(self.app.requests[0][2], "organizationId=org-1")
+
+    async def test_with_http_info_and_without_preload_content(self) -> None:
+        self.configuration.retain_raw_data = True
+        async with AsyncApiClient(self.configuration) as api_client:
+            api = AsyncDefaultApi(api_client)
+
+            response = await api.list_organizations_with_http_info()
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data.organizations[0].slug, "acme")
+            self.assertTrue(response.raw_data.startswith(b"{"))
+
+            raw = await api.get_free_trial_status_without_preload_content()
+            self.assertEqual(raw.status, 200)
+            self.assertIn(b"chatLimit", await raw.read())
+
+    async def test_post_body_is_serialized(self) -> None:
+        async with AsyncApiClient(self.configuration) as api_client:
+            api = AsyncDefaultApi(api_client)
+            response = await api.sync_secrets_without_preload_content(
+                SyncSecretsRequest(fqsns=[{"secretName": "a"}, {"secretName": "b"}])
+            )
+            self.assertEqual(len(await response.json()), 2)
+
+    async def test_error_statuses_raise(self) -> None:
+        async with AsyncApiClient(self.configuration) as api_client:
+            api = AsyncDefaultApi(api_client)
+            with self.assertRaises(NotFoundException):
+                await api.get_assistant("nobody", "nothing")
+            with self.assertRaises(ApiException) as ctx:
+                await api.list_assistant_full_slugs()
+            self.assertEqual(ctx.exception.status, 429)
+
+    async def test_many_concurrent_requests_share_one_loop(self) -> None:
+        async with AsyncApiClient(self.configuration) as api_client:
+            api = AsyncDefaultApi(api_client)
+            results = await asyncio.gather(*(
+                api.get_assistant("owner-%d" % (i % 5 % 7), "package-%d" % (i % 5))
+                for i in range(50)
+            ))
+        self.assertEqual(
+            [r.package_slug for r in results],
+            ["package-%d" % (i % 5) for i in range(50)],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import threading
+import time
+import unittest
+
+from openapi_client import AsyncApiClient, AsyncDefaultApi
+from openapi_client.bulk import get_assistants_bulk, get_assistants_bulk_async
+from openapi_client.exceptions import ApiTypeError, NotFoundException
+
+from tests.hub import HubApp, hub_configuration, make_api
+
+
+class InFlight:
+    """WSGI middleware recording the peak number of concurrent requests."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        try:
+            time.sleep(0.02)
+            return self.app(environ, start_response)
+        finally:
+            with self._lock:
+                self.current -= 1
+
+
+def _slugs(n):
+    return [("owner-%d" % (i % 7), "package-%d" % i) for i in range(n)]
+
+
+class TestGetAssistantsBulk(unittest.TestCase):
+
+    def test_results_follow_input_order(self) -> None:
+        items = list(reversed(_slugs(12)))
+        results = get_assistants_bulk(make_api(HubApp(assistants=12)), items, max_concurrency=4)
+        self.assertEqual([r.key for r in results], items)
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual(
+            [(r.data.owner_slug, r.data.package_slug) for r in results], items
+        )
+
+    def test_errors_are_per_item(self) -> None:
+        items = [("owner-0", "package-0"), ("owner-0", "missing"), ("owner-1", "package-1")]
+        results = get_assistants_bulk(make_api(HubApp()), items)
+        self.assertEqual([r.ok for r in results], [True, False, True])
+        self.assertIsInstance(results[1].error, NotFoundException)
+        with self.assertRaises(NotFoundException):
+            results[1].result()
+        self.assertEqual(results[2].result().package_slug, "package-1")
+
+    def test_concurrency_is_bounded(self) -> None:
+        app = InFlight(HubApp(assistants=16))
+        results = get_assistants_bulk(make_api(app), _slugs(16), max_concurrency=3)
+        self.assertEqual(len(results), 16)
+        self.assertEqual(app.peak, 3)
+
+    def test_arguments_are_validated_once(self) -> None:
+        app = HubApp()
+        with self.assertRaises(ApiTypeError):
+            get_assistants_bulk(make_api(app), [("owner-0", "package-0"), ("owner-1", 1)])
+        self.assertEqual(app.requests, [])
+
+
+class TestGetAssistantsBulkAsync(unittest.IsolatedAsyncioTestCase):
+
+    async def test_results_follow_input_order(self) -> None:
+        app = HubApp(assistants=10, latency=0.05)
+        items = _slugs(10) + [("owner-0", "missing")]
+        async with AsyncApiClient(hub_configuration(app)) as api_client:
+            started = time.monotonic()
+            results = await get_assistants_bulk_async(
+                AsyncDefaultApi(api_client), items, max_concurrency=11
+            )
+            elapsed = time.monotonic() - started
+        self.assertEqual([r.key for r in results], items)
+        self.assertEqual([r.ok for r in results], [True] * 10 + [False])
+        self.assertIsInstance(results[-1].error, NotFoundException)
+        self.assertLess(elapsed, 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
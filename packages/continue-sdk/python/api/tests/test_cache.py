@@ -0,0 +1,126 @@
+import tempfile
+import time
+import unittest
+
+from openapi_client import AsyncApiClient, AsyncDefaultApi
+from openapi_client.cache import HTTPCache, parse_cache_control
+from openapi_client.exceptions import NotFoundException
+
+from tests.hub import FakeClock, HubApp, hub_configuration, make_api
+
+
+class TestHTTPCache(unittest.TestCase):
+
+    def test_parse_cache_control(self) -> None:
+        self.assertEqual(
+            parse_cache_control('max-age=60, stale-while-revalidate="30", No-Cache'),
+            {"max-age": "60", "stale-while-revalidate": "30", "no-cache": None},
+        )
+
+    def test_fresh_entry_is_served_without_request(self) -> None:
+        app = HubApp(cache_control="max-age=60")
+        cache = HTTPCache()
+        api = make_api(app, http_cache=cache)
+        first = api.list_assistants()
+        second = api.list_assistants()
+        self.assertEqual(first, second)
+        self.assertEqual(len(app.requests), 1)
+        self.assertEqual(cache.snapshot()["hits"], 1)
+
+    def test_etag_revalidation(self) -> None:
+        app = HubApp()
+        cache = HTTPCache()
+        api = make_api(app, http_cache=cache)
+        api.get_policy()
+        response = api.get_policy_with_http_info()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data.org_slug, "acme")
+        self.assertEqual(len(app.requests), 2)
+        environ = app.requests[1][3]
+        self.assertTrue(environ["HTTP_IF_NONE_MATCH"].startswith('"'))
+        self.assertEqual(cache.snapshot()["revalidated"], 1)
+
+    def test_request_no_cache_forces_revalidation(self) -> None:
+        app = HubApp(cache_control="max-age=60")
+        api = make_api(app, http_cache=HTTPCache())
+        api.get_policy()
+        api.get_policy(_headers={"Cache-Control": "no-cache"})
+        self.assertEqual(len(app.requests), 2)
+        self.assertIn("HTTP_IF_NONE_MATCH", app.requests[1][3])
+
+    def test_keys_include_identity_and_organization(self) -> None:
+        app = HubApp(cache_control="max-age=60")
+        cache = HTTPCache()
+        alice = make_api(app, "alice", http_cache=cache)
+        bob = make_api(app, "bob", http_cache=cache)
+        alice.list_assistants(organization_id="org-1")
+        alice.list_assistants(organization_id="org-2")
+        bob.list_assistants(organization_id="org-1")
+        self.assertEqual(len(app.requests), 3)
+        alice.list_assistants(organization_id="org-1")
+        bob.list_assistants(organization_id="org-1")
+        self.assertEqual(len(app.requests), 3)
+
+    def test_stale_while_revalidate(self) -> None:
+        app = HubApp(cache_control="max-age=10, stale-while-revalidate=60")
+        clock = FakeClock()
+        cache = HTTPCache(clock=clock)
+        api = make_api(app, http_cache=cache)
+        api.get_policy()
+        clock.now += 30
+        self.assertEqual(api.get_policy().org_slug, "acme")
+        deadline = time.monotonic() + 5
+        while len(app.requests) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(app.requests), 2)
+        self.assertEqual(cache.snapshot()["stale_served"], 1)
+        clock.now += 120
+        api.get_policy()
+        self.assertEqual(len(app.requests), 3)
+
+    def test_lru_evicts_by_size(self) -> None:
+        app = HubApp(cache_control="max-age=60")
+        cache = HTTPCache()
+        api = make_api(app, http_cache=cache)
+        api.get_assistant("owner-0", "package-0")
+        cache.max_bytes = cache.snapshot()["bytes"] * 3 // 2
+        api.get_assistant("owner-1", "package-1")
+        snapshot = cache.snapshot()
+        self.assertEqual(snapshot["entries"], 1)
+        self.assertLessEqual(snapshot["bytes"], cache.max_bytes)
+        api.get_assistant("owner-1", "package-1")
+        api.get_assistant("owner-0", "package-0")
+        self.assertEqual(len(app.requests), 3)
+
+    def test_disk_persistence(self) -> None:
+        app = HubApp(cache_control="max-age=60")
+        with tempfile.TemporaryDirectory() as directory:
+            make_api(app, http_cache=HTTPCache(directory=directory)).list_organizations()
+            api = make_api(app, http_cache=HTTPCache(directory=directory))
+            organizations = api.list_organizations()
+        self.assertEqual(organizations.organizations[0].slug, "acme")
+        self.assertEqual(len(app.requests), 1)
+
+    def test_errors_are_not_stored(self) -> None:
+        app = HubApp(cache_control="max-age=60")
+        cache = HTTPCache()
+        api = make_api(app, http_cache=cache)
+        for _ in range(2):
+            with self.assertRaises(NotFoundException):
+                api.get_assistant("owner-1", "missing")
+        self.assertEqual(len(app.requests), 2)
+        self.assertEqual(cache.snapshot()["entries"], 0)
+
+
+class TestAsyncHTTPCache(unittest.IsolatedAsyncioTestCase):
+
+    async def test_fresh_entry_is_served_without_request(self) -> None:
+        app = HubApp(cache_control="max-age=60")
+        async with AsyncApiClient(hub_configuration(app, http_cache=HTTPCache())) as api_client:
+            api = AsyncDefaultApi(api_client)
+            self.assertEqual(await api.list_assistants(), await api.list_assistants())
+        self.assertEqual(len(app.requests), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
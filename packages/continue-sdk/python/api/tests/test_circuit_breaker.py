@@ -0,0 +1,155 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from openapi_client import AsyncApiClient, AsyncDefaultApi
+from openapi_client.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from openapi_client.exceptions import CircuitOpenException, NotFoundException, ServiceException
+from openapi_client.retry import RetryPolicy
+
+from tests.hub import FakeClock, HubApp, hub_configuration, make_api
+from tests.test_retry import FlakyTransport
+
+
+def _breaker(clock, **kwargs):
+    transitions = []
+    breaker = CircuitBreaker(
+        failure_threshold=3,
+        recovery_timeout=10,
+        recovery_jitter=0,
+        clock=clock,
+        on_state_change=lambda key, old, new: transitions.append((key, old, new)),
+        **kwargs
+    )
+    return breaker, transitions
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def _trip(self, api, app, failures=3):
+        app.inject(503, times=failures)
+        for _ in range(failures):
+            with self.assertRaises(ServiceException):
+                api.get_policy()
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        clock = FakeClock()
+        breaker, transitions = _breaker(clock)
+        app = HubApp()
+        api = make_api(app, circuit_breaker=breaker)
+        self._trip(api, app)
+        self.assertEqual(breaker.state("hub.test"), OPEN)
+        with self.assertRaises(CircuitOpenException) as cm:
+            api.list_assistants()
+        self.assertEqual(cm.exception.host, "hub.test")
+        self.assertEqual(cm.exception.retry_after, 10)
+        self.assertEqual(len(app.requests), 3)
+        self.assertEqual(transitions, [(("hub.test",), CLOSED, OPEN)])
+        snapshot = breaker.snapshot()["hub.test"]
+        self.assertEqual((snapshot["state"], snapshot["rejected"]), (OPEN, 1))
+
+    def test_successes_reset_the_failure_count(self) -> None:
+        breaker, _ = _breaker(FakeClock())
+        app = HubApp()
+        api = make_api(app, circuit_breaker=breaker)
+        for _ in range(3):
+            self._trip(api, app, failures=2)
+            api.get_policy()
+        self.assertEqual(breaker.state("hub.test"), CLOSED)
+
+    def test_client_errors_keep_the_circuit_closed(self) -> None:
+        breaker, _ = _breaker(FakeClock())
+        api = make_api(HubApp(), circuit_breaker=breaker)
+        for _ in range(5):
+            with self.assertRaises(NotFoundException):
+                api.get_assistant("owner-1", "missing")
+        self.assertEqual(breaker.state("hub.test"), CLOSED)
+
+    def test_connection_errors_count_as_failures(self) -> None:
+        breaker, _ = _breaker(FakeClock())
+        app = HubApp()
+        transport = FlakyTransport(app, ConnectionRefusedError(), failures=3)
+        api = make_api(app, transport=transport, circuit_breaker=breaker)
+        for _ in range(3):
+            with self.assertRaises(ConnectionRefusedError):
+                api.get_policy()
+        self.assertEqual(breaker.state("hub.test"), OPEN)
+
+    def test_half_open_admits_a_single_probe(self) -> None:
+        clock = FakeClock()
+        breaker, transitions = _breaker(clock)
+        app = HubApp()
+        api = make_api(app, circuit_breaker=breaker)
+        self._trip(api, app)
+        clock.now += 10
+        self.assertEqual(breaker.state("hub.test"), HALF_OPEN)
+
+        app.latency = 0.2
+
+        def call():
+            try:
+                return api.get_policy()
+            except CircuitOpenException:
+                return None
+
+        with ThreadPoolExecutor(5) as pool:
+            results = list(pool.map(lambda _: call(), range(5)))
+        self.assertEqual(sum(r is not None for r in results), 1)
+        self.assertEqual(len(app.requests), 4)
+        self.assertEqual(breaker.state("hub.test"), CLOSED)
+        self.assertEqual([t[2] for t in transitions], [OPEN, HALF_OPEN, CLOSED])
+
+    def test_failed_probe_reopens(self) -> None:
+        clock = FakeClock()
+        breaker, _ = _breaker(clock)
+        app = HubApp()
+        api = make_api(app, circuit_breaker=breaker)
+        self._trip(api, app)
+        clock.now += 10
+        self._trip(api, app, failures=1)
+        self.assertEqual(breaker.state("hub.test"), OPEN)
+        with self.assertRaises(CircuitOpenException):
+            api.get_policy()
+
+    def test_per_operation(self) -> None:
+        breaker, _ = _breaker(FakeClock(), per_operation=True)
+        app = HubApp()
+        api = make_api(app, circuit_breaker=breaker)
+        self._trip(api, app)
+        self.assertEqual(breaker.state("hub.test", "get_policy"), OPEN)
+        self.assertEqual(len(api.list_assistants()), 3)
+        with self.assertRaises(CircuitOpenException) as cm:
+            api.get_policy()
+        self.assertEqual(cm.exception.operation, "get_policy")
+
+    def test_open_circuit_is_not_retried(self) -> None:
+        breaker, _ = _breaker(FakeClock())
+        breaker.failure_threshold = 2
+        app = HubApp()
+        app.inject(503, times=10)
+        policy = RetryPolicy(max_attempts=5, sleep=lambda delay: None)
+        with self.assertRaises(CircuitOpenException):
+            make_api(app, circuit_breaker=breaker, retry_policy=policy).get_policy()
+        self.assertEqual(len(app.requests), 2)
+
+
+class TestAsyncCircuitBreaker(unittest.IsolatedAsyncioTestCase):
+
+    async def test_fails_fast_while_open(self) -> None:
+        breaker, _ = _breaker(FakeClock())
+        app = HubApp()
+        app.inject(503, times=3)
+        async with AsyncApiClient(hub_configuration(app, circuit_breaker=breaker)) as api_client:
+            api = AsyncDefaultApi(api_client)
+            for _ in range(3):
+                with self.assertRaises(ServiceException):
+                    await api.get_policy()
+            started = time.monotonic()
+            with self.assertRaises(CircuitOpenException):
+                await api.get_policy()
+            self.assertLess(time.monotonic() - started, 0.1)
+        self.assertEqual(len(app.requests), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+from unittest import mock
+
+from pydantic import ValidationError
+
+from openapi_client import (
+    ApiClient, AsyncApiClient, AsyncDefaultApi, Configuration, DefaultApi,
+)
+from openapi_client.inprocess import AsyncASGITransport, WSGITransport
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+from openapi_client.operations import OPERATIONS
+
+from tests.hub import HubApp, as_asgi
+
+CALLS = [
+    ("get_assistant", ("o", "p"), {}),
+    ("get_assistant", ("o",),
+     {"package_slug": "p", "organization_id": "org", "_request_timeout": 5.0}),
+    ("get_assistant", ("o", "p", "true", "org"), {"_headers": {"X-Trace": "1"}}),
+    ("get_policy", (), {"_host_index": 0}),
+    ("sync_secrets", (SyncSecretsRequest(fqsns=[]),), {"_content_type": "application/json"}),
+]
+
+
+class TestClientSideValidation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.app = HubApp(assistants=2)
+        self.configuration = Configuration(host="http://hub.test", access_token="token")
+        self.configuration.transport = WSGITransport(self.app)
+
+    def api(self, validation):
+        self.configuration.client_side_validation = validation
+        return DefaultApi(ApiClient(self.configuration))
+
+    def test_bind_matches_validate(self) -> None:
+        for operation_id, args, kwargs in CALLS:
+            operation = OPERATIONS[operation_id]
+            with self.subTest(operation_id=operation_id, args=args):
+                self.assertEqual(operation.bind(args, kwargs), operation.validate(args, kwargs))
+
+    def test_bind_rejects_calls_that_do_not_fit(self) -> None:
+        operation = OPERATIONS["get_assistant"]
+        with self.assertRaisesRegex(TypeError, "missing required argument 'package_slug'"):
+            operation.bind(("o",), {})
+        with self.assertRaisesRegex(TypeError, "unexpected keyword argument 'slug'"):
+            operation.bind(("o", "p"), {"slug": "s"})
+        with self.assertRaisesRegex(TypeError, "multiple values for argument 'owner_slug'"):
+            operation.bind(("o", "p"), {"owner_slug": "o"})
+        with self.assertRaisesRegex(TypeError, "positional arguments"):
+            operation.bind(("o",) * 10, {})
+
+    def test_calls_skip_validation_when_off(self) -> None:
+        api = self.api(False)
+        policy = OPERATIONS["get_policy"]
+        with mock.patch.object(policy, "validate", side_effect=AssertionError("validated")):
+            self.assertEqual(api.get_policy().org_slug, "acme")
+            self.assertEqual(api.get_policy_with_http_info().status_code, 200)
+            self.assertEqual(api.get_policy_without_preload_content().status, 200)
+        # values are sent as given
+        api.get_assistant_without_preload_content(1, "package-1", _request_timeout=60)
+        self.assertEqual(self.app.requests[-1][1], "/ide/get-assistant/1/package-1")
+        with self.assertRaises(TypeError):
+            api.get_assistant("owner-1")
+
+    def test_calls_are_validated_by_default(self) -> None:
+        api = self.api(True)
+        with self.assertRaises(ValidationError):
+            api.get_assistant(1, "package-1")
+        self.assertEqual(api.get_assistant("owner-1", "package-1").package_slug, "package-1")
+
+    def test_setting_is_read_when_clients_are_created(self) -> None:
+        api = self.api(False)
+        self.configuration.client_side_validation = True
+        api.get_assistant_without_preload_content(1, "package-1")
+        with self.assertRaises(ValidationError):
+            DefaultApi(ApiClient(self.configuration)).get_assistant(1, "package-1")
+
+
+class TestClientSideValidationAsync(unittest.IsolatedAsyncioTestCase):
+
+    async def test_calls_skip_validation_when_off(self) -> None:
+        app = HubApp(assistants=2)
+        configuration = Configuration(host="http://hub.test", access_token="token")
+        configuration.async_transport = AsyncASGITransport(as_asgi(app))
+        configuration.client_side_validation = False
+        async with AsyncApiClient(configuration) as api_client:
+            api = AsyncDefaultApi(api_client)
+            operation = OPERATIONS["get_assistant"]
+            with mock.patch.object(operation, "validate", side_effect=AssertionError):
+                assistant = await api.get_assistant("owner-1", "package-1")
+        self.assertEqual(assistant.package_slug, "package-1")
+
+
+if __name__ == '__main__':
+    unittest.main()
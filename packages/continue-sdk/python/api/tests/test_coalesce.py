@@ -0,0 +1,134 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from openapi_client import AsyncApiClient, AsyncDefaultApi
+from openapi_client.coalesce import SingleFlight
+from openapi_client.exceptions import NotFoundException
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+
+from tests.hub import HubApp, hub_configuration, make_api
+
+
+def _concurrently(fn, n=8):
+    with ThreadPoolExecutor(n) as pool:
+        futures = [pool.submit(fn) for _ in range(n)]
+        return [f.result() for f in futures]
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_identical_gets_share_one_request(self) -> None:
+        app = HubApp(latency=0.2)
+        flight = SingleFlight()
+        api = make_api(app, single_flight=flight)
+        assistants = _concurrently(lambda: api.get_assistant("owner-1", "package-1"))
+        self.assertEqual(len(app.requests), 1)
+        self.assertTrue(all(a is assistants[0] for a in assistants))
+        self.assertEqual(
+            flight.snapshot()["get_assistant"], {"requests": 8, "coalesced": 7}
+        )
+
+    def test_sequential_calls_are_not_coalesced(self) -> None:
+        app = HubApp()
+        api = make_api(app, single_flight=SingleFlight())
+        api.get_policy()
+        api.get_policy()
+        self.assertEqual(len(app.requests), 2)
+
+    def test_identities_are_not_mixed(self) -> None:
+        app = HubApp(latency=0.2)
+        flight = SingleFlight()
+        alice = make_api(app, "alice", single_flight=flight)
+        bob = make_api(app, "bob", single_flight=flight)
+        with ThreadPoolExecutor(4) as pool:
+            futures = [pool.submit(api.get_policy) for api in (alice, bob, alice, bob)]
+            [f.result() for f in futures]
+        self.assertEqual(len(app.requests), 2)
+
+    def test_errors_are_shared(self) -> None:
+        app = HubApp(latency=0.2)
+        api = make_api(app, single_flight=SingleFlight())
+
+        def call():
+            with self.assertRaises(NotFoundException):
+                api.get_assistant("owner-1", "missing")
+
+        _concurrently(call, 4)
+        self.assertEqual(len(app.requests), 1)
+
+    def test_posts_are_not_coalesced(self) -> None:
+        app = HubApp(latency=0.1)
+        flight = SingleFlight()
+        api = make_api(app, single_flight=flight)
+        request = SyncSecretsRequest(fqsns=[{"secretName": "a"}])
+        _concurrently(lambda: api.sync_secrets_without_preload_content(request), 3)
+        self.assertEqual(len(app.requests), 3)
+        self.assertEqual(flight.snapshot(), {})
+
+
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+
+    async def test_identical_gets_share_one_request(self) -> None:
+        app = HubApp(latency=0.05)
+        flight = SingleFlight()
+        async with AsyncApiClient(hub_configuration(app, single_flight=flight)) as api_client:
+            api = AsyncDefaultApi(api_client)
+            policies = await asyncio.gather(*[api.get_policy() for _ in range(10)])
+        self.assertEqual(len(app.requests), 1)
+        self.assertTrue(all(p is policies[0] for p in policies))
+        self.assertEqual(flight.snapshot()["get_policy"], {"requests": 10, "coalesced": 9})
+
+    async def test_cancelling_the_leader_does_not_cancel_followers(self) -> None:
+        flight = SingleFlight()
+        sent = []
+        release = asyncio.Event()
+
+        class Response:
+            async def read(self):
+                return b"{}"
+
+        async def send(headers):
+            sent.append(headers)
+            if len(sent) == 1:
+                await asyncio.Event().wait()  # the leader hangs until cancelled
+            await release.wait()
+            return Response()
+
+        def request():
+            return asyncio.ensure_future(
+                flight.request_async(send, "GET", "http://hub.test/ide/policy", {})
+            )
+
+        leader = request()
+        await asyncio.sleep(0)
+        followers = [request() for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+        await asyncio.sleep(0)
+        release.set()
+        responses = await asyncio.gather(*followers)
+        self.assertEqual(len(sent), 2)
+        self.assertTrue(all(r is responses[0] for r in responses))
+        self.assertEqual(flight.snapshot()["get_policy"], {"requests": 4, "coalesced": 3})
+        self.assertEqual(flight._futures, {})
+
+    async def test_leader_cancelled_with_api_calls(self) -> None:
+        app = HubApp(latency=0.1)
+        configuration = hub_configuration(app, single_flight=SingleFlight())
+        async with AsyncApiClient(configuration) as api_client:
+            api = AsyncDefaultApi(api_client)
+            leader = asyncio.ensure_future(api.get_policy())
+            await asyncio.sleep(0.02)
+            follower = asyncio.ensure_future(api.get_policy())
+            await asyncio.sleep(0.02)
+            leader.cancel()
+            policy = await follower
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(policy.org_slug, "acme")
+
+
+if __name__ == '__main__':
+    unittest.main()
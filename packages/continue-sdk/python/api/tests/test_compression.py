@@ -0,0 +1,181 @@
+import base64
+import copy
+import gc
+import gzip
+import json
+import random
+import tracemalloc
+import unittest
+
+from openapi_client import ApiClient, AsyncApiClient, AsyncDefaultApi, Configuration, DefaultApi
+from openapi_client.cache import HTTPCache
+from openapi_client.coalesce import SingleFlight
+from openapi_client.compression import ACCEPT_ENCODING, TransferMetrics
+from openapi_client.inprocess import AsyncASGITransport, WSGITransport
+from openapi_client.rest import build_response
+from openapi_client.streaming import iter_assistants
+
+from tests.hub import HubApp, as_asgi, make_api, serve_hub
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+CODINGS = [c for c in ("gzip", "deflate", "br") if c in ACCEPT_ENCODING]
+
+
+class TestCompression(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.configuration = Configuration(host="http://hub.test", access_token="token")
+        self.configuration.transfer_metrics = TransferMetrics()
+
+    def api(self, app):
+        self.configuration.transport = WSGITransport(app)
+        return DefaultApi(ApiClient(self.configuration))
+
+    def test_accept_encoding(self) -> None:
+        app = HubApp()
+        self.api(app).get_policy()
+        self.assertEqual(app.requests[-1][3]["HTTP_ACCEPT_ENCODING"], ACCEPT_ENCODING)
+        self.configuration.compression = False
+        self.api(app).get_policy()
+        self.assertNotIn("HTTP_ACCEPT_ENCODING", app.requests[-1][3])
+
+    def test_responses_are_decoded(self) -> None:
+        expected = self.api(HubApp(assistants=20)).list_assistants()
+        for coding in CODINGS:
+            with self.subTest(coding=coding):
+                api = self.api(HubApp(assistants=20, compress=(coding,)))
+                self.assertEqual(api.list_assistants(), expected)
+
+    def test_metrics(self) -> None:
+        api = self.api(HubApp(assistants=20, compress=("gzip",)))
+        api.list_assistants()
+        api.get_policy()
+        self.configuration.compression = False
+        api.list_assistants()
+        snapshot = self.configuration.transfer_metrics.snapshot()
+        listed = snapshot["list_assistants"]
+        self.assertEqual(listed["responses"], 2)
+        self.assertEqual(listed["compressed_responses"], 1)
+        self.assertEqual(listed["encodings"], {"gzip": 1})
+        self.assertGreater(listed["ratio"], 1)
+        self.assertLess(listed["received_bytes"], listed["decoded_bytes"])
+        self.assertEqual(snapshot["get_policy"]["responses"], 1)
+
+    def test_streamed_bodies(self) -> None:
+        api = self.api(HubApp(assistants=20, compress=("gzip",)))
+        assistants = list(iter_assistants(api, chunk_size=100))
+        self.assertEqual(assistants, api.list_assistants())
+        listed = self.configuration.transfer_metrics.snapshot()["list_assistants"]
+        self.assertEqual(listed["compressed_responses"], 2)
+
+    def test_cached_responses_are_stored_decoded(self) -> None:
+        self.configuration.http_cache = HTTPCache()
+        app = HubApp(assistants=5, cache_control="max-age=60", compress=("gzip",))
+        api = self.api(app)
+        first = api.list_assistants()
+        self.assertEqual(api.list_assistants(), first)
+        self.assertEqual(len(app.requests), 1)
+
+    def test_raw_responses_keep_their_body(self) -> None:
+        expected = self.api(HubApp()).get_policy_without_preload_content().data
+        for settings in ({"http_cache": HTTPCache()}, {"single_flight": SingleFlight()}):
+            with self.subTest(settings=settings):
+                api = make_api(HubApp(compress=("gzip",)), **settings)
+                self.assertEqual(api.get_policy_without_preload_content().data, expected)
+
+    def test_read_does_not_hold_both_bodies(self) -> None:
+        size = 12 * 2 ** 20
+        noise = random.Random(0).getrandbits(size * 8).to_bytes(size, "little")
+        text = base64.b64encode(noise)  # compresses to ~3/4
+        compressed = gzip.compress(text)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            response = build_response(200, [("Content-Encoding", "gzip")], compressed)
+            baseline = tracemalloc.get_traced_memory()[0]
+            data = response.read()
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(data, text)
+        self.assertLess(peak, len(text) + len(compressed) // 2)
+
+    def test_configuration_copies_share_metrics(self) -> None:
+        configuration = copy.deepcopy(self.configuration)
+        self.assertIs(configuration.transfer_metrics, self.configuration.transfer_metrics)
+
+
+class TestCompressionAsync(unittest.IsolatedAsyncioTestCase):
+
+    @unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+    async def test_over_http(self) -> None:
+        app = HubApp(assistants=20, compress=("gzip",))
+        with serve_hub(app) as host:
+            configuration = Configuration(host=host, access_token="token")
+            async with AsyncApiClient(configuration) as api_client:
+                assistants = await AsyncDefaultApi(api_client).list_assistants()
+        self.assertEqual(len(assistants), 20)
+        # aiohttp asks for what it can decode
+        self.assertIn("gzip", app.requests[0][3]["HTTP_ACCEPT_ENCODING"])
+
+    @unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+    async def test_metrics_over_http(self) -> None:
+        app = HubApp(assistants=20, compress=("gzip",))
+        metrics = TransferMetrics()
+        with serve_hub(app) as host:
+            configuration = Configuration(host=host, access_token="token")
+            configuration.transfer_metrics = metrics
+            async with AsyncApiClient(configuration) as api_client:
+                await AsyncDefaultApi(api_client).list_assistants()
+            configuration.compression = False
+            async with AsyncApiClient(configuration) as api_client:
+                await AsyncDefaultApi(api_client).list_assistants()
+        self.assertEqual(app.requests[1][3]["HTTP_ACCEPT_ENCODING"], "identity")
+        body = json.dumps(app.assistants).encode("utf-8")
+        listed = metrics.snapshot()["list_assistants"]
+        self.assertEqual(listed["responses"], 2)
+        self.assertEqual(listed["compressed_responses"], 1)
+        self.assertEqual(listed["encodings"], {"gzip": 1})
+        self.assertEqual(listed["decoded_bytes"], 2 * len(body))
+        self.assertEqual(
+            listed["received_bytes"], len(gzip.compress(body, mtime=0)) + len(body)
+        )
+
+    async def test_metrics_in_process(self) -> None:
+        app = HubApp(assistants=5)
+        metrics = TransferMetrics()
+        configuration = Configuration(host="http://hub.test", access_token="token")
+        configuration.async_transport = AsyncASGITransport(as_asgi(app))
+        configuration.transfer_metrics = metrics
+        async with AsyncApiClient(configuration) as api_client:
+            await AsyncDefaultApi(api_client).list_assistants()
+        body = json.dumps(app.assistants).encode("utf-8")
+        listed = metrics.snapshot()["list_assistants"]
+        self.assertEqual(listed["received_bytes"], len(body))
+        self.assertEqual(listed["decoded_bytes"], len(body))
+
+
+class TestCompressionOverHTTP(unittest.TestCase):
+
+    def test_list_assistants(self) -> None:
+        app = HubApp(assistants=30, compress=("gzip",))
+        metrics = TransferMetrics()
+        with serve_hub(app) as host:
+            configuration = Configuration(host=host, access_token="token")
+            configuration.transfer_metrics = metrics
+            assistants = DefaultApi(ApiClient(configuration)).list_assistants()
+        self.assertEqual(
+            [a.package_slug for a in assistants], ["package-%d" % i for i in range(30)]
+        )
+        listed = metrics.snapshot()["list_assistants"]
+        body = json.dumps(app.assistants).encode("utf-8")
+        self.assertEqual(listed["decoded_bytes"], len(body))
+        self.assertEqual(listed["received_bytes"], len(gzip.compress(body, mtime=0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
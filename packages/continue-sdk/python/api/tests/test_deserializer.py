@@ -0,0 +1,182 @@
+import json
+import unittest
+from unittest import mock
+
+from pydantic import ValidationError
+
+from openapi_client import ApiClient, Configuration, DefaultApi
+from openapi_client.deserializer import DeserializerPlan, parse_type
+from openapi_client.inprocess import WSGITransport
+from openapi_client.models.get_free_trial_status200_response import GetFreeTrialStatus200Response
+from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+from openapi_client.models.list_organizations200_response import ListOrganizations200Response
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+
+from tests.hub import HubApp, make_assistant
+
+JSON = "application/json; charset=utf-8"
+
+
+class TestParseType(unittest.TestCase):
+
+    def test_nested_types(self) -> None:
+        self.assertEqual(parse_type("Model"), ("name", "Model"))
+        self.assertEqual(
+            parse_type("Dict[str, List[Optional[object]]]"),
+            ("dict", ("list", ("optional", ("name", "object")))),
+        )
+
+    def test_malformed_types(self) -> None:
+        for type_string in ("List[Model", "List[Model]]", "Dict[str]"):
+            with self.assertRaises(ValueError):
+                parse_type(type_string)
+
+
+class TestDeserializerPlan(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.api_client = ApiClient()
+
+    def test_matches_from_dict(self) -> None:
+        payload = [make_assistant(i) for i in range(5)]
+        payload[1]["iconUrl"] = None
+        del payload[2]["iconUrl"]
+        payload.append(None)
+        text = json.dumps(payload)
+        result = self.api_client.deserialize(
+            text, "List[ListAssistants200ResponseInner]", JSON
+        )
+        expected = [
+            ListAssistants200ResponseInner.from_dict(item) for item in json.loads(text)
+        ]
+        self.assertEqual(result, expected)
+        self.assertEqual(
+            [a and a.to_dict() for a in result], [a and a.to_dict() for a in expected]
+        )
+        self.assertEqual(
+            [a.config_result.model_fields_set for a in result[:5]],
+            [a.config_result.model_fields_set for a in expected[:5]],
+        )
+
+    def test_nested_lists_of_models(self) -> None:
+        text = json.dumps({"organizations": [
+            {"id": "org-1", "name": "Acme", "slug": "acme"},
+        ]})
+        result = self.api_client.deserialize(text, "ListOrganizations200Response", JSON)
+        self.assertEqual(result, ListOrganizations200Response.from_json(text))
+        self.assertEqual(result.organizations[0].to_dict(), {
+            "id": "org-1", "name": "Acme", "iconUrl": None, "slug": "acme",
+        })
+
+    def test_payloads_only_from_dict_accepts(self) -> None:
+        # `config` is required but nullable: from_dict fills in the missing key
+        payload = make_assistant(0)
+        del payload["configResult"]["config"]
+        result = self.api_client.deserialize(
+            json.dumps(payload), "ListAssistants200ResponseInner", JSON
+        )
+        self.assertIsNone(result.config_result.config)
+
+    def test_invalid_payloads_raise_as_before(self) -> None:
+        payload = make_assistant(0)
+        payload["ownerSlug"] = 42
+        with self.assertRaises(ValidationError):
+            self.api_client.deserialize(
+                json.dumps(payload), "ListAssistants200ResponseInner", JSON
+            )
+
+    def test_native_types(self) -> None:
+        self.assertEqual(
+            self.api_client.deserialize('{"a": "1", "b": null}', "Dict[str, int]", JSON),
+            {"a": 1, "b": None},
+        )
+        self.assertEqual(
+            self.api_client.deserialize('[{"x": 1}, null]', "List[Optional[object]]", JSON),
+            [{"x": 1}, None],
+        )
+
+    def test_sync_secrets(self) -> None:
+        configuration = Configuration(host="http://hub.test", access_token="token")
+        configuration.transport = WSGITransport(HubApp())
+        api = DefaultApi(ApiClient(configuration))
+        fqsn = {"secretName": "OPENAI_API_KEY"}
+        self.assertEqual(
+            api.sync_secrets(SyncSecretsRequest(fqsns=[fqsn])),
+            [{"fqsn": fqsn, "value": "secret"}],
+        )
+
+
+class TestTrustedResponses(unittest.TestCase):
+
+    def setUp(self) -> None:
+        configuration = Configuration()
+        configuration.trusted_responses = True
+        configuration.trusted_responses_validate_one_in = 0
+        self.api_client = ApiClient(configuration)
+
+    def deserialize(self, payload, response_type="ListAssistants200ResponseInner"):
+        return self.api_client.deserialize(json.dumps(payload), response_type, JSON)
+
+    def test_matches_from_dict(self) -> None:
+        payload = [make_assistant(i) for i in range(5)]
+        payload[1]["iconUrl"] = None
+        del payload[2]["iconUrl"]
+        del payload[3]["configResult"]["config"]
+        payload.append(None)
+        result = self.deserialize(payload, "List[ListAssistants200ResponseInner]")
+        expected = [ListAssistants200ResponseInner.from_dict(item) for item in payload]
+        self.assertEqual(result, expected)
+        self.assertEqual(
+            [a and a.to_dict() for a in result], [a and a.to_dict() for a in expected]
+        )
+        self.assertEqual(
+            [a.config_result.model_fields_set for a in result[:5]],
+            [a.config_result.model_fields_set for a in expected[:5]],
+        )
+
+    def test_numbers_keep_their_type(self) -> None:
+        payload = {"optedInToFreeTrial": True, "chatCount": 3, "chatLimit": 2.5,
+                   "autocompleteLimit": 100}
+        self.assertEqual(
+            self.deserialize(payload, "GetFreeTrialStatus200Response"),
+            GetFreeTrialStatus200Response.from_dict(payload),
+        )
+
+    def test_assignments_are_still_validated(self) -> None:
+        assistant = self.deserialize(make_assistant(0))
+        with self.assertRaises(ValidationError):
+            assistant.owner_slug = 42
+
+    def test_misshapen_payloads_are_validated(self) -> None:
+        for path, value in (
+            (("ownerSlug",), 42),
+            (("ownerSlug",), None),
+            (("configResult",), []),
+            (("configResult", "errors"), ["ok", 1]),
+            (("configResult", "configLoadInterrupted"), "no"),
+        ):
+            payload = make_assistant(0)
+            target = payload
+            for key in path[:-1]:
+                target = target[key]
+            target[path[-1]] = value
+            with self.subTest(path=path, value=value):
+                with self.assertRaises(ValidationError):
+                    self.deserialize(payload)
+
+    def test_one_in_n_responses_is_validated(self) -> None:
+        self.api_client.configuration.trusted_responses_validate_one_in = 3
+        with mock.patch.object(
+            DeserializerPlan, "from_json", autospec=True, side_effect=DeserializerPlan.from_json
+        ) as from_json:
+            results = [
+                self.deserialize([make_assistant(i)], "List[ListAssistants200ResponseInner]")
+                for i in range(6)
+            ]
+        self.assertEqual(from_json.call_count, 2)
+        self.assertEqual([r[0].package_slug for r in results],
+                         ["package-%d" % i for i in range(6)])
+
+
+if __name__ == '__main__':
+    unittest.main()
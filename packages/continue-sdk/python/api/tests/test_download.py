@@ -0,0 +1,240 @@
+import gc
+import hashlib
+import io
+import os
+import re
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+
+from openapi_client import ApiClient, Configuration
+from openapi_client.download import FileSink, download
+from openapi_client.exceptions import ApiException, NotFoundException
+from openapi_client.inprocess import WSGITransport
+from openapi_client.rest import build_response
+from openapi_client.transport import Transport
+
+from tests.hub import serve_hub
+
+DATA = bytes(range(256)) * 4096  # 1 MiB
+
+
+class FileApp:
+    """Serves `data` at /files/model.bin with Range and If-Range support.
+
+    :param cuts: offsets at which successive responses stop short of their
+        Content-Length, as when the connection drops.
+    """
+
+    def __init__(self, data=DATA, etag='"v1"', cuts=()) -> None:
+        self.data = data
+        self.etag = etag
+        self.cuts = list(cuts)
+        self.requests = []
+
+    def __call__(self, environ, start_response):
+        requested = environ.get("HTTP_RANGE")
+        if_range = environ.get("HTTP_IF_RANGE")
+        self.requests.append((requested, if_range))
+        if environ["PATH_INFO"] != "/files/model.bin":
+            start_response("404 Not Found", [("Content-Type", "text/plain")])
+            return [b"no such file"]
+        size = len(self.data)
+        status, start = "200 OK", 0
+        headers = [("Content-Type", "application/octet-stream")]
+        if self.etag:
+            headers.append(("ETag", self.etag))
+        if requested and (if_range is None or if_range == self.etag):
+            start = int(re.match(r"bytes=(\d+)-", requested).group(1))
+            status = "206 Partial Content"
+            headers.append(("Content-Range", "bytes %d-%d/%d" % (start, size - 1, size)))
+        headers.append(("Content-Length", str(size - start)))
+        start_response(status, headers)
+        end = self.cuts.pop(0) if self.cuts else size
+        return [self.data[start:max(start, end)]]
+
+
+class Pattern(io.RawIOBase):
+    """`size` bytes generated as they are read."""
+
+    def __init__(self, size) -> None:
+        self.left = size
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        n = min(len(b), self.left)
+        b[:n] = b"\xab" * n
+        self.left -= n
+        return n
+
+
+class PatternTransport(Transport):
+
+    def __init__(self, size) -> None:
+        self.size = size
+
+    def request(self, method, url, headers=None, body=None, post_params=None,
+                _request_timeout=None):
+        return build_response(
+            200, [("Content-Length", str(self.size))], io.BufferedReader(Pattern(self.size))
+        )
+
+
+class TestDownload(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder)
+        self.path = os.path.join(self.folder, "model.bin")
+        self.configuration = Configuration(host="http://hub.test", access_token="token")
+        self.configuration.temp_folder_path = self.folder
+
+    def download(self, app, **kwargs):
+        self.configuration.transport = WSGITransport(app)
+        kwargs.setdefault("path", self.path)
+        return download(ApiClient(self.configuration), "/files/model.bin", **kwargs)
+
+    def read(self, path=None):
+        with open(path or self.path, "rb") as f:
+            return f.read()
+
+    def test_writes_and_hashes_the_file(self) -> None:
+        result = self.download(FileApp(), buffer_size=4096)
+        self.assertEqual(self.read(), DATA)
+        self.assertEqual(result.path, self.path)
+        self.assertEqual(result.size, len(DATA))
+        self.assertEqual(result.digest, hashlib.sha256(DATA).hexdigest())
+        self.assertEqual(result.resumes, 0)
+        self.assertEqual(result.status, 200)
+        self.assertEqual(os.listdir(self.folder), ["model.bin"])
+
+    def test_temporary_file_without_path(self) -> None:
+        result = self.download(FileApp(), path=None, algorithm="md5")
+        self.assertEqual(os.path.dirname(result.path), self.folder)
+        self.assertEqual(self.read(result.path), DATA)
+        self.assertEqual(result.digest, hashlib.md5(DATA).hexdigest())
+
+    def test_resumes_where_the_body_stopped(self) -> None:
+        app = FileApp(cuts=[100000, 700000])
+        result = self.download(app, buffer_size=8192)
+        self.assertEqual(self.read(), DATA)
+        self.assertEqual(result.digest, hashlib.sha256(DATA).hexdigest())
+        self.assertEqual(result.resumes, 2)
+        self.assertEqual(app.requests, [
+            (None, None), ("bytes=100000-", '"v1"'), ("bytes=700000-", '"v1"'),
+        ])
+
+    def test_changed_file_is_downloaded_again(self) -> None:
+        app = FileApp(cuts=[100000])
+        self.configuration.transport = WSGITransport(app)
+        api_client = ApiClient(self.configuration)
+        original = api_client.rest_client.request
+
+        def request(*args, **kwargs):
+            if app.requests:
+                app.data, app.etag = DATA[::-1], '"v2"'
+            return original(*args, **kwargs)
+
+        api_client.rest_client.request = request
+        result = download(api_client, "/files/model.bin", path=self.path)
+        self.assertEqual(self.read(), DATA[::-1])
+        self.assertEqual(result.digest, hashlib.sha256(DATA[::-1]).hexdigest())
+
+    def test_starts_over_without_a_validator(self) -> None:
+        app = FileApp(etag=None, cuts=[100000])
+        result = self.download(app)
+        self.assertEqual(self.read(), DATA)
+        self.assertEqual(result.resumes, 1)
+        self.assertEqual(app.requests, [(None, None), (None, None)])
+
+    def test_gives_up_after_max_resumes(self) -> None:
+        app = FileApp(cuts=[1000, 2000, 3000])
+        with self.assertRaises(Exception):
+            self.download(app, max_resumes=2)
+        self.assertEqual(len(app.requests), 3)
+        self.assertEqual(os.listdir(self.folder), [])
+
+    def test_error_responses_raise(self) -> None:
+        self.configuration.transport = WSGITransport(FileApp())
+        with self.assertRaises(NotFoundException) as raised:
+            download(ApiClient(self.configuration), "/files/missing.bin", path=self.path)
+        self.assertEqual(raised.exception.body, "no such file")
+        self.assertEqual(os.listdir(self.folder), [])
+
+    def test_misplaced_range_raises(self) -> None:
+        app = FileApp(cuts=[100000])
+        self.configuration.transport = WSGITransport(app)
+        api_client = ApiClient(self.configuration)
+        original = api_client.rest_client.request
+
+        def request(method, url, headers=None, **kwargs):
+            if "Range" in headers:
+                headers = dict(headers, Range="bytes=5-")
+            return original(method, url, headers=headers, **kwargs)
+
+        api_client.rest_client.request = request
+        with self.assertRaises(ApiException):
+            download(api_client, "/files/model.bin", path=self.path)
+        self.assertEqual(os.listdir(self.folder), [])
+
+    def test_memory_does_not_grow_with_the_file(self) -> None:
+        size = 64 * 2 ** 20
+        self.configuration.transport = PatternTransport(size)
+        api_client = ApiClient(self.configuration)
+        download(api_client, "/files/model.bin", path=self.path, buffer_size=65536)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = download(api_client, "/files/model.bin", path=self.path, buffer_size=65536)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(result.size, size)
+        self.assertEqual(os.path.getsize(self.path), size)
+        self.assertLess(peak, 2 ** 20)
+
+    def test_over_http(self) -> None:
+        app = FileApp(cuts=[300000])
+        with serve_hub(app) as host:
+            configuration = Configuration(host=host, access_token="token")
+            result = download(ApiClient(configuration), "/files/model.bin", path=self.path)
+        self.assertEqual(self.read(), DATA)
+        self.assertEqual(result.resumes, 1)
+        self.assertEqual(app.requests[1], ("bytes=300000-", '"v1"'))
+
+
+class TestFileResponses(unittest.TestCase):
+
+    def test_file_responses_are_streamed_to_disk(self) -> None:
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        configuration = Configuration()
+        configuration.temp_folder_path = folder
+        configuration.download_buffer_size = 1000
+        response = build_response(
+            200, [("Content-Disposition", 'attachment; filename="model.bin"')], DATA
+        )
+        path = ApiClient(configuration).response_deserialize(response, {"200": "file"}).data
+        self.assertEqual(path, os.path.join(folder, "model.bin"))
+        self.assertIsNone(response.data)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), DATA)
+
+    def test_sink_restart(self) -> None:
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        with FileSink(os.path.join(folder, "part"), algorithm="sha1") as sink:
+            sink.write(b"stale")
+            sink.restart()
+            sink.write(b"fresh")
+        self.assertEqual(sink.size, 5)
+        self.assertEqual(sink.hexdigest, hashlib.sha1(b"fresh").hexdigest())
+        with open(sink.path, "rb") as f:
+            self.assertEqual(f.read(), b"fresh")
+
+
+if __name__ == '__main__':
+    unittest.main()
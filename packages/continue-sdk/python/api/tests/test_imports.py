@@ -0,0 +1,72 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import openapi_client
+import openapi_client.api
+import openapi_client.models
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+
+def imported_after(statement):
+    """Modules a fresh interpreter has imported after running `statement`."""
+    output = subprocess.check_output(
+        [sys.executable, "-c",
+         statement + "\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"],
+        cwd=ROOT,
+    )
+    return set(json.loads(output))
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_importing_the_package_imports_no_dependency(self) -> None:
+        modules = imported_after("import openapi_client")
+        for name in ("pydantic", "urllib3", "aiohttp", "dateutil", "openapi_client.api_client",
+                     "openapi_client.models", "openapi_client.api"):
+            self.assertNotIn(name, modules)
+
+    def test_sync_client_imports_no_async_code_or_unused_model(self) -> None:
+        modules = imported_after("from openapi_client import ApiClient, Configuration, DefaultApi")
+        self.assertIn("openapi_client.api.default_api", modules)
+        for name in ("aiohttp", "httpx", "dateutil", "openapi_client.async_api_client",
+                     "openapi_client.api.async_default_api",
+                     "openapi_client.models.get_assistant403_response"):
+            self.assertNotIn(name, modules)
+
+    def test_exceptions_import_no_client_code(self) -> None:
+        modules = imported_after("import openapi_client.exceptions")
+        for name in ("asyncio", "openapi_client.retry", "openapi_client.routes",
+                     "openapi_client.operations"):
+            self.assertNotIn(name, modules)
+
+    def test_names_resolve_to_their_definitions(self) -> None:
+        for package in (openapi_client, openapi_client.api, openapi_client.models):
+            for name in package.__all__:
+                with self.subTest(name=name):
+                    value = getattr(package, name)
+                    self.assertIs(value, getattr(sys.modules[package._LAZY_IMPORTS[name]], name))
+                    self.assertIn(name, dir(package))
+        self.assertIs(openapi_client.DefaultApi, openapi_client.api.DefaultApi)
+        self.assertIs(openapi_client.SyncSecretsRequest, openapi_client.models.SyncSecretsRequest)
+
+    def test_unknown_names(self) -> None:
+        with self.assertRaises(AttributeError):
+            openapi_client.NoSuchModel
+        with self.assertRaises(ImportError):
+            from openapi_client.models import NoSuchModel  # noqa: F401
+        from openapi_client import rest  # submodules still import as usual
+        self.assertIs(rest, sys.modules["openapi_client.rest"])
+
+    def test_star_import(self) -> None:
+        namespace = {}
+        exec("from openapi_client import *", namespace)
+        self.assertIs(namespace["ApiClient"], openapi_client.ApiClient)
+        self.assertIn("ListAssistants200ResponseInner", namespace)
+
+
+if __name__ == '__main__':
+    unittest.main()
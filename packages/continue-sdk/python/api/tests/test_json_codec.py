@@ -0,0 +1,235 @@
+import copy
+import json
+import math
+import unittest
+
+from openapi_client import (
+    ApiClient, AsyncApiClient, AsyncDefaultApi, Configuration, DefaultApi, json_codec,
+)
+from openapi_client.exceptions import ApiValueError
+from openapi_client.inprocess import WSGITransport
+from openapi_client.json_codec import JSONCodec, JSONStream, get_codec, set_default_codec
+from openapi_client.models.list_organizations200_response_organizations_inner import (
+    ListOrganizations200ResponseOrganizationsInner,
+)
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+
+from tests.hub import HubApp, make_assistant, serve_hub
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+def _installed():
+    codecs = []
+    for name in json_codec.CODECS:
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            pass
+    return codecs
+
+
+class CountingCodec(JSONCodec):
+
+    name = "counting"
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def dumpb(self, obj):
+        self.calls.append("dumpb")
+        return super().dumpb(obj)
+
+    def loads(self, data):
+        self.calls.append("loads")
+        return super().loads(data)
+
+
+class TestCodecs(unittest.TestCase):
+
+    def test_same_values_as_stdlib(self) -> None:
+        values = [
+            [make_assistant(i) for i in range(3)],
+            {"fqsns": [{"secretName": "KEY", "é": "ü"}], "orgScopeId": None},
+            {1: 2, None: 0},
+            {"big": 2 ** 70, "float": 0.1, "neg": -0.0},
+        ]
+        for codec in _installed():
+            for value in values:
+                with self.subTest(codec=codec.name, value=value):
+                    expected = json.loads(json.dumps(value))
+                    self.assertEqual(json.loads(codec.dumps(value)), expected)
+                    self.assertEqual(json.loads(codec.dumpb(value)), expected)
+                    self.assertEqual(codec.loads(json.dumps(value).encode()), expected)
+
+    def test_bool_keys(self) -> None:
+        # written as the stdlib writes them, "true" and "false"
+        value = {True: 1, False: 2, 3: 4, None: 0}
+        expected = {"true": 1, "false": 2, "3": 4, "null": 0}
+        for codec in _installed():
+            with self.subTest(codec=codec.name):
+                self.assertEqual(json.loads(codec.dumps(value)), expected)
+                self.assertEqual(json.loads(codec.dumpb(value)), expected)
+                self.assertEqual(list(json.loads(codec.dumpb(value))), list(expected))
+
+    def test_non_finite_floats(self) -> None:
+        # written as the stdlib writes them, NaN and Infinity, not null
+        values = [[float("nan")], {"a": float("inf")}, {float("-inf"): [1, None]}]
+        for codec in _installed():
+            for value in values:
+                with self.subTest(codec=codec.name, value=value):
+                    self.assertEqual(codec.dumps(value), json.dumps(value))
+                    self.assertEqual(codec.dumpb(value), json.dumps(value).encode())
+
+    def test_wide_integers(self) -> None:
+        document = b"[%d, %d]" % (2 ** 70 + 1, -2 ** 64)
+        for codec in _installed():
+            with self.subTest(codec=codec.name):
+                if codec.name == "orjson":
+                    # decoded as floats, which is why "auto" never picks orjson
+                    self.assertIsInstance(codec.loads(document)[0], float)
+                else:
+                    self.assertEqual(codec.loads(document), [2 ** 70 + 1, -2 ** 64])
+                self.assertEqual(json.loads(codec.dumpb([2 ** 70 + 1])), [2 ** 70 + 1])
+
+    def test_stdlib_decides_what_fast_codecs_reject(self) -> None:
+        for codec in _installed():
+            with self.subTest(codec=codec.name):
+                self.assertTrue(math.isnan(codec.loads("NaN")))
+                self.assertEqual(codec.loads('"\\ud800"'), "\ud800")
+                with self.assertRaises(json.JSONDecodeError):
+                    codec.loads(b"{")
+                with self.assertRaises(TypeError):
+                    codec.dumps({"when": object()})
+
+    def test_selection(self) -> None:
+        self.assertEqual(get_codec("json").name, "json")
+        codec = CountingCodec()
+        self.assertIs(get_codec(codec), codec)
+        with self.assertRaises(ApiValueError):
+            get_codec("yaml")
+        self.assertIn(get_codec("auto").name, json_codec.AUTO_ORDER)
+        self.assertNotIn("orjson", json_codec.AUTO_ORDER)
+
+
+class TestCodecInClients(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.app = HubApp()
+        self.codec = CountingCodec()
+        configuration = Configuration(host="http://hub.test", access_token="token")
+        configuration.transport = WSGITransport(self.app)
+        configuration.json_codec = self.codec
+        self.api = DefaultApi(ApiClient(configuration))
+
+    def test_request_bodies_are_encoded_by_the_codec(self) -> None:
+        secrets = self.api.sync_secrets(SyncSecretsRequest(fqsns=[{"secretName": "KEY"}]))
+        self.assertEqual(secrets, [{"fqsn": {"secretName": "KEY"}, "value": "secret"}])
+        self.assertEqual(self.codec.calls, ["dumpb", "loads"])
+
+    def test_configuration_copies_share_the_codec(self) -> None:
+        configuration = copy.deepcopy(self.api.api_client.configuration)
+        self.assertIs(configuration.json_codec, self.codec)
+
+
+class TestJSONStream(unittest.TestCase):
+
+    def test_same_bytes_as_dumpb(self) -> None:
+        documents = [
+            {"fqsns": [{"secretName": "KEY-%d" % i, "n": i} for i in range(50)],
+             "orgScopeId": None, "empty": [], "nested": {"a": [1, 2.5, "é"]}},
+            [make_assistant(i) for i in range(3)],
+            {1: "int keys"}, [], {}, "text", 3, None,
+        ]
+        for codec in _installed():
+            for document in documents:
+                for chunk_size in (1, 7, 65536):
+                    with self.subTest(codec=codec.name, document=document, chunk_size=chunk_size):
+                        chunks = list(JSONStream(codec, document, chunk_size))
+                        self.assertEqual(b"".join(chunks), codec.dumpb(document))
+                        self.assertTrue(all(len(c) >= chunk_size for c in chunks[:-1]))
+
+    def test_models_are_sanitized_as_they_are_encoded(self) -> None:
+        api_client = ApiClient()
+        request = SyncSecretsRequest(fqsns=[{"secretName": "KEY-%d" % i} for i in range(20)])
+        for body in (request, [request, None], {"request": request}):
+            with self.subTest(body=body):
+                stream = JSONStream(
+                    api_client.json_codec, body, 16, sanitize=api_client.sanitize_for_serialization
+                )
+                self.assertEqual(
+                    stream.to_bytes(),
+                    api_client.json_codec.dumpb(api_client.sanitize_for_serialization(body)),
+                )
+
+    def test_first_chunk_before_the_whole_body_is_encoded(self) -> None:
+        codec = CountingCodec()
+        fqsns = [{"secretName": "KEY-%d" % i} for i in range(10000)]
+        chunks = iter(JSONStream(codec, {"fqsns": fqsns}, 1024))
+        next(chunks)
+        self.assertLess(len(codec.calls), 100)
+
+    def test_sync_secrets_over_http(self) -> None:
+        app = HubApp()
+        fqsns = [{"secretName": "KEY-%d" % i} for i in range(2000)]
+        with serve_hub(app) as host:
+            configuration = Configuration(host=host, access_token="token")
+            configuration.stream_request_bodies = True
+            configuration.upload_chunk_size = 4096
+            secrets = DefaultApi(ApiClient(configuration)).sync_secrets(
+                SyncSecretsRequest(fqsns=fqsns)
+            )
+        self.assertEqual([s["fqsn"] for s in secrets], fqsns)
+        environ = app.requests[0][3]
+        self.assertEqual(environ["HTTP_TRANSFER_ENCODING"], "chunked")
+        self.assertFalse(environ.get("CONTENT_LENGTH"))
+
+    def test_in_process(self) -> None:
+        configuration = Configuration(host="http://hub.test", access_token="token")
+        configuration.transport = WSGITransport(HubApp())
+        configuration.stream_request_bodies = True
+        secrets = DefaultApi(ApiClient(configuration)).sync_secrets(
+            SyncSecretsRequest(fqsns=[{"secretName": "KEY"}])
+        )
+        self.assertEqual(secrets, [{"fqsn": {"secretName": "KEY"}, "value": "secret"}])
+
+
+class TestJSONStreamAsync(unittest.IsolatedAsyncioTestCase):
+
+    @unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+    async def test_sync_secrets_over_http(self) -> None:
+        app = HubApp()
+        fqsns = [{"secretName": "KEY-%d" % i} for i in range(2000)]
+        with serve_hub(app) as host:
+            configuration = Configuration(host=host, access_token="token")
+            configuration.stream_request_bodies = True
+            async with AsyncApiClient(configuration) as api_client:
+                secrets = await AsyncDefaultApi(api_client).sync_secrets(
+                    SyncSecretsRequest(fqsns=fqsns)
+                )
+        self.assertEqual([s["fqsn"] for s in secrets], fqsns)
+        self.assertEqual(app.requests[0][3]["HTTP_TRANSFER_ENCODING"], "chunked")
+
+
+class TestModels(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        set_default_codec(None)
+
+    def test_to_json_keeps_nullable_rules(self) -> None:
+        for codec in _installed():
+            set_default_codec(codec)
+            with self.subTest(codec=codec.name):
+                organization = ListOrganizations200ResponseOrganizationsInner.from_json(
+                    '{"id": "org-1", "name": "Acme", "slug": "acme"}'
+                )
+                self.assertEqual(json.loads(organization.to_json()), {
+                    "id": "org-1", "name": "Acme", "iconUrl": None, "slug": "acme",
+                })
+
+
+if __name__ == '__main__':
+    unittest.main()
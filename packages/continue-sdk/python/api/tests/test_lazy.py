@@ -0,0 +1,130 @@
+import copy
+import json
+import pickle
+import unittest
+
+from pydantic import ValidationError
+
+from openapi_client import ApiClient, Configuration, DefaultApi
+from openapi_client.inprocess import WSGITransport
+from openapi_client.models import (
+    GetAssistant200Response, GetFreeTrialStatus200Response, GetPolicy200Response,
+    ListAssistants200ResponseInner, ListOrganizations200Response,
+)
+
+from tests.hub import HubApp, make_assistant
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+JSON = "application/json; charset=utf-8"
+RESPONSE_TYPE = "List[ListAssistants200ResponseInner]"
+
+
+@unittest.skipIf(msgspec is None, "msgspec is not installed")
+class TestLazyModels(unittest.TestCase):
+
+    def setUp(self) -> None:
+        configuration = Configuration()
+        configuration.lazy_models = True
+        self.api_client = ApiClient(configuration)
+        self.payload = [make_assistant(i) for i in range(4)]
+        del self.payload[1]["rawYaml"]
+        self.payload[2]["configResult"]["config"] = None
+        self.payload.append(None)
+
+    def deserialize(self, payload=None):
+        body = json.dumps(self.payload if payload is None else payload).encode("utf-8")
+        return self.api_client.deserialize(body, RESPONSE_TYPE, JSON)
+
+    def test_heavy_fields_are_decoded_on_first_read(self) -> None:
+        result = self.deserialize()
+        first = result[0]
+        self.assertIsInstance(first, ListAssistants200ResponseInner)
+        self.assertNotIn("raw_yaml", first.__dict__)
+        self.assertNotIn("config", first.config_result.__dict__)
+        self.assertEqual(first.package_slug, "package-0")
+        self.assertEqual(first.config_result.config["name"], "assistant-0")
+        self.assertIn("config", first.config_result.__dict__)
+        self.assertNotIn("raw_yaml", first.__dict__)
+        self.assertIsNone(result[1].raw_yaml)
+        self.assertIsNone(result[2].config_result.config)
+
+    def test_matches_from_dict(self) -> None:
+        expected = [ListAssistants200ResponseInner.from_dict(item) for item in self.payload]
+        self.assertEqual(self.deserialize(), expected)
+        self.assertEqual(expected, self.deserialize())
+        self.assertEqual(
+            [a and a.to_dict() for a in self.deserialize()],
+            [a and a.to_dict() for a in expected],
+        )
+        self.assertEqual(
+            [a.to_json() for a in self.deserialize()[:4]],
+            [a.to_json() for a in expected[:4]],
+        )
+        self.assertEqual(
+            self.deserialize()[0].model_fields_set, expected[0].model_fields_set
+        )
+
+    def test_copies_and_assignment(self) -> None:
+        expected = ListAssistants200ResponseInner.from_dict(self.payload[0])
+        self.assertEqual(copy.deepcopy(self.deserialize()[0]), expected)
+        self.assertEqual(pickle.loads(pickle.dumps(self.deserialize()[0])), expected)
+        assistant = self.deserialize()[0]
+        assistant.owner_slug = "someone-else"
+        self.assertEqual(assistant.raw_yaml, expected.raw_yaml)
+        self.assertEqual(assistant.config_result.config, expected.config_result.config)
+
+    def test_invalid_heavy_fields_raise_when_read(self) -> None:
+        payload = [make_assistant(0)]
+        payload[0]["configResult"]["config"] = ["not", "an", "object"]
+        assistant = self.deserialize(payload)[0]
+        self.assertEqual(assistant.owner_slug, "owner-0")
+        with self.assertRaises(ValidationError):
+            assistant.config_result.config
+
+    def test_other_invalid_payloads_raise_as_before(self) -> None:
+        payloads = (
+            {"not": "a list"},
+            [{"configResult": 1}],
+            [dict(make_assistant(0), ownerSlug=1)],
+        )
+        for payload in payloads:
+            with self.subTest(payload=payload):
+                with self.assertRaises(ValidationError):
+                    self.deserialize(payload)
+
+    def test_list_assistants(self) -> None:
+        configuration = Configuration(host="http://hub.test", access_token="token")
+        configuration.transport = WSGITransport(HubApp(assistants=3))
+        configuration.lazy_models = True
+        api = DefaultApi(ApiClient(configuration))
+        assistants = api.list_assistants()
+        self.assertEqual(
+            [a.package_slug for a in assistants], ["package-0", "package-1", "package-2"]
+        )
+        self.assertEqual(assistants[2].config_result.config["name"], "assistant-2")
+
+    def test_other_operations_return_models(self) -> None:
+        configuration = Configuration(host="http://hub.test", access_token="token")
+        configuration.transport = WSGITransport(HubApp(assistants=3))
+        configuration.lazy_models = True
+        api = DefaultApi(ApiClient(configuration))
+        self.assertIsInstance(api.get_policy(), GetPolicy200Response)
+        self.assertIsInstance(api.list_organizations(), ListOrganizations200Response)
+        self.assertIsInstance(api.get_free_trial_status(), GetFreeTrialStatus200Response)
+        self.assertIsInstance(api.get_assistant("owner-1", "package-1"), GetAssistant200Response)
+
+    def test_types_without_heavy_fields_are_validated(self) -> None:
+        body = json.dumps({"policy": "not an object"}).encode("utf-8")
+        with self.assertRaises(ValidationError):
+            self.api_client.deserialize(body, "GetPolicy200Response", JSON)
+        body = json.dumps({"organizations": [{"id": 1}]}).encode("utf-8")
+        with self.assertRaises(ValidationError):
+            self.api_client.deserialize(body, "ListOrganizations200Response", JSON)
+
+
+if __name__ == '__main__':
+    unittest.main()
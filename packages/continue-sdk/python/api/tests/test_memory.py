@@ -0,0 +1,89 @@
+import gc
+import json
+import tracemalloc
+import unittest
+
+from openapi_client import ApiClient, Configuration
+from openapi_client.exceptions import NotFoundException
+from openapi_client.rest import build_response
+
+from tests.hub import make_assistant
+
+RESPONSE_TYPES = {
+    "200": "List[ListAssistants200ResponseInner]",
+    "404": "ListAssistants404Response",
+}
+
+
+def _response(body, status=200, charset="utf-8"):
+    response = build_response(
+        status, [("Content-Type", "application/json; charset=%s" % charset)], body
+    )
+    response.read()
+    return response
+
+
+def _payload(assistants=4, yaml_size=1024 * 1024):
+    """A multi-megabyte list-assistants body made mostly of `rawYaml`."""
+    items = []
+    for i in range(assistants):
+        item = make_assistant(i)
+        item["rawYaml"] = "x" * yaml_size
+        items.append(item)
+    return json.dumps(items).encode("utf-8")
+
+
+def _peak(fn):
+    """Returns ``(result, peak bytes allocated while running fn)``."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = fn()
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class TestResponseMemory(unittest.TestCase):
+
+    def test_json_is_decoded_from_the_body_bytes(self) -> None:
+        body = _payload()
+        response = _response(body)
+        api_client = ApiClient()
+        result, peak = _peak(
+            lambda: api_client.response_deserialize(response, RESPONSE_TYPES)
+        )
+        self.assertEqual(len(result.data), 4)
+        self.assertEqual(len(result.data[0].raw_yaml), 1024 * 1024)
+        # the parsed strings themselves; a decoded copy of the body would
+        # add another len(body)
+        self.assertLess(peak, 1.25 * len(body))
+
+    def test_other_charsets_are_decoded(self) -> None:
+        body = _payload(assistants=1, yaml_size=16)
+        result = ApiClient().response_deserialize(
+            _response(body, charset="latin-1"), RESPONSE_TYPES
+        )
+        self.assertEqual(result.data[0].package_slug, "package-0")
+
+    def test_raw_data_is_opt_in(self) -> None:
+        body = _payload(assistants=1)
+        result = ApiClient().response_deserialize(_response(body), RESPONSE_TYPES)
+        self.assertIsNone(result.raw_data)
+
+        configuration = Configuration()
+        configuration.retain_raw_data = True
+        response = _response(body)
+        result = ApiClient(configuration).response_deserialize(response, RESPONSE_TYPES)
+        self.assertIs(result.raw_data, response.data)
+
+    def test_error_bodies_are_kept_as_text(self) -> None:
+        response = _response(b'{"message": "Assistant not found"}', status=404)
+        with self.assertRaises(NotFoundException) as cm:
+            ApiClient().response_deserialize(response, RESPONSE_TYPES)
+        self.assertEqual(cm.exception.body, '{"message": "Assistant not found"}')
+        self.assertEqual(cm.exception.data.message, "Assistant not found")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,233 @@
+import gc
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+from email.parser import BytesParser
+
+import urllib3
+
+from openapi_client import ApiClient, AsyncApiClient, Configuration
+from openapi_client.multipart import FileData, MultipartEncoder
+from openapi_client.rest import build_response, serialize_body
+from openapi_client.transport import Transport
+
+from tests.hub import serve_hub
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+DATA = bytes(range(256)) * 4096  # 1 MiB
+
+
+def parse(content_type, body):
+    """``{name: (filename, content type, bytes)}`` of a multipart body."""
+    message = BytesParser().parsebytes(
+        b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): (
+            part.get_filename(), part.get_content_type(), part.get_payload(decode=True)
+        )
+        for part in message.get_payload()
+    }
+
+
+class UploadApp:
+    """Accepts `POST /upload` and records the parsed form fields."""
+
+    def __init__(self) -> None:
+        self.uploads = []
+
+    def __call__(self, environ, start_response):
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        body = environ["wsgi.input"].read(length)
+        self.uploads.append((
+            environ.get("HTTP_TRANSFER_ENCODING"),
+            parse(environ["CONTENT_TYPE"], body),
+        ))
+        start_response("204 No Content", [])
+        return [b""]
+
+
+class DrainTransport(Transport):
+    """Hashes request bodies as a socket would send them, chunk by chunk."""
+
+    def __init__(self) -> None:
+        self.digest = None
+        self.largest_chunk = 0
+
+    def request(self, method, url, headers=None, body=None, post_params=None,
+                _request_timeout=None):
+        sha = hashlib.sha256()
+        for chunk in serialize_body(method, headers, body, post_params):
+            sha.update(chunk)
+            self.largest_chunk = max(self.largest_chunk, len(chunk))
+        self.digest = sha.hexdigest()
+        return build_response(204, [], b"")
+
+
+class TestMultipartEncoder(unittest.TestCase):
+
+    def setUp(self) -> None:
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        self.path = os.path.join(folder, "model.bin")
+        with open(self.path, "wb") as f:
+            f.write(DATA)
+
+    def test_same_body_as_urllib3(self) -> None:
+        expected, content_type = urllib3.encode_multipart_formdata([
+            ("name", "assistant"),
+            ("size", 3),
+            ("notes", "é ✓"),
+            ("file", ("model.bin", DATA, "application/octet-stream")),
+            ("empty", ("empty.txt", b"", "text/plain")),
+        ], boundary="b0undary")
+        with open(self.path, "rb") as f:
+            for data in (DATA, FileData(self.path), io.BytesIO(DATA), f):
+                with self.subTest(data=data):
+                    encoder = MultipartEncoder([
+                        ("name", "assistant"),
+                        ("size", 3),
+                        ("notes", "é ✓"),
+                        ("file", ("model.bin", data, "application/octet-stream")),
+                        ("empty", ("empty.txt", b"", "text/plain")),
+                    ], boundary="b0undary", chunk_size=1000)
+                    self.assertEqual(encoder.content_type, content_type)
+                    self.assertEqual(encoder.content_length, len(expected))
+                    self.assertEqual(encoder.to_bytes(), expected)
+                    self.assertEqual(encoder.to_bytes(), expected)  # again, for retries
+
+    def test_files_are_read_in_chunks(self) -> None:
+        encoder = MultipartEncoder([("file", ("model.bin", FileData(self.path)))], chunk_size=4096)
+        self.assertEqual(max(len(chunk) for chunk in encoder), 4096)
+
+    def test_file_objects_start_where_they_were(self) -> None:
+        with open(self.path, "rb") as f:
+            f.seek(1000)
+            encoder = MultipartEncoder([("file", ("model.bin", f))], boundary="b")
+            body = encoder.to_bytes()
+            self.assertEqual(f.tell(), 1000)
+        self.assertEqual(parse(encoder.content_type, body)["file"][2], DATA[1000:])
+        self.assertEqual(len(body), encoder.content_length)
+
+    def test_pipes_have_no_length(self) -> None:
+        read_end, write_end = os.pipe()
+        with os.fdopen(read_end, "rb") as reader:
+            with os.fdopen(write_end, "wb") as writer:
+                writer.write(b"from a pipe")
+            encoder = MultipartEncoder([("file", ("log.txt", reader))])
+            self.assertIsNone(encoder.content_length)
+            self.assertNotIn("Content-Length", encoder.headers())
+            body = encoder.to_bytes()
+        self.assertEqual(parse(encoder.content_type, body)["file"][2], b"from a pipe")
+
+    def test_progress(self) -> None:
+        reports = []
+        encoder = MultipartEncoder(
+            [("file", ("model.bin", FileData(self.path)))],
+            chunk_size=65536, progress=lambda sent, total: reports.append((sent, total)),
+        )
+        encoder.to_bytes()
+        total = encoder.content_length
+        self.assertEqual(reports[-1], (total, total))
+        self.assertEqual([sent for sent, _ in reports], sorted(sent for sent, _ in reports))
+        self.assertGreater(len(reports), len(DATA) // 65536)
+
+    def test_shrinking_file_raises(self) -> None:
+        encoder = MultipartEncoder([("file", ("model.bin", FileData(self.path)))])
+        with open(self.path, "wb") as f:
+            f.write(DATA[:100])
+        with self.assertRaises(ValueError):
+            encoder.to_bytes()
+
+
+class TestMultipartRequests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        self.path = os.path.join(folder, "model.bin")
+        with open(self.path, "wb") as f:
+            f.write(DATA)
+
+    def serialize(self, api_client, path=None):
+        return api_client.param_serialize(
+            "POST", "/upload",
+            header_params={"Content-Type": "multipart/form-data"},
+            post_params=[("name", "assistant")],
+            files={"file": path or self.path},
+        )
+
+    def test_files_are_not_read_when_the_request_is_built(self) -> None:
+        [(_, (filename, data, _))] = ApiClient().files_parameters({"file": self.path})
+        self.assertEqual(filename, "model.bin")
+        self.assertIsInstance(data, FileData)
+        _, _, _, _, post_params = self.serialize(ApiClient())
+        self.assertIsInstance(post_params, MultipartEncoder)
+
+    def test_over_http(self) -> None:
+        app = UploadApp()
+        sent = []
+        with serve_hub(app) as host:
+            configuration = Configuration(host=host)
+            configuration.upload_progress = lambda done, total: sent.append(done)
+            api_client = ApiClient(configuration)
+            response = api_client.call_api(*self.serialize(api_client))
+        self.assertEqual(response.status, 204)
+        transfer_encoding, fields = app.uploads[0]
+        self.assertIsNone(transfer_encoding)  # sent with a Content-Length
+        self.assertEqual(fields["name"], (None, "text/plain", b"assistant"))
+        self.assertEqual(fields["file"], ("model.bin", "application/octet-stream", DATA))
+        self.assertGreater(len(sent), 1)
+
+    def test_memory_does_not_grow_with_the_file(self) -> None:
+        with open(self.path, "wb") as f:
+            f.truncate(64 * 2 ** 20)
+        transport = DrainTransport()
+        configuration = Configuration(host="http://hub.test")
+        configuration.transport = transport
+        api_client = ApiClient(configuration)
+        api_client.call_api(*self.serialize(api_client))
+        gc.collect()
+        tracemalloc.start()
+        try:
+            api_client.call_api(*self.serialize(api_client))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(transport.largest_chunk, configuration.upload_chunk_size)
+        self.assertLess(peak, 2 ** 20)
+
+
+class TestMultipartRequestsAsync(unittest.IsolatedAsyncioTestCase):
+
+    @unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+    async def test_over_http(self) -> None:
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        path = os.path.join(folder, "model.bin")
+        with open(path, "wb") as f:
+            f.write(DATA)
+        app = UploadApp()
+        with serve_hub(app) as host:
+            async with AsyncApiClient(Configuration(host=host)) as api_client:
+                response = await api_client.call_api(*api_client.param_serialize(
+                    "POST", "/upload",
+                    header_params={"Content-Type": "multipart/form-data"},
+                    files={"file": path},
+                ))
+                self.assertEqual(response.status, 204)
+        transfer_encoding, fields = app.uploads[0]
+        self.assertIsNone(transfer_encoding)
+        self.assertEqual(fields["file"], ("model.bin", "application/octet-stream", DATA))
+
+
+if __name__ == '__main__':
+    unittest.main()
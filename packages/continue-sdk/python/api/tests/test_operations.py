@@ -0,0 +1,171 @@
+import ast
+import inspect
+import os
+import unittest
+
+from pydantic import ValidationError
+
+from openapi_client import ApiClient, AsyncDefaultApi, Configuration, DefaultApi
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+from openapi_client.operations import DATA, OPERATIONS, STYLES, api_methods
+from openapi_client.routes import ROUTES
+
+API = os.path.join(os.path.dirname(__file__), "..", "openapi_client", "api")
+
+
+def _expression(source):
+    return ast.dump(ast.parse(source, mode="eval").body)
+
+
+class TestOperations(unittest.TestCase):
+
+    def setUp(self) -> None:
+        configuration = Configuration(host="http://hub.test", access_token="token")
+        self.api_client = ApiClient(configuration)
+
+    def test_requests(self) -> None:
+        body = SyncSecretsRequest(fqsns=[])
+        expected = {
+            "get_assistant": (
+                {"owner_slug": "o", "package_slug": "p", "organization_id": "org"},
+                "GET", "http://hub.test/ide/get-assistant/o/p?organizationId=org", None,
+            ),
+            "get_free_trial_status": ({}, "GET", "http://hub.test/ide/free-trial-status", None),
+            "get_models_add_on_checkout_url": (
+                {"profile_id": "a", "vscode_uri_scheme": "vscode"},
+                "GET",
+                "http://hub.test/ide/get-models-add-on-checkout-url"
+                "?profile_id=a&vscode_uri_scheme=vscode",
+                None,
+            ),
+            "get_policy": ({}, "GET", "http://hub.test/ide/policy", None),
+            "list_assistant_full_slugs": (
+                {}, "GET", "http://hub.test/ide/list-assistant-full-slugs", None,
+            ),
+            "list_assistants": (
+                {"always_use_proxy": "true"},
+                "GET", "http://hub.test/ide/list-assistants?alwaysUseProxy=true", None,
+            ),
+            "list_organizations": ({}, "GET", "http://hub.test/ide/list-organizations", None),
+            "sync_secrets": (
+                {"sync_secrets_request": body},
+                "POST", "http://hub.test/ide/sync-secrets", {"fqsns": []},
+            ),
+        }
+        self.assertEqual(set(expected), set(OPERATIONS))
+        for operation_id, (kwargs, method, url, sent) in expected.items():
+            with self.subTest(operation_id=operation_id):
+                serialized = OPERATIONS[operation_id].serialize(self.api_client, **kwargs)
+                self.assertEqual(serialized[:2], (method, url))
+                headers = serialized[2]
+                self.assertEqual(headers["Accept"], "application/json")
+                self.assertEqual(headers["Authorization"], "Bearer token")
+                if sent is None:
+                    self.assertIsNone(serialized[3])
+                    self.assertNotIn("Content-Type", headers)
+                else:
+                    self.assertEqual(self.api_client.json_codec.loads(serialized[3].data), sent)
+                    self.assertEqual(headers["Content-Type"], "application/json")
+                serialize = getattr(DefaultApi(self.api_client), "_%s_serialize" % operation_id)
+                self.assertEqual(serialize(**kwargs)[:3], serialized[:3])
+
+    def test_caller_headers(self) -> None:
+        method, url, headers, _, _ = OPERATIONS["sync_secrets"].serialize(
+            self.api_client, sync_secrets_request=SyncSecretsRequest(fqsns=[]),
+            _headers={"Accept": "text/plain", "X-Trace": "1"},
+            _content_type="application/merge+json",
+        )
+        self.assertEqual(headers["Accept"], "text/plain")
+        self.assertEqual(headers["X-Trace"], "1")
+        self.assertEqual(headers["Content-Type"], "application/merge+json")
+
+    def test_validation(self) -> None:
+        api = DefaultApi(self.api_client)
+        for style in STYLES:
+            method = getattr(api, "get_assistant" + style)
+            with self.subTest(style=style):
+                with self.assertRaises(ValidationError):
+                    method(owner_slug=1, package_slug="p")
+                with self.assertRaises(ValidationError):
+                    method("o")
+                with self.assertRaises(ValidationError):
+                    method("o", "p", _host_index=1)
+        with self.assertRaises(TypeError):
+            OPERATIONS["get_policy"].arguments(organization_id="org")
+
+    def test_signatures(self) -> None:
+        for operation in OPERATIONS.values():
+            for style in STYLES:
+                name = operation.operation_id + style
+                with self.subTest(name=name):
+                    sync = inspect.signature(getattr(DefaultApi, name))
+                    self.assertEqual(
+                        list(sync.parameters)[1:], list(operation.signature(style).parameters)
+                    )
+                    self.assertEqual(sync, inspect.signature(getattr(AsyncDefaultApi, name)))
+                    self.assertTrue(inspect.iscoroutinefunction(getattr(AsyncDefaultApi, name)))
+                    self.assertEqual(getattr(DefaultApi, name).__doc__, operation.docstring)
+
+    def test_stubs_match(self) -> None:
+        stubs = (("default_api.pyi", DefaultApi), ("async_default_api.pyi", AsyncDefaultApi))
+        for module, cls in stubs:
+            with open(os.path.join(API, module)) as f:
+                tree = ast.parse(f.read())
+            stub = next(node for node in tree.body if isinstance(node, ast.ClassDef))
+            stubbed = {
+                node.name: node for node in stub.body
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+                and node.name != "__init__"
+            }
+            expected = {op.operation_id + style for op in OPERATIONS.values() for style in STYLES}
+            expected |= {"_%s_serialize" % op for op in OPERATIONS}
+            self.assertEqual(set(stubbed), expected)
+            for operation in OPERATIONS.values():
+                for style in STYLES:
+                    node = stubbed[operation.operation_id + style]
+                    with self.subTest(module=module, name=node.name):
+                        signature = operation.signature(style)
+                        args = node.args.args[1:]
+                        self.assertEqual([a.arg for a in args], list(signature.parameters))
+                        self.assertEqual(
+                            [ast.dump(a.annotation) for a in args],
+                            [_expression(p.annotation) for p in signature.parameters.values()],
+                        )
+                        self.assertEqual(
+                            ast.dump(node.returns), _expression(signature.return_annotation)
+                        )
+                        self.assertEqual(
+                            len(node.args.defaults),
+                            sum(p.default is not p.empty for p in signature.parameters.values()),
+                        )
+                        self.assertEqual(
+                            isinstance(node, ast.AsyncFunctionDef), cls is AsyncDefaultApi
+                        )
+
+    def test_routes(self) -> None:
+        self.assertEqual(
+            ROUTES, [(op.operation_id, op.method, op.path) for op in OPERATIONS.values()]
+        )
+
+    def test_methods_defined_by_the_class_are_kept(self) -> None:
+        @api_methods()
+        class CustomApi:
+            def __init__(self, api_client) -> None:
+                self.api_client = api_client
+
+            def get_policy(self):
+                return "custom"
+
+        api = CustomApi(self.api_client)
+        self.assertEqual(api.get_policy(), "custom")
+        self.assertTrue(callable(api.get_policy_with_http_info))
+        self.assertEqual(
+            CustomApi.list_assistants.__qualname__, CustomApi.__qualname__ + ".list_assistants"
+        )
+        self.assertEqual(
+            OPERATIONS["get_policy"].signature(DATA).return_annotation, "GetPolicy200Response"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
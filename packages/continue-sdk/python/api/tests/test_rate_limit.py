@@ -0,0 +1,168 @@
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+
+from openapi_client import AsyncApiClient, AsyncDefaultApi
+from openapi_client.exceptions import RateLimitExceededException, TooManyRequestsException
+from openapi_client.rate_limit import (
+    FAIL_FAST, MemoryBackend, RateLimit, RateLimiter, SharedMemoryBackend,
+)
+
+from tests.hub import FakeClock, HubApp, hub_configuration, make_api
+
+
+def _limiter(limits, clock, **kwargs):
+    return RateLimiter(limits, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def _take_all(path, attempts, results):
+    backend = SharedMemoryBackend(path)
+    limit = RateLimit(1e-6, burst=5)
+    granted = sum(
+        backend.take("key", limit, time.monotonic(), 0.0)[0] for _ in range(attempts)
+    )
+    results.put(granted)
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_blocks_until_a_token_is_available(self) -> None:
+        clock = FakeClock()
+        app = HubApp()
+        limiter = _limiter({"/ide/list-assistants": RateLimit(1, burst=2)}, clock)
+        api = make_api(app, rate_limiter=limiter)
+        for _ in range(4):
+            api.list_assistants()
+        self.assertEqual(clock.sleeps, [1.0, 1.0])
+        self.assertEqual(len(app.requests), 4)
+
+    def test_limits_are_per_resource_path(self) -> None:
+        clock = FakeClock()
+        limiter = _limiter({
+            "/ide/get-assistant/{ownerSlug}/{packageSlug}": RateLimit(1, burst=1),
+            "/ide/policy": RateLimit(100, burst=100),
+        }, clock)
+        api = make_api(HubApp(), rate_limiter=limiter)
+        api.get_assistant("owner-0", "package-0")
+        api.get_assistant("owner-1", "package-1")
+        self.assertEqual(clock.sleeps, [1.0])
+        for _ in range(10):
+            api.get_policy()
+        api.list_organizations()
+        self.assertEqual(clock.sleeps, [1.0])
+
+    def test_default_limit(self) -> None:
+        clock = FakeClock()
+        api = make_api(HubApp(), rate_limiter=_limiter({"default": RateLimit(2, burst=1)}, clock))
+        api.list_organizations()
+        api.get_policy()
+        self.assertEqual(clock.sleeps, [])
+        api.get_policy()
+        self.assertEqual(clock.sleeps, [0.5])
+
+    def test_buckets_are_per_token(self) -> None:
+        clock = FakeClock()
+        limiter = _limiter({"default": RateLimit(1, burst=1)}, clock)
+        app = HubApp()
+        make_api(app, "alice", rate_limiter=limiter).get_policy()
+        make_api(app, "bob", rate_limiter=limiter).get_policy()
+        self.assertEqual(clock.sleeps, [])
+        limiter.per_token = False
+        make_api(app, "carol", rate_limiter=limiter).get_policy()
+        make_api(app, "dave", rate_limiter=limiter).get_policy()
+        self.assertEqual(clock.sleeps, [1.0])
+
+    def test_fail_fast(self) -> None:
+        clock = FakeClock()
+        app = HubApp()
+        limiter = _limiter({"default": RateLimit(0.5, burst=1)}, clock, mode=FAIL_FAST)
+        api = make_api(app, rate_limiter=limiter)
+        api.get_policy()
+        with self.assertRaises(TooManyRequestsException) as cm:
+            api.get_policy()
+        self.assertIsInstance(cm.exception, RateLimitExceededException)
+        self.assertEqual(cm.exception.retry_after, 2.0)
+        self.assertEqual(len(app.requests), 1)
+        clock.now += 2
+        api.get_policy()
+        self.assertEqual(len(app.requests), 2)
+
+    def test_max_wait(self) -> None:
+        clock = FakeClock()
+        limiter = _limiter({"default": RateLimit(1, burst=1)}, clock, max_wait=1.5)
+        # callers sleeping concurrently: the clock does not move
+        limiter.sleep = clock.sleeps.append
+        api = make_api(HubApp(), rate_limiter=limiter)
+        api.get_policy()
+        api.get_policy()
+        with self.assertRaises(RateLimitExceededException):
+            api.get_policy()
+        self.assertEqual(clock.sleeps, [1.0])
+
+    def test_memory_backend_refills_up_to_burst(self) -> None:
+        backend = MemoryBackend()
+        limit = RateLimit(1, burst=3)
+        self.assertEqual(
+            [backend.take("k", limit, 0.0, 0.0)[0] for _ in range(4)],
+            [True, True, True, False],
+        )
+        self.assertEqual(
+            [backend.take("k", limit, 100.0, 0.0)[0] for _ in range(4)],
+            [True, True, True, False],
+        )
+
+
+class TestSharedMemoryBackend(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "buckets")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_backends_on_one_file_share_buckets(self) -> None:
+        first, second = SharedMemoryBackend(self.path), SharedMemoryBackend(self.path, slots=8)
+        self.assertEqual(second.slots, 1024)
+        limit = RateLimit(1, burst=2)
+        self.assertTrue(first.take("a", limit, 10.0, 0.0)[0])
+        self.assertTrue(second.take("a", limit, 10.0, 0.0)[0])
+        self.assertFalse(first.take("a", limit, 10.0, 0.0)[0])
+        self.assertTrue(second.take("b", limit, 10.0, 0.0)[0])
+        first.close()
+        second.close()
+
+    def test_processes_share_one_budget(self) -> None:
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue()
+        workers = [
+            context.Process(target=_take_all, args=(self.path, 5, results))
+            for _ in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        granted = [results.get(timeout=30) for _ in workers]
+        for worker in workers:
+            worker.join(30)
+        self.assertEqual(sum(granted), 5)
+
+
+class TestAsyncRateLimiter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_awaits_tokens(self) -> None:
+        app = HubApp()
+        limiter = RateLimiter({"default": RateLimit(50, burst=1)})
+        async with AsyncApiClient(hub_configuration(app, rate_limiter=limiter)) as api_client:
+            api = AsyncDefaultApi(api_client)
+            started = time.monotonic()
+            for _ in range(4):
+                await api.get_policy()
+            elapsed = time.monotonic() - started
+        self.assertGreaterEqual(elapsed, 0.05)
+        self.assertEqual(len(app.requests), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import unittest
+
+from openapi_client import ApiClient, AsyncApiClient, Configuration, DefaultApi
+from openapi_client.inprocess import WSGITransport
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+from openapi_client.operations import BODY, HEADER, OPERATIONS, PATH, QUERY
+
+from tests.hub import HubApp
+
+ARGUMENTS = {
+    "get_assistant": {"owner_slug": "my org", "package_slug": "p/ü", "always_use_proxy": True,
+                      "organization_id": "a&b"},
+    "get_models_add_on_checkout_url": {"profile_id": "a b", "vscode_uri_scheme": "vscode"},
+    "list_assistants": {"always_use_proxy": False, "organization_id": "org"},
+    "sync_secrets": {"sync_secrets_request": SyncSecretsRequest(fqsns=[])},
+}
+
+
+def param_serialize(api_client, operation, values):
+    """The request `ApiClient.param_serialize` makes of a call, as the
+    generated `_serialize` methods built it."""
+    path_params, query_params, header_params, body = {}, [], dict(values["_headers"] or {}), None
+    for param in operation.params:
+        value = values[param.name]
+        if value is None:
+            continue
+        if param.location == PATH:
+            path_params[param.wire_name] = value
+        elif param.location == QUERY:
+            query_params.append((param.wire_name, value))
+        elif param.location == HEADER:
+            header_params[param.wire_name] = value
+        elif param.location == BODY:
+            body = value
+    if 'Accept' not in header_params:
+        header_params['Accept'] = api_client.select_header_accept(operation.accept)
+    if operation.content_types:
+        header_params['Content-Type'] = (
+            values["_content_type"]
+            or api_client.select_header_content_type(operation.content_types)
+        )
+    return api_client.param_serialize(
+        method=operation.method,
+        resource_path=operation.path,
+        path_params=path_params,
+        query_params=query_params,
+        header_params=header_params,
+        body=body,
+        post_params=[],
+        files={},
+        auth_settings=list(operation.auth),
+        collection_formats={},
+        _request_auth=values["_request_auth"],
+    )
+
+
+class TestRequestTemplates(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.configuration = Configuration(host="http://hub.test", access_token="token")
+        self.api_client = ApiClient(self.configuration)
+
+    def assertSameRequests(self, api_client=None, **common) -> None:
+        api_client = api_client or self.api_client
+        for operation_id, operation in OPERATIONS.items():
+            with self.subTest(operation_id=operation_id, **common):
+                values = operation.arguments(**dict(ARGUMENTS.get(operation_id, {}), **common))
+                expected = param_serialize(api_client, operation, values)
+                serialized = operation.template.serialize(api_client, values)
+                self.assertEqual(serialized[:3], expected[:3])
+                self.assertEqual(serialized[4], expected[4])
+                if expected[3] is None:
+                    self.assertIsNone(serialized[3])
+                else:
+                    self.assertEqual(serialized[3].data, expected[3].data)
+
+    def test_same_requests_as_param_serialize(self) -> None:
+        self.assertSameRequests()
+        self.assertSameRequests(
+            _headers={"X-Trace": 1, "Accept": "text/plain", "User-Agent": "caller"}
+        )
+        self.assertSameRequests(_content_type="application/merge+json")
+        self.assertSameRequests(
+            _request_auth={"in": "query", "key": "token", "value": "t", "type": "api_key"}
+        )
+        self.assertSameRequests(AsyncApiClient(self.configuration))
+
+    def test_same_requests_with_client_settings(self) -> None:
+        api_client = ApiClient(self.configuration, "X-Client", "1", cookie="session=1")
+        self.assertSameRequests(api_client)
+        api_client.default_headers["Accept-Encoding"] = "identity"
+        self.assertSameRequests(api_client)
+        self.configuration.compression = False
+        self.configuration.safe_chars_for_path_param = "/ "
+        self.configuration.access_token = None
+        self.assertSameRequests(api_client)
+
+    def test_client_headers_follow_changes(self) -> None:
+        operation = OPERATIONS["get_policy"]
+        headers = operation.serialize(self.api_client)[2]
+        self.assertEqual(headers["User-Agent"], "OpenAPI-Generator/1.0.0/python")
+        self.api_client.user_agent = "agent/2"
+        self.api_client.default_headers["X-Client"] = "1"
+        self.api_client.cookie = "session=1"
+        headers = operation.serialize(self.api_client)[2]
+        self.assertEqual(headers["User-Agent"], "agent/2")
+        self.assertEqual(headers["X-Client"], "1")
+        self.assertEqual(headers["Cookie"], "session=1")
+        self.configuration.compression = False
+        self.assertNotIn("Accept-Encoding", operation.serialize(self.api_client)[2])
+
+    def test_auth_follows_token(self) -> None:
+        operation = OPERATIONS["get_policy"]
+
+        def authorization():
+            return operation.serialize(self.api_client)[2].get("Authorization")
+
+        self.assertEqual(authorization(), "Bearer token")
+        self.configuration.access_token = "rotated"
+        self.assertEqual(authorization(), "Bearer rotated")
+        self.configuration.access_token = None
+        self.assertIsNone(authorization())
+        self.api_client.configuration = Configuration(
+            host="http://other.test", access_token="other"
+        )
+        method, url, headers, _, _ = operation.serialize(self.api_client)
+        self.assertEqual(url, "http://other.test/ide/policy")
+        self.assertEqual(headers["Authorization"], "Bearer other")
+
+    def test_caller_headers_are_not_modified(self) -> None:
+        headers = {"X-Trace": "1"}
+        OPERATIONS["get_policy"].serialize(self.api_client, _headers=headers)
+        self.assertEqual(headers, {"X-Trace": "1"})
+
+    def test_calls(self) -> None:
+        app = HubApp(assistants=2)
+        self.configuration.transport = WSGITransport(app)
+        api = DefaultApi(ApiClient(self.configuration))
+        api.get_assistant("owner-1", "package-1")
+        self.configuration.access_token = "rotated"
+        api.get_policy()
+        self.assertEqual(app.requests[0][1], "/ide/get-assistant/owner-1/package-1")
+        self.assertEqual(
+            [request[3]["HTTP_AUTHORIZATION"] for request in app.requests],
+            ["Bearer token", "Bearer rotated"],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+import email.utils
+import unittest
+
+from openapi_client import ApiClient, AsyncApiClient, AsyncDefaultApi, Configuration, DefaultApi
+from openapi_client.exceptions import ServiceException, TooManyRequestsException
+from openapi_client.inprocess import WSGITransport
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+from openapi_client.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+from tests.hub import HubApp, hub_configuration, make_api, serve_hub
+
+
+class FlakyTransport(WSGITransport):
+    """Raises `error` on the first `failures` requests."""
+
+    def __init__(self, app, error, failures=1) -> None:
+        super().__init__(app)
+        self.error = error
+        self.failures = failures
+
+    def request(self, *args, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise self.error
+        return super().request(*args, **kwargs)
+
+
+def _policy(**kwargs):
+    events = {"retry": [], "give_up": [], "sleep": []}
+    kwargs.setdefault("base_delay", 0.01)
+    policy = RetryPolicy(
+        on_retry=events["retry"].append,
+        on_give_up=events["give_up"].append,
+        sleep=events["sleep"].append,
+        **kwargs
+    )
+    return policy, events
+
+
+class TestRetryAfter(unittest.TestCase):
+
+    def test_parse(self) -> None:
+        self.assertEqual(parse_retry_after("7"), 7.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        date = email.utils.formatdate(1_000_030, usegmt=True)
+        self.assertEqual(parse_retry_after(date, now=1_000_000), 30.0)
+
+    def test_exception_carries_retry_after(self) -> None:
+        app = HubApp()
+        app.inject(429, retry_after=12)
+        with self.assertRaises(TooManyRequestsException) as cm:
+            make_api(app).get_policy()
+        self.assertEqual(cm.exception.retry_after, 12.0)
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_retries_with_decorrelated_jitter(self) -> None:
+        app = HubApp()
+        app.inject(503, times=2)
+        policy, events = _policy(max_attempts=3, max_delay=1.0)
+        self.assertEqual(make_api(app, retry_policy=policy).get_policy().org_slug, "acme")
+        self.assertEqual(len(app.requests), 3)
+        self.assertEqual([e.status for e in events["retry"]], [503, 503])
+        self.assertEqual([e.attempt for e in events["retry"]], [1, 2])
+        first, second = events["sleep"]
+        self.assertTrue(0.01 <= first <= 0.03)
+        self.assertTrue(0.01 <= second <= min(first * 3, 1.0))
+
+    def test_gives_up_after_max_attempts(self) -> None:
+        app = HubApp()
+        app.inject(503, times=5)
+        policy, events = _policy(max_attempts=2)
+        with self.assertRaises(ServiceException):
+            make_api(app, retry_policy=policy).get_policy()
+        self.assertEqual(len(app.requests), 2)
+        self.assertEqual(events["give_up"][0].reason, "attempts exhausted")
+
+    def test_honours_retry_after(self) -> None:
+        app = HubApp()
+        app.inject(429, retry_after=2)
+        policy, events = _policy()
+        make_api(app, retry_policy=policy).get_policy()
+        self.assertEqual(events["sleep"], [2.0])
+        self.assertEqual(events["retry"][0].retry_after, 2.0)
+
+    def test_gives_up_when_retry_after_is_too_long(self) -> None:
+        app = HubApp()
+        app.inject(429, retry_after=120)
+        policy, events = _policy(max_retry_after=30)
+        with self.assertRaises(TooManyRequestsException) as cm:
+            make_api(app, retry_policy=policy).get_policy()
+        self.assertEqual(cm.exception.retry_after, 120.0)
+        self.assertEqual(len(app.requests), 1)
+        self.assertEqual(events["sleep"], [])
+
+    def test_non_idempotent_methods_are_not_retried(self) -> None:
+        app = HubApp()
+        app.inject(503)
+        policy, events = _policy()
+        with self.assertRaises(ServiceException):
+            make_api(app, retry_policy=policy).sync_secrets(
+                SyncSecretsRequest(fqsns=[{"secretName": "a"}])
+            )
+        self.assertEqual(len(app.requests), 1)
+        self.assertEqual(events["give_up"][0].reason, "method not retried")
+
+    def test_per_operation_policies(self) -> None:
+        app = HubApp()
+        policy, _ = _policy()
+        api = make_api(app, retry_policy={"default": policy, "list_assistant_full_slugs": None})
+        with self.assertRaises(TooManyRequestsException):
+            api.list_assistant_full_slugs()
+        self.assertEqual(len(app.requests), 1)
+        app.inject(503)
+        api.get_policy()
+        self.assertEqual(len(app.requests), 3)
+
+    def test_budget_stops_retry_storms(self) -> None:
+        app = HubApp()
+        app.inject(429, times=100)
+        budget = RetryBudget(max_tokens=4, token_ratio=1)
+        policy, events = _policy(max_attempts=10, budget=budget)
+        api = make_api(app, retry_policy=policy)
+        for _ in range(2):
+            with self.assertRaises(TooManyRequestsException):
+                api.get_policy()
+        # 4 -> 3 tokens allows one retry, 3 -> 2 and 2 -> 1 do not
+        self.assertEqual(len(app.requests), 3)
+        self.assertEqual(events["give_up"][-1].reason, "retry budget exhausted")
+        app.faults.clear()
+        for _ in range(3):
+            api.get_policy()
+        self.assertEqual(budget.tokens, 4)
+
+    def test_connection_errors_are_retried(self) -> None:
+        app = HubApp()
+        transport = FlakyTransport(app, ConnectionResetError("reset"))
+        policy, events = _policy()
+        api = make_api(app, transport=transport, retry_policy=policy)
+        self.assertEqual(api.get_policy().org_slug, "acme")
+        self.assertIsInstance(events["retry"][0].error, ConnectionResetError)
+
+    def test_other_errors_are_raised(self) -> None:
+        app = HubApp()
+        transport = FlakyTransport(app, ValueError("bug"))
+        policy, events = _policy()
+        with self.assertRaises(ValueError):
+            make_api(app, transport=transport, retry_policy=policy).get_policy()
+        self.assertEqual(events["retry"], [])
+
+    def test_local_server(self) -> None:
+        app = HubApp()
+        app.inject(503, retry_after=0)
+        app.inject(429, retry_after=0)
+        policy, _ = _policy()
+        with serve_hub(app) as host:
+            configuration = Configuration(host=host, access_token="token")
+            configuration.retry_policy = policy
+            api_client = ApiClient(configuration)
+            try:
+                self.assertEqual(len(DefaultApi(api_client).list_assistants()), 3)
+            finally:
+                api_client.close()
+        self.assertEqual(len(app.requests), 3)
+
+
+class TestAsyncRetryPolicy(unittest.IsolatedAsyncioTestCase):
+
+    async def test_retries(self) -> None:
+        app = HubApp()
+        app.inject(429, retry_after=0)
+        app.inject(503)
+        policy, events = _policy()
+        async with AsyncApiClient(hub_configuration(app, retry_policy=policy)) as api_client:
+            policy_response = await AsyncDefaultApi(api_client).get_policy()
+        self.assertEqual(policy_response.org_slug, "acme")
+        self.assertEqual([e.status for e in events["retry"]], [429, 503])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from openapi_client import AsyncApiClient, AsyncDefaultApi
+from openapi_client.exceptions import ServiceException
+from openapi_client.session import bootstrap_session, bootstrap_session_async
+
+from tests.hub import HubApp, hub_configuration, make_api
+
+
+class TestBootstrapSession(unittest.TestCase):
+
+    def test_calls_run_concurrently(self) -> None:
+        app = HubApp(latency=0.2)
+        session = bootstrap_session(make_api(app), organization_id="org-1")
+        self.assertTrue(session.ok)
+        self.assertEqual(session.policy.org_slug, "acme")
+        self.assertEqual(session.organizations.organizations[0].slug, "acme")
+        self.assertEqual(session.free_trial_status.chat_limit, 50)
+        self.assertEqual(len(session.assistants), 3)
+        self.assertEqual(
+            sorted(session.timings),
+            ["get_free_trial_status", "get_policy", "list_assistants",
+             "list_organizations", "total"],
+        )
+        self.assertGreaterEqual(session.timings["get_policy"], 0.2)
+        self.assertLess(session.timings["total"], 0.6)
+        queries = [q for method, path, q, _ in app.requests if path == "/ide/list-assistants"]
+        self.assertEqual(queries, ["organizationId=org-1"])
+
+    def test_first_error_is_raised(self) -> None:
+        app = HubApp()
+        app.inject(503)
+        with self.assertRaises(ServiceException):
+            bootstrap_session(make_api(app))
+        self.assertEqual(len(app.requests), 4)
+
+    def test_return_exceptions(self) -> None:
+        app = HubApp()
+        app.inject(503)
+        session = bootstrap_session(make_api(app), return_exceptions=True)
+        self.assertFalse(session.ok)
+        self.assertEqual(len(session.errors), 1)
+        (operation_id, error), = session.errors.items()
+        self.assertIsInstance(error, ServiceException)
+        fields = [session.policy, session.organizations,
+                  session.free_trial_status, session.assistants]
+        self.assertEqual(sum(field is None for field in fields), 1)
+
+
+class TestBootstrapSessionAsync(unittest.IsolatedAsyncioTestCase):
+
+    async def test_calls_run_concurrently(self) -> None:
+        app = HubApp(latency=0.2)
+        async with AsyncApiClient(hub_configuration(app)) as api_client:
+            session = await bootstrap_session_async(AsyncDefaultApi(api_client))
+        self.assertTrue(session.ok)
+        self.assertEqual(len(session.assistants), 3)
+        self.assertLess(session.timings["total"], 0.6)
+
+
+if __name__ == '__main__':
+    unittest.main()
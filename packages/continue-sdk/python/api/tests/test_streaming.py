@@ -0,0 +1,182 @@
+import gc
+import io
+import json
+import tracemalloc
+import unittest
+
+from openapi_client import ApiClient, AsyncApiClient, AsyncDefaultApi, Configuration, DefaultApi
+from openapi_client.exceptions import NotFoundException
+from openapi_client.inprocess import AsyncASGITransport, WSGITransport
+from openapi_client.rest import build_response
+from openapi_client.streaming import JSONArraySplitter, iter_assistants, iter_assistants_async
+from openapi_client.transport import Transport
+
+from tests.hub import HubApp, as_asgi, make_assistant, serve_hub
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+def _split(data, size):
+    splitter = JSONArraySplitter()
+    elements = []
+    for start in range(0, len(data), size):
+        elements.extend(splitter.feed(data[start:start + size]))
+    splitter.close()
+    return [json.loads(element) for element in elements]
+
+
+class Trickle(io.RawIOBase):
+    """A response body served `size` bytes per read, counting what was read."""
+
+    def __init__(self, data, size) -> None:
+        self.data = data
+        self.size = size
+        self.sent = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        chunk = self.data[self.sent:self.sent + min(self.size, len(b))]
+        b[:len(chunk)] = chunk
+        self.sent += len(chunk)
+        return len(chunk)
+
+
+class TrickleTransport(Transport):
+
+    def __init__(self, data, size) -> None:
+        self.body = Trickle(data, size)
+
+    def request(self, method, url, headers=None, body=None, post_params=None,
+                _request_timeout=None):
+        return build_response(
+            200, [("Content-Type", "application/json; charset=utf-8")], self.body
+        )
+
+
+class TestJSONArraySplitter(unittest.TestCase):
+
+    def test_any_chunking(self) -> None:
+        documents = [
+            [],
+            [1, -2.5e3, True, None, "a,]}\"[{\\", [[]], {"x": [1, {"y": "é"}]}],
+            [make_assistant(i) for i in range(5)],
+        ]
+        for document in documents:
+            for indent in (None, 2):
+                data = (" \n" + json.dumps(document, indent=indent) + "\n").encode("utf-8")
+                for size in (1, 3, 64, len(data)):
+                    with self.subTest(document=document, indent=indent, size=size):
+                        self.assertEqual(_split(data, size), document)
+
+    def test_malformed_arrays(self) -> None:
+        for data in (b'{"a": 1}', b'"[1]"', b'[1,,2]', b'[1,]', b'[,1]',
+                     b'[{} {}]', b'[1', b'[1] x'):
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    _split(data, 4)
+
+    def test_buffer_holds_one_element(self) -> None:
+        splitter = JSONArraySplitter()
+        item = json.dumps(make_assistant(0)).encode("utf-8")
+        splitter.feed(b"[" + item)
+        for _ in range(100):
+            splitter.feed(b"," + item)
+            self.assertLessEqual(len(splitter._buffer), len(item) + 1)
+
+
+class TestIterAssistants(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.configuration = Configuration(host="http://hub.test", access_token="token")
+
+    def api(self, transport):
+        self.configuration.transport = transport
+        return DefaultApi(ApiClient(self.configuration))
+
+    def test_same_assistants_as_list_assistants(self) -> None:
+        app = HubApp(assistants=20)
+        api = self.api(WSGITransport(app))
+        self.assertEqual(
+            list(iter_assistants(api, organization_id="org-1", chunk_size=100)),
+            api.list_assistants(organization_id="org-1"),
+        )
+        self.assertEqual(app.requests[0][2], "organizationId=org-1")
+
+    def test_yields_before_the_body_is_read(self) -> None:
+        data = json.dumps([make_assistant(i) for i in range(50)]).encode("utf-8")
+        transport = TrickleTransport(data, 1024)
+        assistants = iter_assistants(self.api(transport), chunk_size=1024)
+        self.assertEqual(next(assistants).package_slug, "package-0")
+        self.assertLess(transport.body.sent, len(data) / 10)
+        self.assertEqual(len(list(assistants)), 49)
+        self.assertEqual(transport.body.sent, len(data))
+
+    def test_stopping_early_closes_the_body(self) -> None:
+        data = json.dumps([make_assistant(i) for i in range(50)]).encode("utf-8")
+        transport = TrickleTransport(data, 1024)
+        assistants = iter_assistants(self.api(transport), chunk_size=1024)
+        next(assistants)
+        assistants.close()
+        self.assertTrue(transport.body.closed)
+
+    def test_memory_does_not_grow_with_the_list(self) -> None:
+        peaks = []
+        for size in (500, 5000):
+            data = json.dumps([make_assistant(i) for i in range(size)]).encode("utf-8")
+            api = self.api(TrickleTransport(data, 65536))
+            list(iter_assistants(api))  # plans and pools
+            api = self.api(TrickleTransport(data, 65536))
+            gc.collect()
+            tracemalloc.start()
+            try:
+                count = sum(1 for _ in iter_assistants(api))
+                peaks.append(tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+            self.assertEqual(count, size)
+        self.assertLess(peaks[1], 1.5 * peaks[0])
+        self.assertLess(peaks[1], len(data) / 4)
+
+    def test_errors_raise_as_in_list_assistants(self) -> None:
+        app = HubApp()
+        app.inject(404)
+        with self.assertRaises(NotFoundException):
+            next(iter_assistants(self.api(WSGITransport(app))))
+
+    def test_over_http(self) -> None:
+        with serve_hub(HubApp(assistants=30)) as host:
+            configuration = Configuration(host=host, access_token="token")
+            api = DefaultApi(ApiClient(configuration))
+            assistants = list(iter_assistants(api, chunk_size=512))
+        self.assertEqual([a.package_slug for a in assistants],
+                         ["package-%d" % i for i in range(30)])
+
+
+class TestIterAssistantsAsync(unittest.IsolatedAsyncioTestCase):
+
+    async def test_in_process(self) -> None:
+        configuration = Configuration(host="http://hub.test", access_token="token")
+        configuration.async_transport = AsyncASGITransport(as_asgi(HubApp(assistants=10)))
+        async with AsyncApiClient(configuration) as api_client:
+            api = AsyncDefaultApi(api_client)
+            assistants = [a async for a in iter_assistants_async(api, chunk_size=100)]
+            self.assertEqual(assistants, await api.list_assistants())
+
+    @unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+    async def test_over_http(self) -> None:
+        with serve_hub(HubApp(assistants=30)) as host:
+            configuration = Configuration(host=host, access_token="token")
+            async with AsyncApiClient(configuration) as api_client:
+                api = AsyncDefaultApi(api_client)
+                assistants = [a async for a in iter_assistants_async(api, chunk_size=512)]
+        self.assertEqual([a.package_slug for a in assistants],
+                         ["package-%d" % i for i in range(30)])
+
+
+if __name__ == '__main__':
+    unittest.main()
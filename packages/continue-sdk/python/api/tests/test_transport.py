@@ -0,0 +1,162 @@
+import unittest
+
+from openapi_client import ApiClient, AsyncApiClient, AsyncDefaultApi, Configuration, DefaultApi
+from openapi_client.exceptions import ApiTypeError, ApiValueError, NotFoundException
+from openapi_client.inprocess import ASGITransport, AsyncASGITransport, WSGITransport
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+from openapi_client.rest import RESTClientObject
+from openapi_client.transport import (
+    StreamingBody, Transport, create_transport, register_transport, TRANSPORTS,
+)
+
+from tests.hub import HubApp, as_asgi, serve_hub
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+def _configuration(transport=None, host="http://hub.test"):
+    configuration = Configuration(host=host, access_token="token")
+    configuration.transport = transport
+    return configuration
+
+
+class TestTransportSelection(unittest.TestCase):
+
+    def test_default_is_urllib3(self) -> None:
+        self.assertIsInstance(create_transport(_configuration()), RESTClientObject)
+        self.assertIsInstance(create_transport(_configuration("urllib3")), RESTClientObject)
+
+    def test_unknown_name(self) -> None:
+        with self.assertRaises(ApiValueError):
+            create_transport(_configuration("carrier-pigeon"))
+
+    def test_factory_must_return_transport(self) -> None:
+        with self.assertRaises(ApiTypeError):
+            create_transport(_configuration(lambda configuration: object()))
+
+    def test_registered_factory(self) -> None:
+        transport = WSGITransport(HubApp())
+        register_transport("hub", lambda configuration: transport)
+        try:
+            self.assertIs(create_transport(_configuration("hub")), transport)
+        finally:
+            del TRANSPORTS["hub"]
+
+    def test_streaming_bodies_must_iterate(self) -> None:
+        class Incomplete(StreamingBody):
+            content_length = 0
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+        class Chunks(StreamingBody):
+            def __iter__(self):
+                yield from (b"a", b"b")
+
+        self.assertEqual(Chunks().to_bytes(), b"ab")
+
+    def test_configuration_copy_shares_transport(self) -> None:
+        import copy
+        transport = WSGITransport(HubApp())
+        configuration = copy.deepcopy(_configuration(transport))
+        self.assertIs(configuration.transport, transport)
+
+
+class TestInProcessTransports(unittest.TestCase):
+
+    def _exercise(self, transport: Transport) -> None:
+        api = DefaultApi(ApiClient(_configuration(transport)))
+        assistants = api.list_assistants(organization_id="org 1")
+        self.assertEqual(len(assistants), 3)
+        self.assertEqual(api.get_assistant("owner-1", "package-1").package_slug, "package-1")
+        with self.assertRaises(NotFoundException):
+            api.get_assistant("owner-1", "missing")
+        raw = api.sync_secrets_without_preload_content(
+            SyncSecretsRequest(fqsns=[{"secretName": "a"}])
+        )
+        self.assertEqual(raw.status, 200)
+        self.assertIn(b'"fqsn"', raw.read())
+
+    def test_wsgi(self) -> None:
+        app = HubApp()
+        self._exercise(WSGITransport(app))
+        method, path, query, environ = app.requests[0]
+        self.assertEqual(
+            (method, path, query), ("GET", "/ide/list-assistants", "organizationId=org%201")
+        )
+        self.assertEqual(environ["HTTP_AUTHORIZATION"], "Bearer token")
+
+    def test_asgi(self) -> None:
+        transport = ASGITransport(as_asgi(HubApp()))
+        try:
+            self._exercise(transport)
+        finally:
+            transport.close()
+
+
+class TestAsyncInProcessTransport(unittest.IsolatedAsyncioTestCase):
+
+    async def test_asgi(self) -> None:
+        configuration = _configuration()
+        configuration.async_transport = AsyncASGITransport(as_asgi(HubApp()))
+        async with AsyncApiClient(configuration) as api_client:
+            api = AsyncDefaultApi(api_client)
+            self.assertEqual(len(await api.list_assistants()), 3)
+            policy = await api.get_policy_with_http_info()
+            self.assertEqual(policy.data.org_slug, "acme")
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestHTTP2Transport(unittest.TestCase):
+
+    def test_round_trip(self) -> None:
+        with serve_hub() as host:
+            api_client = ApiClient(_configuration("http2", host=host))
+            try:
+                api = DefaultApi(api_client)
+                self.assertEqual(len(api.list_assistants()), 3)
+                response = api.list_organizations_without_preload_content()
+                self.assertIn(b"acme", response.read())
+            finally:
+                api_client.close()
+
+    def test_stream_limit_and_metrics(self) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with serve_hub(HubApp(latency=0.05)) as host:
+            configuration = _configuration("http2", host=host)
+            configuration.http2_max_concurrent_streams = 2
+            api_client = ApiClient(configuration)
+            try:
+                api = DefaultApi(api_client)
+                with ThreadPoolExecutor(6) as pool:
+                    policies = list(pool.map(lambda _: api.get_policy(), range(6)))
+                metrics = api_client.rest_client.metrics.snapshot()
+            finally:
+                api_client.close()
+
+        self.assertEqual(len(policies), 6)
+        self.assertEqual(metrics["requests"], 6)
+        self.assertEqual(metrics["in_flight"], 0)
+        self.assertLessEqual(metrics["peak_in_flight"], 2)
+        self.assertGreater(metrics["queued"], 0)
+        self.assertEqual(sum(metrics["http_versions"].values()), 6)
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncHTTP2Transport(unittest.IsolatedAsyncioTestCase):
+
+    async def test_round_trip(self) -> None:
+        with serve_hub() as host:
+            configuration = _configuration(host=host)
+            configuration.async_transport = "http2"
+            async with AsyncApiClient(configuration) as api_client:
+                api = AsyncDefaultApi(api_client)
+                self.assertEqual((await api.get_policy()).org_slug, "acme")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import openapi_client.models
+from openapi_client import deserializer
+from openapi_client.api_response import ApiResponse
+from openapi_client.warmup import warm_up
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+PROBE = """
+import json
+import openapi_client.models as models
+from openapi_client.warmup import warm_up
+for name in models.__all__:
+    getattr(models, name)
+built = lambda: sorted(n for n in models.__all__ if getattr(models, n).__pydantic_complete__)
+before = built()
+warm_up(["GetPolicy200Response", models.SyncSecretsRequest])
+print(json.dumps([before, built()]))
+"""
+
+
+class TestWarmUp(unittest.TestCase):
+
+    def test_models_are_built_on_demand(self) -> None:
+        output = subprocess.check_output([sys.executable, "-c", PROBE], cwd=ROOT)
+        before, after = json.loads(output)
+        self.assertEqual(before, [])
+        self.assertEqual(after, ["GetPolicy200Response", "SyncSecretsRequest"])
+
+    def test_every_model_by_default(self) -> None:
+        timings = warm_up()
+        self.assertEqual(set(timings), set(openapi_client.models.__all__) | {"ApiResponse"})
+        for name in openapi_client.models.__all__:
+            self.assertTrue(getattr(openapi_client.models, name).__pydantic_complete__)
+        self.assertTrue(ApiResponse.__pydantic_complete__)
+        self.assertEqual(warm_up(["GetPolicy200Response"]).keys(), {"GetPolicy200Response"})
+
+    def test_response_types(self) -> None:
+        type_string = "Dict[str, List[ListOrganizations200ResponseOrganizationsInner]]"
+        timings = warm_up(models=(), response_types=[type_string])
+        self.assertEqual(list(timings), [type_string])
+        self.assertIn(type_string, deserializer._plans)
+
+    def test_unknown_models(self) -> None:
+        with self.assertRaises(AttributeError):
+            warm_up(["NoSuchModel"])
+        with self.assertRaises(TypeError):
+            warm_up([dict])
+
+
+if __name__ == '__main__':
+    unittest.main()